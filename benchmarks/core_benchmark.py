@@ -0,0 +1,218 @@
+"""
+Micro-benchmarks for the rules engine ('core/rules.py') and class 'Character' ('core/character_model.py'), based on
+'timeit' from the standard library.
+
+Each benchmark is a function returning the callable to be timed, so setup (i.e. rolling a valid character) isn't part of
+the measured time. The number of calls per measurement is determined automatically via 'timeit.Timer.autorange()', and
+the best and median time per call from 'REPEAT' measurements are reported in microseconds.
+Results can be stored as baseline, later runs compared against a baseline fail (exit code 1) if any benchmark is slower
+by more than the given threshold and by more than its measured noise, so benchmarks running in microseconds aren't
+flagged for scheduler noise. Noise is estimated per benchmark from the spread between median and best time in both runs
+(see 'get_noise()'), so it scales with the benchmark instead of hiding regressions of fast benchmarks.
+
+Usage from project root:
+    python -m benchmarks.core_benchmark [-k NAME ...] [-o results.json] [--save-baseline baseline.json]
+                                        [--baseline baseline.json] [--threshold 0.2]
+"""
+import sys
+import json
+import random
+import timeit
+import argparse
+import statistics
+from typing import Any, Callable
+
+import core.rules as rls
+import core.items.item_instances as item_inst
+from core.character_model import Character
+
+
+# Number of measurements per benchmark.
+REPEAT: int = 7
+# Seed for random number generator, so every run benchmarks the same characters.
+SEED: int = 1
+
+
+"""Setup helpers."""
+
+def get_valid_character() -> Character:
+    """Return character with rolled abilities that allow for at least one race/class combination. Race and class are
+    not set yet."""
+    character: Character = Character()
+
+    while True:
+        character.set_ability_dict()
+        if rls.check_valid_race_class(character):
+            return character
+
+
+def get_complete_character() -> Character:
+    """Return character with race, class and all character values set."""
+    character: Character = get_valid_character()
+    race, character_class = rls.build_possible_characters_list(character)[0].split()
+
+    character.set_race(race)
+    character.set_class(character_class)
+    character.set_character_values()
+    character.money = rls.roll_starting_money()
+    character.buy_item(item_inst.ALL_ITEMS_BY_NAME[next(iter(item_inst.ALL_ITEMS_BY_NAME))], 1)
+
+    return character
+
+
+"""Benchmarks. Each function returns the callable to be timed."""
+
+def bench_dice_roll() -> Callable:
+    """Roll 3d6."""
+    return lambda: rls.dice_roll(3, 6)
+
+
+def bench_get_ability_score() -> Callable:
+    """Roll single ability score with bonus/penalty."""
+    return rls.get_ability_score
+
+
+def bench_get_race_list() -> Callable:
+    """Get available races for rolled abilities."""
+    character: Character = get_valid_character()
+    return lambda: rls.get_race_list(character)
+
+
+def bench_get_class_list() -> Callable:
+    """Get available classes for rolled abilities."""
+    character: Character = get_valid_character()
+    return lambda: rls.get_class_list(character)
+
+
+def bench_build_possible_characters_list() -> Callable:
+    """Get all possible race/class combinations for rolled abilities."""
+    character: Character = get_valid_character()
+    return lambda: rls.build_possible_characters_list(character)
+
+
+def bench_set_character_values() -> Callable:
+    """Set all race/class dependent character values."""
+    character: Character = get_complete_character()
+    return character.set_character_values
+
+
+def bench_serialize() -> Callable:
+    """Serialize complete character."""
+    character: Character = get_complete_character()
+    return character.serialize
+
+
+def bench_deserialize() -> Callable:
+    """Deserialize complete character."""
+    # Round trip through JSON to get the same data as read from a save file.
+    data: dict[str, Any] = json.loads(json.dumps(get_complete_character().serialize()))
+    character: Character = Character()
+    return lambda: character.deserialize(data)
+
+
+def bench_get_item_by_name() -> Callable:
+    """Look up every item instance by name once."""
+    item_names: list[str] = list(item_inst.ALL_ITEMS_BY_NAME)
+    return lambda: [Character.get_item_by_name(name) for name in item_names]
+
+
+BENCHMARKS: dict[str, Callable[[], Callable]] = {
+    "dice_roll": bench_dice_roll,
+    "get_ability_score": bench_get_ability_score,
+    "get_race_list": bench_get_race_list,
+    "get_class_list": bench_get_class_list,
+    "build_possible_characters_list": bench_build_possible_characters_list,
+    "set_character_values": bench_set_character_values,
+    "serialize": bench_serialize,
+    "deserialize": bench_deserialize,
+    "get_item_by_name": bench_get_item_by_name,
+}
+
+
+"""Running and comparing benchmarks."""
+
+def run_benchmark(setup: Callable[[], Callable]) -> dict[str, float]:
+    """Time callable returned by 'setup' and return results.
+    ARGS:
+        setup: benchmark function from 'BENCHMARKS'.
+    RETURNS:
+        dict with number of calls per measurement and best/median time per call in microseconds.
+    """
+    random.seed(SEED)
+    timer: timeit.Timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    times: list[float] = [total / number * 1e6 for total in timer.repeat(repeat=REPEAT, number=number)]
+
+    return {"number": number, "best_us": round(min(times), 4), "median_us": round(statistics.median(times), 4)}
+
+
+def get_noise(values: dict[str, float]) -> float:
+    """Return noise estimate of a benchmark run as spread between median and best time per call.
+    ARGS:
+        values: benchmark results (see 'run_benchmark()').
+    RETURNS:
+        noise in microseconds.
+    """
+    return values["median_us"] - values["best_us"]
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Compare best times with baseline and return list of regressions. A benchmark only counts as regression if it is
+    slower by more than 'threshold' and by more than the larger noise estimate of both runs (see 'get_noise()').
+    ARGS:
+        results: dict with benchmark names as keys and results (see 'run_benchmark()') as values.
+        baseline: dict in the same format.
+        threshold: allowed relative slowdown, i.e. '0.2' for 20%.
+    RETURNS:
+        list of regression messages. Empty if there are none.
+    """
+    regressions: list[str] = []
+
+    for name, values in results.items():
+        if name in baseline:
+            new, old = values["best_us"], baseline[name]["best_us"]
+            noise: float = max(get_noise(values), get_noise(baseline[name]))
+            if new > old * (1 + threshold) and new - old > noise:
+                regressions.append(f"{name:<32} {old:.3f} us -> {new:.3f} us ({new / old - 1:+.0%})")
+
+    return regressions
+
+
+def main() -> None:
+    """Parse command line arguments, run benchmarks and compare with baseline."""
+    parser = argparse.ArgumentParser(description="Run micro-benchmarks for rules engine and character model.")
+    parser.add_argument("-k", nargs="+", choices=BENCHMARKS, help="run only selected benchmarks")
+    parser.add_argument("-o", "--output", help="write results to JSON file")
+    parser.add_argument("--baseline", help="compare results with baseline JSON file")
+    parser.add_argument("--save-baseline", help="write results to baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown (default 0.2)")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    print(f"{'benchmark':<32} {'calls':>9} {'best us':>11} {'median us':>11}")
+
+    for name in args.k or BENCHMARKS:
+        results[name] = run_benchmark(BENCHMARKS[name])
+        print(f"{name:<32} {results[name]['number']:>9} {results[name]['best_us']:>11.3f} "
+              f"{results[name]['median_us']:>11.3f}")
+
+    for file_path in (args.output, args.save_baseline):
+        if file_path:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions: list[str] = compare(results, json.load(f), args.threshold)
+
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%} and measured noise:")
+            for regression in regressions:
+                print(regression)
+            sys.exit(1)
+
+        print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
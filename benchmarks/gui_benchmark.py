@@ -0,0 +1,413 @@
+"""
+Automated GUI benchmark running the real state machine headlessly with scripted mouse input.
+
+For each screen size in 'Settings' (small/medium/large) a separate process runs the main loop frame by frame via
+'run_frame()' in 'main.py', using SDL's dummy video driver. Mouse position and button state are taken from the
+benchmark script instead of the actual mouse, clicks are posted as pygame events. The script 'BENCHMARK_SCRIPT' covers:
+    title screen, main menu, settings screen and credits
+    custom creation including spell and language selection (abilities are re-rolled until both screens are shown)
+    saving and loading the created character (save file in temporary directory)
+    random creation
+
+Frame times are taken from 'frame_metrics' (see 'core/metrics.py') and reported as percentiles per program state and
+screen size. Results can be stored as baseline, later runs compared against a baseline fail (exit code 1) if any
+percentile is slower by more than the given threshold.
+
+Usage from project root:
+    python -m benchmarks.gui_benchmark [--sizes small medium large] [-o results.json] [--save-baseline baseline.json]
+                                       [--baseline baseline.json] [--threshold 0.2] [--frame-rate 30] [--seed 1]
+"""
+import os
+import sys
+import json
+import random
+import argparse
+import tempfile
+import subprocess
+from typing import Any, Callable
+
+# Has to be set before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+
+
+# Reported frame time percentiles.
+PERCENTILES: tuple[int, ...] = (50, 90, 99)
+# Frames spent in expected state before scripted input is applied. Also determines number of samples per screen.
+IDLE_FRAMES: int = 15
+# Maximum frames to wait for a step's expected state before the run is aborted.
+MAX_WAIT_FRAMES: int = 3000
+# Maximum ability re-rolls when looking for a character with spell and language selection.
+MAX_REROLLS: int = 200
+# Frame time differences below this value (ms) are never reported as regression to avoid noise on very fast states.
+MIN_REGRESSION_MS: float = 1.0
+
+
+"""Scripted input."""
+
+class ScriptedMouse:
+    """Replace 'pygame.mouse.get_pos()' and 'pygame.mouse.get_pressed()' with scripted values."""
+
+    def __init__(self) -> None:
+        """Initialize mouse in top left corner with no button pressed and patch pygame mouse functions."""
+        self.pos: tuple[int, int] = (1, 1)
+        self.pressed: bool = False
+
+        pygame.mouse.get_pos = lambda: self.pos
+        pygame.mouse.get_pressed = lambda num_buttons=3: (self.pressed, False, False)[:num_buttons]
+
+    def click(self, pos: tuple[int, int]) -> None:
+        """Move mouse to 'pos' and post mouse button events.
+        ARGS:
+            pos: screen position.
+        """
+        self.pos = pos
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=pos))
+
+    def press(self, pos: tuple[int, int]) -> None:
+        """Move mouse to 'pos' and hold left button down for the next frame.
+        ARGS:
+            pos: screen position.
+        """
+        self.pos = pos
+        self.pressed = True
+
+    def key(self) -> None:
+        """Post key event for space bar."""
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE))
+
+
+class Step:
+    """Single step of a benchmark script."""
+
+    def __init__(self, state: str, action: Callable[[ScriptedMouse], None], repeat_while: Callable[[], bool] = None,
+                 ready: Callable[[], bool] = None) -> None:
+        """Initialize step.
+        ARGS:
+            state: program state in which the action is performed.
+            action: function taking the 'ScriptedMouse' instance to perform input.
+            repeat_while: optional condition. Action is repeated as long as it returns 'True' and the step is skipped once
+                it returns 'False'. Default is 'None'.
+            ready: optional condition that has to be 'True' before action is performed. Default is 'None'.
+        """
+        self.state: str = state
+        self.action: Callable[[ScriptedMouse], None] = action
+        self.repeat_while: Callable[[], bool] | None = repeat_while
+        self.ready: Callable[[], bool] | None = ready
+
+
+def click_button(key: str) -> Callable[[ScriptedMouse], None]:
+    """Return action clicking button 'key' from UI registry."""
+    return lambda mouse: mouse.click(get_registry()[key].button_rect.center)
+
+
+def click_object(getter: Callable[[], Any]) -> Callable[[ScriptedMouse], None]:
+    """Return action clicking the object returned by 'getter'. Works for buttons and interactive text."""
+    def action(mouse: ScriptedMouse) -> None:
+        screen_object = getter()
+        rect = screen_object.button_rect if hasattr(screen_object, "button_rect") else screen_object.interactive_rect
+        mouse.click(rect.center)
+
+    return action
+
+
+def get_registry() -> dict:
+    """Return UI registry. Imported here as it is only available after 'main' is imported in benchmark process."""
+    from gui.shared_data import ui_shared_data as uisd
+    return uisd.ui_registry
+
+
+def get_shared_data():
+    """Return shared data instance."""
+    from core.shared_data import shared_data
+    return shared_data
+
+
+def get_registry_flag(name: str) -> bool:
+    """Return flag attribute 'name' from UI shared data."""
+    from gui.shared_data import ui_shared_data as uisd
+    return getattr(uisd, name)
+
+
+def needs_reroll() -> bool:
+    """Check if rolled abilities allow for a magic-using class and additional languages, so the custom creation passes
+    through both spell and language selection."""
+    import core.rules as rls
+    sd = get_shared_data()
+
+    magic_classes = [character for character in rls.build_possible_characters_list(sd.character)
+                     if character.split()[1] in rls.CLASS_CATEGORIES["magic_classes"]]
+
+    return not (magic_classes and rls.set_language_flag(sd.character))
+
+
+def select_magic_option(kind: str) -> Callable[[], Any]:
+    """Return getter for race or class option of the first possible magic-using character."""
+    def getter() -> Any:
+        import core.rules as rls
+        sd = get_shared_data()
+
+        race, character_class = next(character.split() for character in sd.possible_characters
+                                     if character.split()[1] in rls.CLASS_CATEGORIES["magic_classes"])
+        options = get_registry()["active_races"] if kind == "race" else get_registry()["active_classes"]
+
+        return next(option for option in options if option.text == (race if kind == "race" else character_class))
+
+    return getter
+
+
+BENCHMARK_SCRIPT: tuple[Step, ...] = (
+    # Title, menus, settings and credits.
+    Step("title_screen", lambda mouse: mouse.key(), ready=lambda: get_registry()["title_screen_fields"][3].finished),
+    Step("main_menu", click_object(lambda: get_registry()["menu_buttons"][1])),
+    Step("settings_screen", click_button("back_button")),
+    Step("main_menu", click_object(lambda: get_registry()["menu_buttons"][2])),
+    Step("credits", lambda mouse: mouse.key()),
+    # Custom creation with spell and language selection.
+    Step("main_menu", click_button("start_button")),
+    Step("character_menu", click_button("custom")),
+    Step("show_abilities", click_button("reroll_button"), repeat_while=needs_reroll),
+    Step("show_abilities", click_button("continue_button")),
+    Step("race_class_selection", click_object(select_magic_option("race"))),
+    Step("race_class_selection", click_object(select_magic_option("class"))),
+    Step("race_class_selection", click_button("continue_button")),
+    Step("spell_selection", click_object(lambda: get_registry()["spell_fields"][0])),
+    Step("spell_selection", click_button("continue_button")),
+    Step("language_selection", click_object(lambda: get_registry()["lang_fields"][-1])),
+    Step("language_selection", click_button("continue_button")),
+    Step("name_character", click_button("continue_button")),
+    Step("select_starting_money",
+         lambda mouse: mouse.press(get_registry()["starting_money_choices"][0].button_rect.center)),
+    Step("select_starting_money", click_button("continue_button"), ready=lambda: get_registry_flag("dice_roll_complete")),
+    Step("confirm_character", click_object(lambda: get_registry()["confirm_character_buttons"][1])),
+    Step("creation_complete", click_button("show_character_sheet")),
+    # Save and load character.
+    Step("character_sheet", click_object(lambda: get_shared_data().cs_sheet.save_load_button)),
+    Step("save_load_screen", click_object(lambda: get_shared_data().save_load_screen.slots["slot_00"])),
+    Step("save_load_screen", click_object(lambda: get_shared_data().save_load_screen.save_button)),
+    Step("save_load_screen", click_object(lambda: get_shared_data().save_load_screen.slots["slot_00"])),
+    Step("save_load_screen", click_object(lambda: get_shared_data().save_load_screen.load_button)),
+    Step("character_sheet", click_object(lambda: get_shared_data().cs_sheet.main_menu_button)),
+    Step("main_menu", click_object(lambda: get_registry()["menu_buttons"][0])),
+    Step("save_load_screen", click_object(lambda: get_shared_data().save_load_screen.slots["slot_00"])),
+    Step("save_load_screen", click_object(lambda: get_shared_data().save_load_screen.load_button)),
+    Step("character_sheet", click_object(lambda: get_shared_data().cs_sheet.main_menu_button)),
+    # Random creation.
+    Step("main_menu", click_button("start_button")),
+    Step("character_menu", click_button("random")),
+    Step("name_random_character", click_button("continue_button")),
+    Step("creation_complete", click_button("show_character_sheet")),
+    Step("character_sheet", click_object(lambda: get_shared_data().cs_sheet.main_menu_button)),
+    Step("sheet_confirmation", click_object(lambda: get_shared_data().cs_sheet.exit_button)),
+    Step("main_menu", lambda mouse: None),
+)
+
+
+"""Benchmark run for a single screen size (separate process)."""
+
+def run_script(size_name: str, frame_rate: int | None, seed: int) -> dict[str, list[float]]:
+    """Run 'BENCHMARK_SCRIPT' at screen size 'size_name' and return frame times per program state.
+    ARGS:
+        size_name: "small", "medium" or "large" for corresponding 'Settings' attribute.
+        frame_rate: frame rate for the main loop or 'None' for 'settings.frame_rate'.
+        seed: seed for random number generator.
+    RETURNS:
+        dict with program states as keys and lists of frame times in ms as values.
+    """
+    random.seed(seed)
+    mouse: ScriptedMouse = ScriptedMouse()
+
+    import main
+    from core.settings import settings
+    from core.metrics import frame_metrics
+
+    temp_dir: str = tempfile.mkdtemp()
+    settings.save_file = os.path.join(temp_dir, "benchmark.sav")
+    # Settings file of the user isn't read, so runs always start with default settings. Window size is written to a
+    # temporary settings file instead, so window and UI registry (including asset preloading on the title screen) are
+    # built at the benchmarked size right away, as on a real start.
+    settings.settings_file = os.path.join(temp_dir, "settings.json")
+    with open(settings.settings_file, "w", encoding="utf-8") as f:
+        json.dump({"screen_size": getattr(settings, f"{size_name}_screen")}, f)
+    screen, clock = main.initialize_character_creator()
+
+    if frame_rate:
+        settings.frame_rate = frame_rate
+
+    frame_metrics.enable()
+    frame_times: dict[str, list[float]] = {}
+    state: str = main.INITIAL_STATE
+    step_index, idle_frames, waited_frames, rerolls = 0, 0, 0, 0
+
+    while step_index < len(BENCHMARK_SCRIPT):
+        step: Step = BENCHMARK_SCRIPT[step_index]
+        mouse.pressed = False
+
+        if state == step.state:
+            idle_frames += 1
+            if idle_frames >= IDLE_FRAMES and (not step.ready or step.ready()):
+                if step.repeat_while and not step.repeat_while():
+                    step_index += 1
+                elif step.repeat_while:
+                    rerolls += 1
+                    if rerolls > MAX_REROLLS:
+                        raise RuntimeError(f"No suitable abilities after {MAX_REROLLS} rolls.")
+                    step.action(mouse)
+                else:
+                    step.action(mouse)
+                    step_index += 1
+                idle_frames, waited_frames = 0, 0
+        else:
+            idle_frames = 0
+            waited_frames += 1
+            if waited_frames > MAX_WAIT_FRAMES:
+                raise RuntimeError(f"Step {step_index}: state '{step.state}' not reached, stuck in '{state}'.")
+
+        state = main.run_frame(screen, clock, state)
+        record: dict = frame_metrics.get_last_record()
+        frame_times.setdefault(record["state"], []).append(record["frame_ms"])
+
+    return frame_times
+
+
+"""Result handling."""
+
+def get_percentile(values: list[float], percentile: int) -> float:
+    """Return percentile of 'values' (nearest rank).
+    ARGS:
+        values: list of frame times.
+        percentile: percentile between 0 and 100.
+    RETURNS:
+        percentile value.
+    """
+    ordered: list[float] = sorted(values)
+    index: int = max(0, min(len(ordered) - 1, round(percentile / 100 * len(ordered)) - 1))
+
+    return ordered[index]
+
+
+def summarize(frame_times: dict[str, list[float]]) -> dict[str, dict[str, float]]:
+    """Return frame count and percentiles for each program state.
+    ARGS:
+        frame_times: dict as returned by 'run_script()'.
+    RETURNS:
+        dict with program states as keys and dicts with keys 'frames' and 'p<percentile>' as values.
+    """
+    summary: dict[str, dict[str, float]] = {}
+
+    for state, values in sorted(frame_times.items()):
+        summary[state] = {"frames": len(values)}
+        for percentile in PERCENTILES:
+            summary[state][f"p{percentile}"] = round(get_percentile(values, percentile), 3)
+
+    return summary
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Compare results with baseline and return list of regressions.
+    ARGS:
+        results: dict with screen sizes as keys and summaries (see 'summarize()') as values.
+        baseline: dict in the same format.
+        threshold: allowed relative slowdown, i.e. '0.2' for 20%.
+    RETURNS:
+        list of regression messages. Empty if there are none.
+    """
+    regressions: list[str] = []
+
+    for size_name, summary in results.items():
+        for state, values in summary.items():
+            base_values: dict | None = baseline.get(size_name, {}).get(state)
+            if not base_values:
+                continue
+
+            for percentile in PERCENTILES:
+                key: str = f"p{percentile}"
+                new, old = values[key], base_values[key]
+                if new > old * (1 + threshold) and new - old > MIN_REGRESSION_MS:
+                    regressions.append(f"{size_name:<7} {state:<30} {key}: {old:.2f} ms -> {new:.2f} ms")
+
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    """Print results as table.
+    ARGS:
+        results: dict with screen sizes as keys and summaries as values.
+    """
+    header: str = f"{'size':<7} {'state':<30} {'frames':>6}" + "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES)
+    print(header)
+    print("-" * len(header))
+
+    for size_name, summary in results.items():
+        for state, values in summary.items():
+            print(f"{size_name:<7} {state:<30} {values['frames']:>6}" +
+                  "".join(f"{values[f'p{p}']:>10.2f}" for p in PERCENTILES))
+
+
+def run_size_process(size_name: str, args: argparse.Namespace) -> dict:
+    """Run benchmark for one screen size in a new process and return its summary.
+    ARGS:
+        size_name: "small", "medium" or "large".
+        args: parsed command line arguments.
+    RETURNS:
+        summary dict (see 'summarize()').
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output: str = os.path.join(temp_dir, "result.json")
+        command: list[str] = [sys.executable, "-m", "benchmarks.gui_benchmark", "--run-size", size_name,
+                              "--seed", str(args.seed), "-o", output]
+        if args.frame_rate:
+            command += ["--frame-rate", str(args.frame_rate)]
+
+        subprocess.run(command, check=True)
+
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def main() -> None:
+    """Parse command line arguments, run benchmarks and compare with baseline."""
+    parser = argparse.ArgumentParser(description="Run scripted GUI benchmark.")
+    parser.add_argument("--sizes", nargs="+", choices=("small", "medium", "large"),
+                        default=["small", "medium", "large"], help="screen sizes from 'Settings'")
+    parser.add_argument("-o", "--output", help="write results to JSON file")
+    parser.add_argument("--baseline", help="compare results with baseline JSON file")
+    parser.add_argument("--save-baseline", help="write results to baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown (default 0.2)")
+    parser.add_argument("--frame-rate", type=int, help="frame rate for main loop (default 'settings.frame_rate')")
+    parser.add_argument("--seed", type=int, default=1, help="seed for random number generator")
+    parser.add_argument("--run-size", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_size:
+        # Benchmark process for single screen size, started from 'run_size_process()'.
+        summary: dict = summarize(run_script(args.run_size, args.frame_rate, args.seed))
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f)
+        return
+
+    results: dict = {size_name: run_size_process(size_name, args) for size_name in args.sizes}
+    print_results(results)
+
+    for file_path in (args.output, args.save_baseline):
+        if file_path:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions: list[str] = compare(results, json.load(f), args.threshold)
+
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+            for regression in regressions:
+                print(regression)
+            sys.exit(1)
+
+        print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Memory profiling for the UI registry (see 'gui/ui_registry.py') and its surfaces, run headlessly with SDL's dummy video
+driver.
+
+The report consists of three parts:
+    Surface bytes: pixel memory of all surfaces reachable from each UI registry key, including surfaces held by screen
+        objects (i.e. pre-rendered info panels and their background images). Surfaces shared by several keys are only
+        counted for the first one.
+    Python allocations: 'tracemalloc' comparison between first and last resize cycle, grouped by source line.
+        NOTE: pixel memory is allocated by SDL and not traced by 'tracemalloc', which is why surfaces are accounted
+        separately.
+    Leak check: window size is changed repeatedly via 'SettingsGUI.select_window_size()' as in the settings screen. All
+        objects of the initial UI registry should be released afterward. Objects still alive are reported by registry
+        key together with the attributes still referencing them. The registry cache is limited to the active registry
+        for the check, so registries aren't kept on purpose.
+
+Usage from project root:
+    python -m benchmarks.memory_profile [--cycles 5] [--top 10]
+Exit code is 1 if leaks are found.
+"""
+import os
+import gc
+import sys
+import weakref
+import argparse
+import tracemalloc
+import tempfile
+from typing import Any
+
+# Has to be set before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+
+# Window sizes from 'Settings' alternated in leak check. Last size equals the first, so memory should return to the
+# starting value.
+RESIZE_SEQUENCE: tuple[str, ...] = ("medium_screen", "small_screen")
+
+
+"""Surface accounting."""
+
+def get_surface_bytes(surface: pygame.Surface) -> int:
+    """Return size of pixel data of 'surface' in bytes."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def collect_objects(root: Any, visited: set[int], surfaces: list[pygame.Surface], objects: list[Any]) -> None:
+    """Walk 'root' recursively and collect all surfaces and screen object instances reachable from it.
+    ARGS:
+        root: object to walk, i.e. value from UI registry.
+        visited: IDs of objects already walked. Shared between calls so every object is only collected once.
+        surfaces: list to add found surfaces to.
+        objects: list to add found instances of classes from the project (screen objects, etc.) to.
+    """
+    if id(root) in visited or root is pygame.display.get_surface():
+        return
+    visited.add(id(root))
+
+    if isinstance(root, pygame.Surface):
+        surfaces.append(root)
+    elif isinstance(root, (list, tuple, set)):
+        for item in root:
+            collect_objects(item, visited, surfaces, objects)
+    elif isinstance(root, dict):
+        for item in root.values():
+            collect_objects(item, visited, surfaces, objects)
+    elif hasattr(root, "__dict__") and type(root).__module__.split(".")[0] in {"gui", "core", "pygame_textinput"}:
+        objects.append(root)
+        for item in vars(root).values():
+            collect_objects(item, visited, surfaces, objects)
+
+
+def get_registry_contents(registry: dict) -> dict[str, tuple[list[pygame.Surface], list[Any]]]:
+    """Return surfaces and screen objects reachable from each UI registry key.
+    ARGS:
+        registry: UI registry dict.
+    RETURNS:
+        dict with registry keys as keys and tuples of surface list and object list as values.
+    """
+    visited: set[int] = set()
+    contents: dict[str, tuple[list[pygame.Surface], list[Any]]] = {}
+
+    for key, value in registry.items():
+        surfaces, objects = [], []
+        collect_objects(value, visited, surfaces, objects)
+        contents[key] = (surfaces, objects)
+
+    return contents
+
+
+def print_surface_report(registry: dict, top: int) -> None:
+    """Print surface bytes per UI registry key, largest first.
+    ARGS:
+        registry: UI registry dict.
+        top: number of keys to print.
+    """
+    rows: list[tuple[str, int, int]] = []
+
+    for key, (surfaces, objects) in get_registry_contents(registry).items():
+        if surfaces:
+            rows.append((key, len(surfaces), sum(get_surface_bytes(surface) for surface in surfaces)))
+
+    rows.sort(key=lambda row: row[2], reverse=True)
+    total: int = sum(row[2] for row in rows)
+
+    print(f"\nSURFACE BYTES PER REGISTRY KEY (total {total / 2 ** 20:.1f} MiB, screen {pygame.display.get_surface().get_size()})")
+    print(f"{'key':<32} {'surfaces':>8} {'MiB':>8} {'share':>7}")
+    for key, count, size in rows[:top]:
+        print(f"{key:<32} {count:>8} {size / 2 ** 20:>8.2f} {size / total:>7.1%}")
+
+
+"""Leak check."""
+
+def get_weakrefs(registry: dict) -> dict[str, list[weakref.ref]]:
+    """Return weak references to all surfaces and screen objects reachable from each UI registry key.
+    ARGS:
+        registry: UI registry dict.
+    RETURNS:
+        dict with registry keys as keys and lists of weak references as values.
+    """
+    return {key: [weakref.ref(item) for item in surfaces + objects]
+            for key, (surfaces, objects) in get_registry_contents(registry).items()}
+
+
+def get_owners(obj: Any, ignored_ids: set[int]) -> set[str]:
+    """Return names of attributes referencing 'obj' directly or via a tuple/list, i.e. 'SettingsGUI.size_settings'.
+    ARGS:
+        obj: object kept alive.
+        ignored_ids: IDs of holders to ignore, i.e. objects that are kept alive themselves.
+    RETURNS:
+        set of 'ClassName.attribute' strings.
+    """
+    owners: set[str] = set()
+    containers: list[Any] = [obj] + [referrer for referrer in gc.get_referrers(obj) if isinstance(referrer, (tuple, list))]
+
+    for container in containers:
+        for referrer in gc.get_referrers(container):
+            # Instance attributes are referenced either via the instance's '__dict__' or directly by the instance.
+            if isinstance(referrer, dict):
+                holders: list[Any] = [holder for holder in gc.get_referrers(referrer)
+                                      if getattr(holder, "__dict__", None) is referrer]
+            elif hasattr(referrer, "__dict__") and not isinstance(referrer, type):
+                holders: list[Any] = [referrer]
+            else:
+                continue
+
+            for holder in holders:
+                if id(holder) in ignored_ids:
+                    continue
+                for attribute, value in vars(holder).items():
+                    if value is container:
+                        owners.add(f"{type(holder).__name__}.{attribute}")
+
+    return owners
+
+
+def resize_window(screen, settings_gui, size_attribute: str) -> None:
+    """Select window size on settings screen the same way a mouse click would.
+    ARGS:
+        screen: PyGame window.
+        settings_gui: instance of class 'SettingsGUI'.
+        size_attribute: name of screen size attribute in 'Settings', i.e. "medium_screen".
+    """
+    from core.settings import settings
+
+    settings_gui.format_settings_screen_elements(screen)
+    for button, size in settings_gui.size_settings:
+        if size == getattr(settings, size_attribute):
+            settings_gui.select_window_size(screen, button.interactive_rect.center)
+
+
+def check_resize_leaks(screen, cycles: int, top: int) -> bool:
+    """Change window size 'cycles' times back and forth and report objects of the initial UI registry that are still
+    alive afterward. Print 'tracemalloc' comparison between first and last cycle.
+    ARGS:
+        screen: PyGame window.
+        cycles: number of resize cycles.
+        top: number of lines to print for 'tracemalloc' comparison.
+    RETURNS:
+        'True' if leaks were found, else 'False'.
+    """
+    from core.settings import settings
+    from core.shared_data import shared_data as sd
+    from gui.shared_data import ui_shared_data as uisd
+    from gui.settings_gui import SettingsGUI
+
+    # Registries of previous window sizes are kept otherwise (see 'get_ui_registry()' in 'gui/ui_registry.py'), so every
+    # window size change builds a new registry and the initial one has to be released.
+    settings.ui_registry_cache_size = 1
+    sd.settings_gui = SettingsGUI(screen)
+    initial_refs: dict[str, list[weakref.ref]] = get_weakrefs(uisd.ui_registry)
+    initial_ids: set[int] = {id(ref()) for refs in initial_refs.values() for ref in refs}
+
+    tracemalloc.start()
+    first_snapshot: tracemalloc.Snapshot | None = None
+
+    for cycle in range(cycles):
+        for size_attribute in RESIZE_SEQUENCE:
+            resize_window(screen, sd.settings_gui, size_attribute)
+        gc.collect()
+        if not first_snapshot:
+            first_snapshot = tracemalloc.take_snapshot()
+
+    last_snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    print(f"\nPYTHON ALLOCATIONS: GROWTH BETWEEN FIRST AND LAST OF {cycles} RESIZE CYCLES")
+    for stat in last_snapshot.compare_to(first_snapshot, "lineno")[:top]:
+        print(stat)
+
+    # Objects reused by the current registry (i.e. shared images) aren't leaks.
+    current_ids: set[int] = {id(item) for surfaces, objects in get_registry_contents(uisd.ui_registry).values()
+                             for item in surfaces + objects}
+    leaks_found: bool = False
+
+    print(f"\nLEAK CHECK: OBJECTS FROM INITIAL UI REGISTRY STILL ALIVE AFTER {cycles} RESIZE CYCLES")
+    for key, refs in initial_refs.items():
+        alive: list[Any] = [ref() for ref in refs if ref() is not None and id(ref()) not in current_ids]
+        if not alive:
+            continue
+
+        leaks_found = True
+        alive_bytes: int = sum(get_surface_bytes(item) for item in alive if isinstance(item, pygame.Surface))
+        alive_ids: set[int] = {id(item) for item in alive}
+        owners: set[str] = set()
+        for item in alive:
+            owners |= get_owners(item, alive_ids)
+
+        print(f"{key:<32} {len(alive):>4} objects {alive_bytes / 2 ** 20:>8.2f} MiB  held by: "
+              f"{', '.join(sorted(owners)) or 'unknown'}")
+
+    if not leaks_found:
+        print(f"No leaks ({len(initial_ids)} objects released).")
+
+    return leaks_found
+
+
+def main() -> None:
+    """Parse command line arguments and run memory report."""
+    parser = argparse.ArgumentParser(description="Memory report for UI registry and leak check for window resizing.")
+    parser.add_argument("--cycles", type=int, default=5, help="number of resize cycles for leak check")
+    parser.add_argument("--top", type=int, default=15, help="number of lines per report section")
+    args = parser.parse_args()
+
+    import main as character_creator
+    from core.settings import settings
+    from gui.shared_data import ui_shared_data as uisd
+
+    # Settings file of the user is neither read nor overwritten by window size changes of the leak check.
+    settings.settings_file = os.path.join(tempfile.mkdtemp(), "settings.json")
+    screen, clock = character_creator.initialize_character_creator()
+    # Finish asset preloading, which otherwise runs while the title screen is shown (see 'gui/preload.py').
+    for _ in uisd.ui_registry["title_screen_fields"][3].source:
+        pass
+    print_surface_report(uisd.ui_registry, args.top)
+
+    if check_resize_leaks(screen, max(args.cycles, 1), args.top):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 # -*- mode: python -*-
 import os
+import sys
+import subprocess
+
+# Bake pre-scaled asset atlases for all supported window sizes into 'gui/art/atlas/', so they are bundled with 'gui/art'.
+subprocess.run([sys.executable, "-m", "gui.asset_atlas"], check=True)
 
 block_cipher = None
 
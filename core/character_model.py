@@ -2,6 +2,8 @@
 Class for character.
 """
 import random
+import json
+import hashlib
 from typing import Any
 
 from gui.screen_objects import InteractiveText
@@ -51,6 +53,14 @@ class Character:
         self.shield: object = item_inst.ARMORS["no_shield"]
         self.weapon: object = item_inst.WEAPONS["no_weapon"]
 
+        # Counter increased by 'mark_changed()' whenever character values change after creation. Used to invalidate
+        # the pre-drawn character sheet surface (see 'CharacterSheet' in 'gui/cs_model.py'). Not saved.
+        self.revision: int = 0
+
+    def mark_changed(self) -> None:
+        """Increase 'self.revision' to signal that character values have changed."""
+        self.revision += 1
+
     def set_race(self, race_selection: str) -> None:
         """Set race-specific values based on chosen race.
         ARGS:
@@ -86,6 +96,7 @@ class Character:
     def set_name(self, char_name: str) -> None:
         """Set name for character."""
         self.name = char_name
+        self.mark_changed()
 
         # Reset value for name input field to empty string.
         uisd.ui_registry["character_name_input"][0].manager.value = ""
@@ -269,6 +280,7 @@ class Character:
 
             for i in range(amount):
                 self.inventory.append(item)
+            self.mark_changed()
             return True
 
     def sell_item(self, item: object, amount: int) -> None:
@@ -282,6 +294,7 @@ class Character:
         self.money += item.cost * amount
         for i in range(amount):
             self.inventory.remove(item)
+        self.mark_changed()
 
 
     """Equip/unequip methods.""" # TODO works only for armor right now.
@@ -309,6 +322,7 @@ class Character:
 
         self.set_armor_class()
         self.set_movement_rate()
+        self.mark_changed()
 
     def unequip_item(self, item: object) -> None:
         """Unequip instance 'item' and move it to inventory. Set 'self.armor' and 'self.shield' to instances 'no_armor'
@@ -323,6 +337,7 @@ class Character:
             self.shield = item_inst.NO_SHIELD
         self.set_armor_class()
         self.set_movement_rate()
+        self.mark_changed()
 
     def modify_weight_carried(self, item: object, amount: int, add_remove: str) -> None:
         """Change 'self.weight_carried' by adding/subtracting 'item.weight', taking following race-specific modifiers
@@ -362,6 +377,7 @@ class Character:
                 by their name attributes.
         """
         data: dict[str, Any] = self.__dict__.copy()
+        del data["revision"]
 
         data["armor"] = self.armor.name
         data["shield"] = self.shield.name
@@ -387,6 +403,17 @@ class Character:
         if data["inventory"]:
             self.inventory = [self.get_item_by_name(item) for item in data["inventory"]]
 
+        self.mark_changed()
+
+    def content_hash(self) -> str:
+        """Return hash of the character's serialized values. Changes whenever any value shown on the character sheet
+        changes, so it can be used to check if screen objects built for the character are still up to date.
+        RETURNS:
+            hex digest string.
+        """
+        serialized: str = json.dumps(self.serialize(), sort_keys=True, default=str)
+        return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
     @staticmethod
     def get_item_by_name(item: str) -> object:
         """Retrieve an item instance by its name.
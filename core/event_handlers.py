@@ -1,14 +1,30 @@
 """
 Contains event handler functions.
+
+Pending events are drained once per frame in 'run_frame()' in 'main.py' via 'drain_events()'. State handlers in
+'state_manager.py' then call 'handle_events()', which routes each event through the dispatch table 'EVENT_DISPATCH' with
+tuples of program state and event type as keys. Lookup cost per event is the same no matter how many states exist, and
+events of types a state doesn't handle are skipped right away.
+
+Mouse clicks are resolved via hit regions registered per state in 'CLICK_REGIONS'. Each hit region is a tuple of a hit
+test and an action:
+    hit test: callable taking the mouse position and returning the element under it, or 'None'. Use 'button_hit()' and
+        'screen_button_hit()' for buttons and 'option_hit()' for options in hit-test grids (see 'gui/hit_test.py').
+    action: next program state, or callable taking 'screen', 'state', 'mouse_pos' and the clicked element and returning
+        the next program state.
+Only the first region hit is dispatched to.
 """
 import sys
+from typing import Any, Callable
 
 import pygame
 
 from gui.shared_data import ui_shared_data as uisd
+from gui.hit_test import get_element_at
 
 import core.rules as rls
 from .shared_data import shared_data as sd
+from .states import State
 
 """
                            SCREENS FLOW CHART:
@@ -41,9 +57,32 @@ from .shared_data import shared_data as sd
                              CHARACTER SHEET
 """
 
+# Events drained in the current frame, see 'drain_events()'.
+frame_events: list[pygame.event.Event] = []
+
+# Set of valid keys for numeric-only input in state 'custom_input_money'.
+MONEY_INPUT_KEYS: set[int] = {pygame.K_0, pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4,
+                              pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9,
+                              pygame.K_KP0, pygame.K_KP1, pygame.K_KP2, pygame.K_KP3, pygame.K_KP4,
+                              pygame.K_KP5, pygame.K_KP6, pygame.K_KP7, pygame.K_KP8, pygame.K_KP9,
+                              pygame.K_DELETE, pygame.K_BACKSPACE, pygame.K_LEFT, pygame.K_RIGHT}
+
+
+def drain_events() -> None:
+    """Get all pending pygame events once per frame and store them for 'handle_events()'. Quit program on 'QUIT' event
+    regardless of program state. Called at the start of every frame in 'run_frame()' in 'main.py'."""
+    frame_events[:] = pygame.event.get()
+
+    for event in frame_events:
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+
 
-def main_events(screen, state: str, mouse_pos) -> str:
-    """Check and handle main pygame events for 'run_character_creator()' in 'main.py'. Set and return 'state'.
+def handle_events(screen, state: State, mouse_pos) -> State:
+    """Handle events drained in this frame for program state 'state' and return new 'state'. Events are consumed, so
+    calling this function again in the same frame doesn't handle them twice. Events left after a handler returned a new
+    state or switched the UI registry are dropped. Only releases of the left mouse button are handled as clicks.
     ARGS:
         screen: PyGame window.
         state: program state.
@@ -51,445 +90,494 @@ def main_events(screen, state: str, mouse_pos) -> str:
     RETURNS:
         state
     """
-    # Standard button rects.
-    back_button = uisd.ui_registry["back_button"].button_rect
-    # Main menu button rects.
-    start_button = uisd.ui_registry["start_button"].button_rect
-    load_button = uisd.ui_registry["menu_buttons"][0].button_rect
-    settings_button = uisd.ui_registry["menu_buttons"][1].button_rect
-    credits_button = uisd.ui_registry["menu_buttons"][2].button_rect
-    quit_button = uisd.ui_registry["menu_buttons"][3].button_rect
-    # Character creation menu button rects.
-    custom_creation_button = uisd.ui_registry["custom"].button_rect
-    random_creation_button = uisd.ui_registry["random"].button_rect
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+    events: list[pygame.event.Event] = frame_events[:]
+    frame_events.clear()
+    start_state: State = state
+    ui_registry: dict = uisd.ui_registry
 
-        handle_screen_switch_reset(screen, event, mouse_pos)
+    if state in FRAME_HANDLERS:
+        FRAME_HANDLERS[state](events)
 
-        if state == "title_screen":
-            if (event.type in {pygame.KEYUP, pygame.MOUSEBUTTONUP} and screen.get_rect().collidepoint(mouse_pos) and
-                    uisd.ui_registry["title_screen_fields"][3].finished):
-                state = "pre_main_menu"
+    for event in events:
+        # Remaining events are dropped once a handler returned a new state, as its enter hooks and screen lifecycles only
+        # run afterward in 'change_state()' (see 'run_frame()' in 'main.py'). Same once a handler switched the UI
+        # registry (new window size or performance profile, see 'SettingsGUI.reinitialize_ui_registry()'), as they were
+        # drained for the previous layout.
+        if state != start_state or uisd.ui_registry is not ui_registry:
+            break
+        # Mouse wheel ticks and other buttons are reported as 'MOUSEBUTTONUP' events as well.
+        if event.type == pygame.MOUSEBUTTONUP and event.button != 1:
+            continue
+
+        handler: Callable | None = EVENT_DISPATCH.get((state, event.type))
+        if handler:
+            state = handler(screen, state, mouse_pos)
 
-        elif state == "main_menu":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if start_button.collidepoint(mouse_pos):
-                    state = "character_menu"
+    return state
 
-                if load_button.collidepoint(mouse_pos):
-                    uisd.load_only_flag = True
-                    state = "init_save_load_screen"
 
-                if settings_button.collidepoint(mouse_pos):
-                    state = "settings_screen"
+def handle_click(screen, state: State, mouse_pos) -> State:
+    """Dispatch mouse click to the first hit region in 'CLICK_REGIONS' for 'state' that is hit by 'mouse_pos'.
+    ARGS:
+        screen: PyGame window.
+        state: program state.
+        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
+    RETURNS:
+        state
+    """
+    for hit_test, action in CLICK_REGIONS[state]:
+        element: Any = hit_test(mouse_pos)
 
-                if credits_button.collidepoint(mouse_pos):
-                    state = "init_credits"
+        if element:
+            if isinstance(action, State):
+                return action
+            return action(screen, state, mouse_pos, element)
 
-                if quit_button.collidepoint(mouse_pos):
-                    pygame.quit()
-                    sys.exit()
+    return state
 
-        elif state == "settings_screen":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if back_button.collidepoint(mouse_pos):
-                    state = "main_menu"
 
-                # Window size selection logic.
-                for option in sd.settings_gui.size_buttons_list:
-                    if option.interactive_rect.collidepoint(mouse_pos):
-                        sd.settings_gui.select_window_size(screen, mouse_pos)
+"""Hit tests for hit regions."""
 
-        elif state == "credits":
-            if (event.type == pygame.KEYUP or event.type == pygame.MOUSEBUTTONUP) and screen.get_rect().collidepoint(mouse_pos):
-                state = "main_menu"
+def button_hit(key: str, index: int | None = None) -> Callable[[Any], Any]:
+    """Return hit test for button from 'ui_registry'. Button is looked up on every call as the UI registry is
+    re-initialized when the window size is changed.
+    ARGS:
+        key: key of button in 'ui_registry'.
+        index: index of button if registry entry is a tuple of buttons. Default is 'None'.
+    RETURNS:
+        hit test returning the button if it collides with mouse position, else 'None'.
+    """
+    def hit_test(mouse_pos) -> Any:
+        button = uisd.ui_registry[key] if index is None else uisd.ui_registry[key][index]
+        return button if button.button_rect.collidepoint(mouse_pos) else None
 
-        elif state == "character_menu":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if custom_creation_button.collidepoint(mouse_pos):
-                    state = "set_abilities"
+    return hit_test
 
-                if random_creation_button.collidepoint(mouse_pos):
-                    state = "random_character"
 
-                if back_button.collidepoint(mouse_pos):
-                    state = "main_menu"
+def screen_button_hit(screen_name: str, button_name: str) -> Callable[[Any], Any]:
+    """Return hit test for button of a screen instance in 'shared_data', i.e. 'sd.save_load_screen.save_button'.
+    ARGS:
+        screen_name: attribute name of screen instance in 'shared_data'.
+        button_name: attribute name of button in screen instance.
+    RETURNS:
+        hit test returning the button if it collides with mouse position, else 'None'.
+    """
+    def hit_test(mouse_pos) -> Any:
+        button = getattr(getattr(sd, screen_name), button_name)
+        return button if button.button_rect.collidepoint(mouse_pos) else None
 
-    return state
+    return hit_test
 
 
-def save_load_events(screen, state: str, mouse_pos) -> str:
-    """Check and handle events in function 'save_load_screen_state_manager()' in 'state_manager.py' and return 'state'.
+def option_hit(grid_key: str) -> Callable[[Any], Any]:
+    """Return hit test for options in a hit-test grid.
     ARGS:
-        screen: PyGame window.
-        state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
+        grid_key: name of grid in 'uisd.hit_test_grids' (see 'gui/hit_test.py').
     RETURNS:
-        state
+        hit test returning the option under the mouse, else 'None'.
     """
-    # Button rects.
-    save_button = sd.save_load_screen.save_button.button_rect
-    load_button = sd.save_load_screen.load_button.button_rect
-    delete_button = sd.save_load_screen.delete_button.button_rect
-    exit_button = sd.save_load_screen.exit_button.button_rect
-    confirm_proceed_button = sd.save_load_screen.confirm_proceed_button.button_rect
-    confirm_delete_button = sd.save_load_screen.confirm_delete_button.button_rect
-    confirm_overwrite_button = sd.save_load_screen.confirm_overwrite_button.button_rect
-    cancel_button = sd.save_load_screen.cancel_button.button_rect
-
-    confirm_states: set[str] = {"char_not_saved", "char_delete", "char_overwrite"}
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+    def hit_test(mouse_pos) -> Any:
+        return get_element_at(grid_key, mouse_pos)
 
-        handle_screen_switch_reset(screen, event, mouse_pos)
+    # Read when compiling 'OPTION_GRIDS'.
+    hit_test.grid_key = grid_key
 
-        if state == "save_load_screen":
-            if event.type == pygame.MOUSEBUTTONUP:
-                # Save/load slot selection logic.
-                for slot_id, slot in sd.save_load_screen.slots.items():
-                    if slot.interactive_rect.collidepoint(mouse_pos):
-                        sd.save_load_screen.select_character_slot(slot_id, slot)
+    return hit_test
 
-                if save_button.collidepoint(mouse_pos):
-                    state = sd.save_load_screen.save_character(state)
 
-                if load_button.collidepoint(mouse_pos):
-                    state = sd.save_load_screen.load_character()
+def anywhere_hit(mouse_pos) -> bool:
+    """Hit test for clicks anywhere on screen."""
+    return True
 
-                if delete_button.collidepoint(mouse_pos):
-                    state = sd.save_load_screen.delete_character(state)
 
-                if exit_button.collidepoint(mouse_pos):
-                    if uisd.load_only_flag:
-                        state = "pre_main_menu"
-                    else:
-                        state = "character_sheet"
+"""Main states."""
 
-        elif state in confirm_states:
-            if event.type == pygame.MOUSEBUTTONUP:
-                if cancel_button.collidepoint(mouse_pos):
-                    state = "init_save_load_screen"
+def leave_title_screen(screen, state: State, mouse_pos) -> State:
+    """Continue to main menu on key or mouse button once assets are loaded (see 'gui/preload.py')."""
+    if screen.get_rect().collidepoint(mouse_pos) and uisd.ui_registry["title_screen_fields"][3].finished:
+        return State.MAIN_MENU
 
-                if confirm_proceed_button.collidepoint(mouse_pos):
-                    # Set 'is_saved' to 'True' to allow for loading of saved character if current one isn't saved.
-                    sd.cs_sheet.is_saved = True
-                    state = sd.save_load_screen.load_character()
+    return state
 
-                if confirm_delete_button.collidepoint(mouse_pos):
-                    state = sd.save_load_screen.delete_character(state)
 
-                if confirm_overwrite_button.collidepoint(mouse_pos):
-                    state = sd.save_load_screen.save_character(state)
+def leave_credits(screen, state: State, mouse_pos) -> State:
+    """Return to main menu on key or mouse button."""
+    if screen.get_rect().collidepoint(mouse_pos):
+        return State.MAIN_MENU
 
     return state
 
 
-def custom_character_events(screen, state: str, mouse_pos) -> str:
-    """Check and handle events in function 'custom_character()' in 'state_manager.py' and return 'state'.
-    ARGS:
-        screen: PyGame window.
-        state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    # Button rects.
-    continue_button = uisd.ui_registry["continue_button"].button_rect
-    back_button = uisd.ui_registry["back_button"].button_rect
-    reroll_button = uisd.ui_registry["reroll_button"].button_rect
-    reset_button = uisd.ui_registry["reset_button"].button_rect
-    confirm_character_no_button = uisd.ui_registry["confirm_character_buttons"][0].button_rect
-    confirm_character_yes_button = uisd.ui_registry["confirm_character_buttons"][1].button_rect
-    show_sheet_button = uisd.ui_registry["show_character_sheet"].button_rect
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+def open_load_screen(screen, state: State, mouse_pos, element) -> State:
+    """Open save/load screen in "load-only" mode from main menu."""
+    uisd.load_only_flag = True
+    return State.SAVE_LOAD_SCREEN
+
 
-        handle_screen_switch_reset(screen, event, mouse_pos)
-
-        if state == "show_abilities":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if back_button.collidepoint(mouse_pos):
-                    state = "character_menu"
-
-                if reroll_button.collidepoint(mouse_pos):
-                    state = "set_abilities"
-
-                if continue_button.collidepoint(mouse_pos):
-                    sd.possible_characters = rls.build_possible_characters_list(sd.character)
-                    uisd.language_flag = rls.set_language_flag(sd.character)
-                    state = "race_class_selection"
-
-        elif state == "race_class_selection":
-            if event.type == pygame.MOUSEBUTTONUP:
-                # Race/class selection logic.
-                for option in uisd.ui_registry["active_races"] + uisd.ui_registry["active_classes"]:
-                    if option.interactive_rect.collidepoint(mouse_pos):
-                        sd.select_race_class(option)
-
-                if reset_button.collidepoint(mouse_pos):
-                    sd.clear_race_class_selection()
-
-                if back_button.collidepoint(mouse_pos):
-                    state = "show_abilities"
-
-                if sd.selected_race and sd.selected_class:
-                    if continue_button.collidepoint(mouse_pos):
-                        sd.character.set_race(sd.selected_race.text)
-                        sd.character.set_class(sd.selected_class.text)
-                        sd.character.set_character_values()
-                        if sd.character.class_name in rls.CLASS_CATEGORIES["magic_classes"]:
-                            state = "spell_selection"
-                        else:
-                            state = "language_selection"
-
-        elif state == "spell_selection":
-            if event.type == pygame.MOUSEBUTTONUP:
-                # Spell selection logic.
-                for option in uisd.ui_registry["spell_fields"]:
-                    if option.interactive_rect.collidepoint(mouse_pos):
-                        sd.select_spell(option)
-
-                if back_button.collidepoint(mouse_pos):
-                    state = "race_class_selection"
-
-                if continue_button.collidepoint(mouse_pos):
-                    sd.character.set_starting_spell(uisd.ui_registry["spell_fields"])
-                    state = "language_selection"
-
-        elif state == "language_selection":
-            if event.type == pygame.MOUSEBUTTONUP:
-                # Language selection logic.
-                for option in uisd.ui_registry["lang_fields"]:
-                    if option.interactive_rect.collidepoint(mouse_pos):
-                        sd.select_languages(option)
-
-                if reset_button.collidepoint(mouse_pos):
-                    sd.clear_language_selection()
-
-                if back_button.collidepoint(mouse_pos):
-                    sd.clear_language_selection()
-                    if sd.character.class_name in rls.CLASS_CATEGORIES["magic_classes"]:
-                        state = "spell_selection"
-                    else:
-                        state = "race_class_selection"
-
-                if continue_button.collidepoint(mouse_pos):
-                    sd.character.set_languages(uisd.ui_registry["lang_fields"])
-                    state = "name_character"
-
-        elif state == "select_starting_money":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if back_button.collidepoint(mouse_pos):
-                    state = "name_character"
-
-                if sd.random_money_flag and uisd.dice_roll_complete:
-                    if continue_button.collidepoint(mouse_pos):
-                        sd.character.money = sd.starting_money
-                        state = "confirm_character"
-
-                if sd.custom_money_flag:
-                    state = "custom_input_money"
-
-        elif state == "confirm_character":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if confirm_character_no_button.collidepoint(mouse_pos):
-                    state = "select_starting_money"
-
-                if confirm_character_yes_button.collidepoint(mouse_pos):
-                    state = "create_character_sheet"
-
-        elif state == "creation_complete":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if show_sheet_button.collidepoint(mouse_pos):
-                    uisd.reset_input_fields()
-                    state = "init_character_sheet"
+def quit_character_creator(screen, state: State, mouse_pos, element) -> State:
+    """Quit program."""
+    pygame.quit()
+    sys.exit()
 
+
+def select_window_size(screen, state: State, mouse_pos, element) -> State:
+    """Window size selection logic."""
+    sd.settings_gui.select_window_size(screen, mouse_pos)
     return state
 
 
-"""Event handlers for screens where pygame_textinput library is used so 'pygame.event.get()' can be split between pygame
-events and pygame_textinput events."""
+def select_performance_profile(screen, state: State, mouse_pos, element) -> State:
+    """Performance profile selection logic."""
+    sd.settings_gui.select_performance_profile(screen, element)
+    return state
 
-def naming_character_events(screen, state: str, mouse_pos) -> str:
-    """Check and handle text input field events in functions 'custom_character()' and 'random_character()' for each
-    naming character state.
-    ARGS:
-        screen: PyGame window.
-        state: program state. Entry and exit state differ based on custom or random character creation.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    # Button rects.
-    continue_button = uisd.ui_registry["continue_button"].button_rect
-    back_button = uisd.ui_registry["back_button"].button_rect
 
-    character_name_input = uisd.ui_registry["character_name_input"][0]
-    events = pygame.event.get()
-    character_name_input.update(events)
+"""Save/load screen states."""
 
-    for event in events:
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+def select_character_slot(screen, state: State, mouse_pos, element) -> State:
+    """Save/load slot selection logic."""
+    sd.save_load_screen.select_character_slot(sd.save_load_screen.slot_ids[element], element)
+    return state
+
+
+def save_character(screen, state: State, mouse_pos, element) -> State:
+    """Save character to selected slot."""
+    return sd.save_load_screen.save_character(state)
 
-        handle_screen_switch_reset(screen, event, mouse_pos)
-
-        if event.type == pygame.MOUSEBUTTONUP:
-            if back_button.collidepoint(mouse_pos):
-                sd.character.reset_character()
-                if state == "name_character":
-                    if uisd.language_flag:
-                        state = "language_selection"
-                    elif sd.character.class_name in rls.CLASS_CATEGORIES["magic_classes"]:
-                        state = "spell_selection"
-                    else:
-                        state = "race_class_selection"
-
-                elif state == "name_random_character":
-                    # Call method to reset shared data before returning to previous menu.
-                    # Not a pretty solution, but it resolves the freezing issue when coming back from the naming screen.
-                    sd.shared_data_janitor()
-                    state = "character_menu"
-
-            if continue_button.collidepoint(mouse_pos):
-                sd.character.set_name(character_name_input.manager.value)
-                if state == "name_character":
-                    state = "select_starting_money"
-                elif state == "name_random_character":
-                    state = "creation_complete"
 
+def load_character(screen, state: State, mouse_pos, element) -> State:
+    """Load character from selected slot."""
+    return sd.save_load_screen.load_character()
+
+
+def delete_character(screen, state: State, mouse_pos, element) -> State:
+    """Delete character in selected slot."""
+    return sd.save_load_screen.delete_character(state)
+
+
+def exit_save_load_screen(screen, state: State, mouse_pos, element) -> State:
+    """Return to main menu or character sheet, depending on where the save/load screen was opened from."""
+    if uisd.load_only_flag:
+        return State.MAIN_MENU
+
+    return State.CHARACTER_SHEET
+
+
+def confirm_load_character(screen, state: State, mouse_pos, element) -> State:
+    """Load character although the current one isn't saved."""
+    # Set 'is_saved' to 'True' to allow for loading of saved character if current one isn't saved.
+    sd.cs_sheet.is_saved = True
+    return sd.save_load_screen.load_character()
+
+
+"""Custom character creation states."""
+
+def continue_to_race_class_selection(screen, state: State, mouse_pos, element) -> State:
+    """Build possible race/class combinations for rolled abilities."""
+    sd.possible_characters = rls.build_possible_characters_list(sd.character)
+    uisd.language_flag = rls.set_language_flag(sd.character)
+    return State.RACE_CLASS_SELECTION
+
+
+def select_race_class(screen, state: State, mouse_pos, element) -> State:
+    """Race/class selection logic."""
+    sd.select_race_class(element)
     return state
 
 
-def custom_starting_money_events(screen, state: str, mouse_pos) -> str:
-    """Check and handle text input field events in function 'custom_character()' for state 'custom_input_money' in
-    'state_manager.py'.
-    ARGS:
-        screen: PyGame window.
-        state: program state. Entry and exit state differ based on custom or random character creation.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    # Button rects.
-    continue_button = uisd.ui_registry["continue_button"].button_rect
-    back_button = uisd.ui_registry["back_button"].button_rect
-    random_money_button = uisd.ui_registry["starting_money_choices"][0].button_rect
+def reset_race_class(screen, state: State, mouse_pos, element) -> State:
+    """Reset race/class selection."""
+    sd.clear_race_class_selection()
+    return state
 
-    starting_money_input = uisd.ui_registry["money_amount_input"][0]
 
-    # Set of valid keys for numeric-only input.
-    valid_keys: set = {pygame.K_0, pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4,
-                       pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9,
-                       pygame.K_KP0, pygame.K_KP1, pygame.K_KP2, pygame.K_KP3, pygame.K_KP4,
-                       pygame.K_KP5, pygame.K_KP6, pygame.K_KP7, pygame.K_KP8, pygame.K_KP9,
-                       pygame.K_DELETE, pygame.K_BACKSPACE, pygame.K_LEFT, pygame.K_RIGHT}
-    # List for filtered events to be passed to the input field.
-    filtered_keys: list = []
+def confirm_race_class(screen, state: State, mouse_pos, element) -> State:
+    """Set race and class once both are selected and continue with spell or language selection."""
+    if not (sd.selected_race and sd.selected_class):
+        return state
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+    sd.character.set_race(sd.selected_race.text)
+    sd.character.set_class(sd.selected_class.text)
+    sd.character.set_character_values()
+    if sd.character.class_name in rls.CLASS_CATEGORIES["magic_classes"]:
+        return State.SPELL_SELECTION
 
-        handle_screen_switch_reset(screen, event, mouse_pos)
+    return State.LANGUAGE_SELECTION
 
-        if event.type == pygame.KEYDOWN and event.key in valid_keys:
-            filtered_keys.append(event)
 
-        if event.type == pygame.MOUSEBUTTONUP:
-            if back_button.collidepoint(mouse_pos):
-                state = "name_character"
+def select_spell(screen, state: State, mouse_pos, element) -> State:
+    """Spell selection logic."""
+    sd.select_spell(element)
+    return state
 
-            if continue_button.collidepoint(mouse_pos):
-                if starting_money_input.manager.value:
-                    sd.character.money = int(starting_money_input.manager.value)
-                else:
-                    sd.character.money = 0
-                state = "confirm_character"
 
-            if random_money_button.collidepoint(mouse_pos):
-                starting_money_input.manager.value = ""
-                state = "select_starting_money"
+def confirm_spell(screen, state: State, mouse_pos, element) -> State:
+    """Set selected spell and continue with language selection."""
+    sd.character.set_starting_spell(uisd.ui_registry["spell_fields"])
+    return State.LANGUAGE_SELECTION
 
-    starting_money_input.update(filtered_keys)
 
+def select_language(screen, state: State, mouse_pos, element) -> State:
+    """Language selection logic."""
+    sd.select_languages(element)
     return state
 
 
-def cs_sheet_events(screen, state: str, mouse_pos) -> str:
-    """Check and handle events in function 'character_sheet_state_manager()' in 'state_manager.py' and return 'state'.
-    ARGS:
-        screen: PyGame window.
-        state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    # Button rects.
-    save_load_button = sd.cs_sheet.save_load_button.button_rect
-    main_menu_button = sd.cs_sheet.main_menu_button.button_rect
-    exit_button = sd.cs_sheet.exit_button.button_rect
-    cancel_button = sd.cs_sheet.cancel_button.button_rect
-    save_button = sd.cs_sheet.save_button.button_rect
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+def reset_languages(screen, state: State, mouse_pos, element) -> State:
+    """Reset language selection."""
+    sd.clear_language_selection()
+    return state
+
+
+def back_from_language_selection(screen, state: State, mouse_pos, element) -> State:
+    """Reset language selection and return to spell or race/class selection."""
+    sd.clear_language_selection()
+    if sd.character.class_name in rls.CLASS_CATEGORIES["magic_classes"]:
+        return State.SPELL_SELECTION
+
+    return State.RACE_CLASS_SELECTION
+
 
-        handle_screen_switch_reset(screen, event, mouse_pos)
+def confirm_languages(screen, state: State, mouse_pos, element) -> State:
+    """Set selected languages and continue with naming screen."""
+    sd.character.set_languages(uisd.ui_registry["lang_fields"])
+    return State.NAME_CHARACTER
 
-        if state == "character_sheet":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if save_load_button.collidepoint(mouse_pos):
-                    uisd.load_only_flag = False
-                    state = "init_save_load_screen"
 
-                if main_menu_button.collidepoint(mouse_pos):
-                    if sd.cs_sheet.is_saved:
-                        state = "pre_main_menu"
-                    else:
-                        state = "sheet_confirmation"
+def confirm_random_money(screen, state: State, mouse_pos, element) -> State:
+    """Set rolled starting money once the dice roll is complete."""
+    if sd.random_money_flag and uisd.dice_roll_complete:
+        sd.character.money = sd.starting_money
+        return State.CONFIRM_CHARACTER
 
-        if state == "sheet_confirmation":
-            if event.type == pygame.MOUSEBUTTONUP:
-                if exit_button.collidepoint(mouse_pos):
-                    state = "pre_main_menu"
+    return state
 
-                if cancel_button.collidepoint(mouse_pos):
-                    state = "character_sheet"
 
-                if save_button.collidepoint(mouse_pos):
-                    uisd.load_only_flag = False
-                    state = "init_save_load_screen"
+def check_custom_money(screen, state: State, mouse_pos, element) -> State:
+    """Switch to custom money input if chosen (see 'choose_money_option()' in 'gui/ui_helpers.py')."""
+    if sd.custom_money_flag:
+        return State.CUSTOM_INPUT_MONEY
 
     return state
 
 
-def handle_screen_switch_reset(screen, event, mouse_pos) -> None:
-    """Check for input events that switch screens, reset position flag for screen-specific UI placement, and reset alpha
-    values of certain UI elements. Called in every event handler 'for event in pygame.event.get()' loop.
+def show_character_sheet(screen, state: State, mouse_pos, element) -> State:
+    """Reset input fields and show character sheet of created character."""
+    uisd.reset_input_fields()
+    return State.CHARACTER_SHEET
+
+
+"""Naming and custom money input states, where pygame_textinput library is used so drained events are passed to the
+text input fields in addition to being dispatched."""
+
+def update_name_input(events: list[pygame.event.Event]) -> None:
+    """Pass events to character name input field.
     ARGS:
-        screen: PyGame window.
-        event: PyGame event from for-loop in event handler.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
+        events: events drained in this frame.
     """
-    # Check for any 'KEYUP' or 'MOUSEBUTTONUP' event. While this leads to the block being executed every time an event
-    # occurs, it trades this redundancy for overall maintainability.
-    if (event.type == pygame.KEYUP or event.type == pygame.MOUSEBUTTONUP) and screen.get_rect().collidepoint(mouse_pos):
-        uisd.reset_position_flag()
-        uisd.ui_registry["continue_button"].fade_alpha = 0
-        uisd.ui_registry["skip_button"].fade_alpha = 0
-        uisd.ui_registry["back_button"].fade_alpha = 0
+    uisd.ui_registry["character_name_input"][0].update(events)
+
+
+def update_money_input(events: list[pygame.event.Event]) -> None:
+    """Pass numeric key events to starting money input field.
+    ARGS:
+        events: events drained in this frame.
+    """
+    filtered_keys: list[pygame.event.Event] = [event for event in events
+                                               if event.type == pygame.KEYDOWN and event.key in MONEY_INPUT_KEYS]
+    uisd.ui_registry["money_amount_input"][0].update(filtered_keys)
+
+
+def back_from_naming(screen, state: State, mouse_pos, element) -> State:
+    """Reset character and return to previous screen of custom or random character creation."""
+    sd.character.reset_character()
+
+    if state == State.NAME_RANDOM_CHARACTER:
+        # Call method to reset shared data before returning to previous menu.
+        # Not a pretty solution, but it resolves the freezing issue when coming back from the naming screen.
+        sd.shared_data_janitor()
+        return State.CHARACTER_MENU
+
+    if uisd.language_flag:
+        return State.LANGUAGE_SELECTION
+    elif sd.character.class_name in rls.CLASS_CATEGORIES["magic_classes"]:
+        return State.SPELL_SELECTION
+
+    return State.RACE_CLASS_SELECTION
+
+
+def confirm_name(screen, state: State, mouse_pos, element) -> State:
+    """Set character name and continue with starting money (custom) or character completion (random)."""
+    sd.character.set_name(uisd.ui_registry["character_name_input"][0].manager.value)
+
+    if state == State.NAME_RANDOM_CHARACTER:
+        return State.CREATION_COMPLETE
+
+    return State.SELECT_STARTING_MONEY
+
+
+def confirm_custom_money(screen, state: State, mouse_pos, element) -> State:
+    """Set custom starting money from input field."""
+    starting_money_input = uisd.ui_registry["money_amount_input"][0]
+
+    if starting_money_input.manager.value:
+        sd.character.money = int(starting_money_input.manager.value)
+    else:
+        sd.character.money = 0
+
+    return State.CONFIRM_CHARACTER
+
+
+def switch_to_random_money(screen, state: State, mouse_pos, element) -> State:
+    """Clear input field and return to starting money selection."""
+    uisd.ui_registry["money_amount_input"][0].manager.value = ""
+    return State.SELECT_STARTING_MONEY
+
+
+"""Character sheet states."""
+
+def open_save_load_screen(screen, state: State, mouse_pos, element) -> State:
+    """Open save/load screen from character sheet."""
+    uisd.load_only_flag = False
+    return State.SAVE_LOAD_SCREEN
+
+
+def leave_character_sheet(screen, state: State, mouse_pos, element) -> State:
+    """Return to main menu, or ask for confirmation if character isn't saved."""
+    if sd.cs_sheet.is_saved:
+        return State.MAIN_MENU
+
+    return State.SHEET_CONFIRMATION
+
+
+"""Dispatch tables."""
+
+# Hit regions for mouse clicks per program state. See module docstring for details.
+CLICK_REGIONS: dict[State, tuple[tuple[Callable, State | Callable], ...]] = {
+    # Main states.
+    State.MAIN_MENU: (
+        (button_hit("start_button"), State.CHARACTER_MENU),
+        (button_hit("menu_buttons", 0), open_load_screen),
+        (button_hit("menu_buttons", 1), State.SETTINGS_SCREEN),
+        (button_hit("menu_buttons", 2), State.CREDITS),
+        (button_hit("menu_buttons", 3), quit_character_creator),
+    ),
+    State.SETTINGS_SCREEN: (
+        (button_hit("back_button"), State.MAIN_MENU),
+        (option_hit("window_sizes"), select_window_size),
+        (option_hit("performance_profiles"), select_performance_profile),
+    ),
+    State.CHARACTER_MENU: (
+        (button_hit("custom"), State.SET_ABILITIES),
+        (button_hit("random"), State.RANDOM_CHARACTER),
+        (button_hit("back_button"), State.MAIN_MENU),
+    ),
+
+    # Save/load screen states.
+    State.SAVE_LOAD_SCREEN: (
+        (option_hit("save_slots"), select_character_slot),
+        (screen_button_hit("save_load_screen", "save_button"), save_character),
+        (screen_button_hit("save_load_screen", "load_button"), load_character),
+        (screen_button_hit("save_load_screen", "delete_button"), delete_character),
+        (screen_button_hit("save_load_screen", "exit_button"), exit_save_load_screen),
+    ),
+    State.CHAR_NOT_SAVED: (
+        (screen_button_hit("save_load_screen", "cancel_button"), State.SAVE_LOAD_SCREEN),
+        (screen_button_hit("save_load_screen", "confirm_proceed_button"), confirm_load_character),
+    ),
+    State.CHAR_DELETE: (
+        (screen_button_hit("save_load_screen", "cancel_button"), State.SAVE_LOAD_SCREEN),
+        (screen_button_hit("save_load_screen", "confirm_delete_button"), delete_character),
+    ),
+    State.CHAR_OVERWRITE: (
+        (screen_button_hit("save_load_screen", "cancel_button"), State.SAVE_LOAD_SCREEN),
+        (screen_button_hit("save_load_screen", "confirm_overwrite_button"), save_character),
+    ),
+
+    # Custom character creation states.
+    State.SHOW_ABILITIES: (
+        (button_hit("back_button"), State.CHARACTER_MENU),
+        (button_hit("reroll_button"), State.SET_ABILITIES),
+        (button_hit("continue_button"), continue_to_race_class_selection),
+    ),
+    State.RACE_CLASS_SELECTION: (
+        (option_hit("race_class_options"), select_race_class),
+        (button_hit("reset_button"), reset_race_class),
+        (button_hit("back_button"), State.SHOW_ABILITIES),
+        (button_hit("continue_button"), confirm_race_class),
+    ),
+    State.SPELL_SELECTION: (
+        (option_hit("spell_fields"), select_spell),
+        (button_hit("back_button"), State.RACE_CLASS_SELECTION),
+        (button_hit("continue_button"), confirm_spell),
+    ),
+    State.LANGUAGE_SELECTION: (
+        (option_hit("lang_fields"), select_language),
+        (button_hit("reset_button"), reset_languages),
+        (button_hit("back_button"), back_from_language_selection),
+        (button_hit("continue_button"), confirm_languages),
+    ),
+    State.SELECT_STARTING_MONEY: (
+        (button_hit("back_button"), State.NAME_CHARACTER),
+        (button_hit("continue_button"), confirm_random_money),
+        # Money option itself is chosen while mouse button is pressed, see 'choose_money_option()'.
+        (anywhere_hit, check_custom_money),
+    ),
+    State.CONFIRM_CHARACTER: (
+        (button_hit("confirm_character_buttons", 0), State.SELECT_STARTING_MONEY),
+        (button_hit("confirm_character_buttons", 1), State.CREATE_CHARACTER_SHEET),
+    ),
+    State.CREATION_COMPLETE: (
+        (button_hit("show_character_sheet"), show_character_sheet),
+    ),
+
+    # Text input states.
+    State.NAME_CHARACTER: (
+        (button_hit("back_button"), back_from_naming),
+        (button_hit("continue_button"), confirm_name),
+    ),
+    State.NAME_RANDOM_CHARACTER: (
+        (button_hit("back_button"), back_from_naming),
+        (button_hit("continue_button"), confirm_name),
+    ),
+    State.CUSTOM_INPUT_MONEY: (
+        (button_hit("back_button"), State.NAME_CHARACTER),
+        (button_hit("continue_button"), confirm_custom_money),
+        (button_hit("starting_money_choices", 0), switch_to_random_money),
+    ),
+
+    # Character sheet states.
+    State.CHARACTER_SHEET: (
+        (screen_button_hit("cs_sheet", "save_load_button"), open_save_load_screen),
+        (screen_button_hit("cs_sheet", "main_menu_button"), leave_character_sheet),
+    ),
+    State.SHEET_CONFIRMATION: (
+        (screen_button_hit("cs_sheet", "exit_button"), State.MAIN_MENU),
+        (screen_button_hit("cs_sheet", "cancel_button"), State.CHARACTER_SHEET),
+        (screen_button_hit("cs_sheet", "save_button"), open_save_load_screen),
+    ),
+}
+
+# Hit-test grids per program state, compiled once at import from 'option_hit()' regions in 'CLICK_REGIONS'. Used to
+# resolve the hovered option once per frame (see 'update_hovered_element()' in 'gui/hit_test.py').
+OPTION_GRIDS: dict[State, tuple[str, ...]] = {
+    state: tuple(hit_test.grid_key for hit_test, _ in regions if hasattr(hit_test, "grid_key"))
+    for state, regions in CLICK_REGIONS.items()
+}
+
+# Handlers called once per frame with all drained events, before events are dispatched.
+FRAME_HANDLERS: dict[State, Callable[[list[pygame.event.Event]], None]] = {
+    State.NAME_CHARACTER: update_name_input,
+    State.NAME_RANDOM_CHARACTER: update_name_input,
+    State.CUSTOM_INPUT_MONEY: update_money_input,
+}
+
+# Dispatch table with tuples of program state and event type as keys and handlers as values. Compiled once at import from
+# 'CLICK_REGIONS' and handlers for events not tied to hit regions.
+EVENT_DISPATCH: dict[tuple[State, int], Callable[[Any, State, Any], State]] = {
+    **{(state, pygame.MOUSEBUTTONUP): handle_click for state in CLICK_REGIONS},
+    (State.TITLE_SCREEN, pygame.KEYUP): leave_title_screen,
+    (State.TITLE_SCREEN, pygame.MOUSEBUTTONUP): leave_title_screen,
+    (State.CREDITS, pygame.KEYUP): leave_credits,
+    (State.CREDITS, pygame.MOUSEBUTTONUP): leave_credits,
+}
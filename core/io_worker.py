@@ -0,0 +1,113 @@
+"""
+Background worker thread for file I/O, so slow disks don't stall the pygame window.
+Only instance of class 'IOWorker', 'io_worker', is created at the bottom of this module and imported/referenced where
+file operations are started (see 'SaveLoadScreen' in 'gui/sl_model.py').
+
+Jobs are submitted with 'io_worker.submit()' and executed one after another on the worker thread. Finished jobs are put
+into a completion queue which is polled once per frame by the state machine via 'io_worker.poll()' (see
+'save_load_screen_state_manager()' in 'core/state_manager.py'). Results are only ever applied on the main thread. Jobs
+submitted with 'polled=False' skip the completion queue, their owner checks 'job.done' instead (see 'preload_assets()' in
+'gui/preload.py'), so finished jobs and their results aren't kept alive until the queue is polled.
+NOTE: Job functions must not touch any pygame objects or shared data instances, apart from creating new surfaces that
+aren't used before the job is done (see 'preload_assets()' in 'gui/preload.py'). They receive a 'progress' keyword
+argument and can call it with '(done, total)' to report their progress.
+"""
+import queue
+import threading
+from typing import Any, Callable
+
+
+class IOJob:
+    """Represent a single file I/O job and its outcome."""
+
+    def __init__(self, name: str, func: Callable, *args: Any, polled: bool = True) -> None:
+        """Initialize I/O job.
+        ARGS:
+            name: descriptive name of the job, i.e. "save_character". Used to identify job when it is completed.
+            func: function to run on the worker thread. Has to accept keyword argument 'progress'.
+            args: positional arguments for 'func'.
+            polled: put job into completion queue when finished. Default is 'True'.
+        """
+        self.name: str = name
+        self.func: Callable = func
+        self.args: tuple[Any, ...] = args
+        self.polled: bool = polled
+
+        # Progress as '(done, total)' tuple. Updated from the worker thread via 'set_progress()'.
+        self.progress: tuple[int, int] = (0, 1)
+        self.done: bool = False
+        self.result: Any = None
+        self.error: Exception | None = None
+
+    def set_progress(self, done: int, total: int) -> None:
+        """Update progress of job. Called from job function on the worker thread.
+        ARGS:
+            done: amount of work done.
+            total: total amount of work.
+        """
+        self.progress = (done, max(total, 1))
+
+    def run(self) -> None:
+        """Run job function and store its result or raised exception."""
+        try:
+            self.result = self.func(*self.args, progress=self.set_progress)
+        except Exception as e:
+            self.error = e
+
+        self.progress = (self.progress[1], self.progress[1])
+        self.done = True
+
+
+class IOWorker:
+    """Class to run file I/O jobs on a background thread."""
+
+    def __init__(self) -> None:
+        """Initialize job queue and completion queue. Worker thread is started with the first submitted job."""
+        self.jobs: queue.Queue[IOJob] = queue.Queue()
+        self.completed: queue.Queue[IOJob] = queue.Queue()
+        self.thread: threading.Thread | None = None
+
+    def submit(self, name: str, func: Callable, *args: Any, polled: bool = True) -> IOJob:
+        """Queue new job for the worker thread and return it.
+        ARGS:
+            name: descriptive name of the job.
+            func: function to run on the worker thread. Has to accept keyword argument 'progress'.
+            args: positional arguments for 'func'.
+            polled: put job into completion queue when finished, to be returned by 'poll()'. Jobs checked via 'job.done'
+                by their owner skip the queue with 'False'. Default is 'True'.
+        RETURNS:
+            job: 'IOJob' instance that can be used to check progress while job is running.
+        """
+        if not self.thread:
+            # Daemon thread so a pending job never keeps the program from closing.
+            self.thread = threading.Thread(target=self.work, name="io_worker", daemon=True)
+            self.thread.start()
+
+        job: IOJob = IOJob(name, func, *args, polled=polled)
+        self.jobs.put(job)
+
+        return job
+
+    def work(self) -> None:
+        """Worker thread loop. Run queued jobs in order and put polled jobs into completion queue when finished."""
+        while True:
+            job: IOJob = self.jobs.get()
+            job.run()
+            if job.polled:
+                self.completed.put(job)
+
+    def poll(self) -> list[IOJob]:
+        """Return all jobs finished since last call without blocking. Called once per frame from the main thread.
+        RETURNS:
+            List of finished 'IOJob' instances.
+        """
+        finished_jobs: list[IOJob] = []
+
+        while True:
+            try:
+                finished_jobs.append(self.completed.get_nowait())
+            except queue.Empty:
+                return finished_jobs
+
+
+io_worker: IOWorker = IOWorker()
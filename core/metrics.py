@@ -0,0 +1,175 @@
+"""
+Frame time instrumentation for finding screens that miss the frame rate budget.
+Only instance of class 'FrameMetrics', 'frame_metrics', is created at the bottom of this module and used in
+'run_character_creator()' in 'main.py' and the debug overlay in 'gui/debug_overlay.py'.
+
+While enabled, a record is stored for every frame in a ring buffer holding the last 'settings.metrics_buffer_size'
+frames. Each record holds the program state, the state manager that handled it, frame time, state manager time and the
+number of blits, image scalings and font renders during the frame. The buffer can be written to a CSV file via
+'dump_csv()'.
+Calls are counted using 'sys.monitoring' (Python 3.12+). Call sites that never call one of the counted functions
+disable themselves after their first call, so counting adds next to no overhead, and none at all while disabled.
+"""
+import sys
+import csv
+import time
+from collections import deque
+from typing import Any, Callable
+
+import pygame
+
+from .settings import settings
+
+
+# Columns of frame records in order. Used as header for CSV files.
+FIELDS: tuple[str, ...] = ("frame", "state", "state_manager", "frame_ms", "state_manager_ms", "blits", "scales",
+                           "renders")
+
+# Counted pygame functions with name of their counter in frame records.
+COUNTED_CALLS: dict[Callable, str] = {
+    pygame.Surface.blit: "blits",
+    pygame.transform.scale: "scales",
+    pygame.transform.smoothscale: "scales",
+    pygame.font.Font.render: "renders",
+}
+
+# Tool ID for 'sys.monitoring'. IDs 0-2 and 5 are reserved for debuggers, coverage tools, profilers (i.e. 'cProfile' used
+# in 'core/profiling.py') and optimizers, 3 and 4 are free.
+MONITORING_TOOL_ID: int = 4
+MONITORING_TOOL_NAME: str = "frame_metrics"
+
+
+class FrameMetrics:
+    """Collect per-frame timing and draw call counts."""
+
+    def __init__(self) -> None:
+        """Initialize ring buffer and counters. Collection starts with 'enable()'."""
+        self.enabled: bool = False
+        self.records: deque[dict[str, Any]] = deque(maxlen=settings.metrics_buffer_size)
+
+        self.frame: int = 0
+        self.frame_start: float = 0
+        self.state: str = ""
+        self.state_manager: str = ""
+        self.state_manager_start: float = 0
+        self.state_manager_ms: float = 0
+        self.counts: dict[str, int] = {"blits": 0, "scales": 0, "renders": 0}
+
+    def enable(self) -> None:
+        """Start collecting frame records and counting calls. Does nothing if the tool ID is used by another tool."""
+        if self.enabled:
+            return
+
+        tool: str | None = sys.monitoring.get_tool(MONITORING_TOOL_ID)
+        if tool is not None and tool != MONITORING_TOOL_NAME:
+            print(f"Frame metrics not enabled, monitoring tool ID {MONITORING_TOOL_ID} is used by '{tool}'.")
+            return
+
+        if tool is None:
+            sys.monitoring.use_tool_id(MONITORING_TOOL_ID, MONITORING_TOOL_NAME)
+        sys.monitoring.register_callback(MONITORING_TOOL_ID, sys.monitoring.events.CALL, self.count_call)
+        sys.monitoring.set_events(MONITORING_TOOL_ID, sys.monitoring.events.CALL)
+        # Re-enable call sites disabled in 'count_call()' in case code changed since last time.
+        sys.monitoring.restart_events()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop collecting frame records and counting calls, and release the monitoring tool ID. Collected records are
+        kept."""
+        if not self.enabled:
+            return
+
+        sys.monitoring.set_events(MONITORING_TOOL_ID, 0)
+        sys.monitoring.register_callback(MONITORING_TOOL_ID, sys.monitoring.events.CALL, None)
+        sys.monitoring.free_tool_id(MONITORING_TOOL_ID)
+        self.enabled = False
+
+    def toggle(self) -> None:
+        """Switch between enabled and disabled."""
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def count_call(self, code, instruction_offset: int, func: Callable, arg0: Any) -> Any:
+        """Callback for 'sys.monitoring' CALL events. Count calls of functions in 'COUNTED_CALLS' and disable events
+        for all other call sites.
+        ARGS:
+            code: code object of calling function.
+            instruction_offset: offset of call instruction.
+            func: called object.
+            arg0: first argument of call.
+        RETURNS:
+            'sys.monitoring.DISABLE' for call sites that are not counted, else 'None'.
+        """
+        # Called objects can be unhashable (i.e. instances of classes with '__eq__' but without '__hash__').
+        try:
+            counter: str | None = COUNTED_CALLS.get(func)
+        except TypeError:
+            counter = None
+
+        if not counter:
+            return sys.monitoring.DISABLE
+
+        self.counts[counter] += 1
+
+    def start_frame(self, state: str) -> None:
+        """Reset counters and start frame timer.
+        ARGS:
+            state: program state at start of frame.
+        """
+        self.frame += 1
+        self.state = state
+        self.state_manager = ""
+        self.state_manager_ms = 0
+        for counter in self.counts:
+            self.counts[counter] = 0
+
+        self.frame_start = time.perf_counter()
+
+    def start_state_manager(self, state_manager: str) -> None:
+        """Start state manager timer.
+        ARGS:
+            state_manager: name of state manager function handling the current frame.
+        """
+        self.state_manager = state_manager
+        self.state_manager_start = time.perf_counter()
+
+    def end_state_manager(self) -> None:
+        """Stop state manager timer."""
+        self.state_manager_ms = (time.perf_counter() - self.state_manager_start) * 1000
+
+    def end_frame(self) -> None:
+        """Stop frame timer and add record for the frame to ring buffer."""
+        frame_ms: float = (time.perf_counter() - self.frame_start) * 1000
+
+        self.records.append({
+            "frame": self.frame,
+            "state": self.state,
+            "state_manager": self.state_manager,
+            "frame_ms": round(frame_ms, 3),
+            "state_manager_ms": round(self.state_manager_ms, 3),
+            **self.counts,
+        })
+
+    def get_last_record(self) -> dict[str, Any] | None:
+        """Return record of the last finished frame.
+        RETURNS:
+            frame record dict or 'None' if no frame has been recorded yet.
+        """
+        return self.records[-1] if self.records else None
+
+    def dump_csv(self, file_path: str) -> None:
+        """Write all records in ring buffer to CSV file.
+        ARGS:
+            file_path: path to CSV file.
+        """
+        with open(file_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(self.records)
+
+        print(f"\n\t{len(self.records)} frame records written to '{file_path}'.")
+
+
+frame_metrics: FrameMetrics = FrameMetrics()
@@ -0,0 +1,129 @@
+"""
+Per-state profiling with 'cProfile'.
+Only instance of class 'StateProfiler', 'state_profiler', is created at the bottom of this module and used in
+'run_frame()' in 'main.py'.
+
+Program states can be marked to have their next N frames captured, either via 'Settings' attribute
+'settings.profile_states' or environment variable 'CHARACTER_CREATOR_PROFILE' with comma separated 'state:frames' pairs
+(frames default to 'DEFAULT_FRAMES' if omitted):
+
+    CHARACTER_CREATOR_PROFILE="character_sheet:120,race_class_selection,save_load_screen:30" python main.py
+
+Each capture is written to directory 'settings.profile_dir' as '<state>_<width>x<height>.pstats' once all frames are
+captured, or when the program is closed. Files can be viewed with 'pstats' or tools like 'snakeviz'.
+If no state is marked, 'state_profiler.enabled' is 'False' and 'run_frame()' skips the profiler entirely.
+Frames aren't captured while frame metrics are collected (debug overlay, see 'core/metrics.py'), as their call counting
+would show up in the capture. Toggle the overlay off with F3 to continue capturing.
+"""
+import os
+import atexit
+import cProfile
+
+from .settings import settings
+from .metrics import frame_metrics
+
+
+# Environment variable for marking states to be profiled.
+PROFILE_ENV_VAR: str = "CHARACTER_CREATOR_PROFILE"
+# Number of captured frames for states marked without frame count.
+DEFAULT_FRAMES: int = 60
+
+
+class StateProfiler:
+    """Capture frames of marked program states with 'cProfile'."""
+
+    def __init__(self) -> None:
+        """Initialize profiler without any marked states. See 'configure()'."""
+        self.enabled: bool = False
+        # Remaining frames to capture for each marked state.
+        self.remaining_frames: dict[str, int] = {}
+        self.profiles: dict[str, cProfile.Profile] = {}
+        # State of the frame currently being captured.
+        self.active_state: str | None = None
+        # 'True' once the message for frames skipped due to frame metrics is printed, so it is only printed once.
+        self.skip_reported: bool = False
+        self.screen_size: tuple[int, int] = (0, 0)
+
+    def configure(self) -> None:
+        """Mark states from 'settings.profile_states' and environment variable 'PROFILE_ENV_VAR' for profiling."""
+        self.remaining_frames.update(settings.profile_states)
+
+        for entry in os.environ.get(PROFILE_ENV_VAR, "").split(","):
+            if entry.strip():
+                state, _, frames = entry.strip().partition(":")
+                try:
+                    self.remaining_frames[state] = int(frames) if frames else DEFAULT_FRAMES
+                except ValueError:
+                    print(f"Invalid frame count in '{PROFILE_ENV_VAR}' entry '{entry.strip()}'. Entry skipped.")
+
+        self.enabled = any(self.remaining_frames.values())
+
+        if self.enabled:
+            # Write unfinished captures when program is closed.
+            atexit.register(self.dump_all)
+
+    def start_frame(self, state: str) -> None:
+        """Start capturing frame if 'state' is marked and has frames left.
+        ARGS:
+            state: program state at start of frame.
+        """
+        if self.remaining_frames.get(state, 0) > 0:
+            if frame_metrics.enabled:
+                if not self.skip_reported:
+                    print(f"\n\tProfiling of state '{state}' paused while frame metrics are enabled (F3).")
+                    self.skip_reported = True
+                return
+
+            if state not in self.profiles:
+                self.profiles[state] = cProfile.Profile()
+
+            try:
+                self.profiles[state].enable()
+            except ValueError as e:
+                # Another profiler is already active, i.e. when the program itself is run with 'cProfile'.
+                print(f"\n\tProfiling of state '{state}' skipped ({e}).")
+                self.profiles.pop(state)
+                self.remaining_frames[state] = 0
+                self.enabled = any(self.remaining_frames.values())
+                return
+
+            self.skip_reported = False
+            self.active_state = state
+
+    def end_frame(self, screen) -> None:
+        """Stop capturing frame and write capture to file if all frames for its state are captured.
+        ARGS:
+            screen: PyGame window. Used for screen size in file name.
+        """
+        if not self.active_state:
+            return
+
+        state: str = self.active_state
+        self.profiles[state].disable()
+        self.active_state = None
+        self.screen_size = screen.get_size()
+        self.remaining_frames[state] -= 1
+
+        if self.remaining_frames[state] == 0:
+            self.dump(state)
+            self.enabled = any(self.remaining_frames.values())
+
+    def dump(self, state: str) -> None:
+        """Write capture for 'state' to '.pstats' file.
+        ARGS:
+            state: profiled program state.
+        """
+        os.makedirs(settings.profile_dir, exist_ok=True)
+        width, height = self.screen_size
+        file_path: str = os.path.join(settings.profile_dir, f"{state}_{width}x{height}.pstats")
+
+        self.profiles.pop(state).dump_stats(file_path)
+        print(f"\n\tProfile for state '{state}' written to '{file_path}'.")
+
+    def dump_all(self) -> None:
+        """Write all unfinished captures to file."""
+        for state in list(self.profiles):
+            self.dump(state)
+
+
+state_profiler: StateProfiler = StateProfiler()
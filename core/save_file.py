@@ -0,0 +1,253 @@
+"""
+Functions to read and write the save file used by the save/load screen (see 'SaveLoadScreen' in 'gui/sl_model.py').
+
+Save file layout:
+The file is written as JSON lines. The first line is a header with a small summary table for all slots, each following
+line holds the full record of exactly one slot in the order of constant 'DATA':
+
+    {"summaries": {"slot_00": {"name": ..., "race_name": ..., "class_name": ...}, "slot_01": null, ...}}
+    {"slot_00": {...full serialized character...}}
+    {"slot_01": null}
+    ...
+
+This allows the save/load screen to list all slots by reading and parsing only the header line, no matter how large
+each character's inventory is. Full records are only parsed when a character is actually loaded.
+Save files from earlier versions (one single JSON object holding all full records) are converted on first access.
+
+Functions 'init_save_file()', 'read_slot()' and 'write_slot()' are run on the I/O worker thread (see
+'core/io_worker.py') and accept an optional 'progress' callable which is called with '(done, total)' in bytes.
+"""
+import os
+import json
+from typing import Any, Callable
+
+
+# Constant with data structure for save file.
+DATA = {
+    "slot_00": None,
+    "slot_01": None,
+    "slot_02": None,
+    "slot_03": None,
+    "slot_04": None,
+    "slot_05": None,
+    "slot_06": None,
+    "slot_07": None,
+    "slot_08": None,
+}
+# See 'Settings' instance attribute 'settings.save_file' to change name of the save file if necessary ("characters.sav"
+# by default).
+
+# Character attributes stored in the header line of the save file for each slot.
+SUMMARY_KEYS: tuple[str, ...] = ("name", "race_name", "class_name")
+
+# Chunk size in bytes for reading the save file when progress is reported.
+READ_CHUNK_SIZE: int = 16384
+
+
+def get_slot_summary(data: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return summary dict for slot header from a serialized character.
+    ARGS:
+        data: serialized character dict (see 'serialize()' in 'character_model.py') or 'None' for empty slots.
+    RETURNS:
+        Dict with keys from 'SUMMARY_KEYS' or 'None' if slot is empty.
+    """
+    if not data:
+        return None
+
+    return {key: data.get(key) for key in SUMMARY_KEYS}
+
+
+def format_slot_line(slot_id: str, data: dict[str, Any] | None) -> str:
+    """Return single line of save file for slot 'slot_id'.
+    ARGS:
+        slot_id: slot key as in constant 'DATA'.
+        data: serialized character dict or 'None' for empty slots.
+    RETURNS:
+        JSON string for slot record including line break.
+    """
+    return json.dumps({slot_id: data}) + "\n"
+
+
+def format_header_line(summaries: dict[str, Any]) -> str:
+    """Return header line of save file.
+    ARGS:
+        summaries: dict with slot keys as in constant 'DATA' and summary dicts (see 'get_slot_summary()') as values.
+    RETURNS:
+        JSON string for header including line break.
+    """
+    return json.dumps({"summaries": summaries}) + "\n"
+
+
+def write_save_file(file_path: str, data: dict[str, Any]) -> None:
+    """Write complete save file from dict with full records for all slots.
+    ARGS:
+        file_path: path to save file.
+        data: dict with slot keys as in constant 'DATA' and serialized characters or 'None' as values.
+    """
+    summaries: dict[str, Any] = {slot_id: get_slot_summary(data.get(slot_id)) for slot_id in DATA}
+    lines: list[str] = [format_header_line(summaries)]
+    lines += [format_slot_line(slot_id, data.get(slot_id)) for slot_id in DATA]
+
+    write_lines(file_path, lines)
+
+
+def write_lines(file_path: str, lines: list[str]) -> None:
+    """Write lines to a temporary file first and replace save file afterward, so an interrupted write can't leave a
+    half-written save file behind.
+    ARGS:
+        file_path: path to save file.
+        lines: list of lines as returned by 'format_header_line()' and 'format_slot_line()'.
+    """
+    temp_path: str = file_path + ".tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+
+    os.replace(temp_path, file_path)
+
+
+def create_save_file(file_path: str) -> None:
+    """Create save file with empty slots as in constant 'DATA' if it doesn't exist.
+    ARGS:
+        file_path: path to save file.
+    """
+    if not os.path.exists(file_path):
+        write_save_file(file_path, DATA)
+
+
+def init_save_file(file_path: str, progress: Callable | None = None) -> dict[str, Any]:
+    """Create save file if necessary and return its slot summaries.
+    ARGS:
+        file_path: path to save file.
+        progress: optional callable for progress reports. Default is 'None'.
+    RETURNS:
+        Dict with slot keys as in constant 'DATA' and summary dicts or 'None' as values.
+    """
+    create_save_file(file_path)
+    summaries: dict[str, Any] = read_slot_summaries(file_path)
+
+    if progress:
+        progress(1, 1)
+
+    return summaries
+
+
+def read_slot_summaries(file_path: str) -> dict[str, Any]:
+    """Read and return the summary table from the header line of the save file without parsing any full character
+    records.
+    ARGS:
+        file_path: path to save file.
+    RETURNS:
+        Dict with slot keys as in constant 'DATA' and summary dicts or 'None' as values.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        header_line: str = f.readline()
+
+    try:
+        header: Any = json.loads(header_line)
+    except json.JSONDecodeError:
+        header = None
+
+    if not isinstance(header, dict) or "summaries" not in header:
+        # Save file from earlier version. Convert it and read the new header.
+        convert_save_file(file_path)
+        return read_slot_summaries(file_path)
+
+    summaries: dict[str, Any] = header["summaries"]
+    return {slot_id: summaries.get(slot_id) for slot_id in DATA}
+
+
+def read_slot(file_path: str, slot_id: str, progress: Callable | None = None) -> dict[str, Any] | None:
+    """Read and return the full record stored at 'slot_id'. Only the line holding that record is parsed.
+    ARGS:
+        file_path: path to save file.
+        slot_id: slot key as in constant 'DATA'.
+        progress: optional callable for progress reports. Default is 'None'.
+    RETURNS:
+        Serialized character dict or 'None' if slot is empty.
+    """
+    lines: list[str] = read_lines(file_path, progress)
+    return json.loads(lines[get_slot_line_index(slot_id)])[slot_id]
+
+
+def write_slot(file_path: str, slot_id: str, data: dict[str, Any] | None, progress: Callable | None = None) -> None:
+    """Store serialized character at 'slot_id' and update slot summary in header line. Records in other slots are
+    copied as they are without being parsed.
+    ARGS:
+        file_path: path to save file.
+        slot_id: slot key as in constant 'DATA'.
+        data: serialized character dict or 'None' to empty the slot.
+        progress: optional callable for progress reports. Reading and writing the file count as one half of the total
+            each. Default is 'None'.
+    """
+    file_size: int = os.path.getsize(file_path)
+    read_progress: Callable | None = (lambda done, total: progress(done, total * 2)) if progress else None
+    lines: list[str] = read_lines(file_path, read_progress)
+
+    summaries: dict[str, Any] = json.loads(lines[0])["summaries"]
+    summaries[slot_id] = get_slot_summary(data)
+
+    lines[0] = format_header_line(summaries)
+    lines[get_slot_line_index(slot_id)] = format_slot_line(slot_id, data)
+
+    write_lines(file_path, lines)
+
+    if progress:
+        progress(file_size * 2, file_size * 2)
+
+
+def read_lines(file_path: str, progress: Callable | None = None) -> list[str]:
+    """Return raw lines of save file, converting save files from earlier versions first if necessary.
+    ARGS:
+        file_path: path to save file.
+        progress: optional callable for progress reports. Default is 'None'.
+    RETURNS:
+        List of lines with header at index 0 followed by one line per slot.
+    """
+    file_size: int = os.path.getsize(file_path)
+    chunks: list[bytes] = []
+    bytes_read: int = 0
+
+    with open(file_path, "rb") as f:
+        while chunk := f.read(READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            bytes_read += len(chunk)
+            if progress:
+                progress(bytes_read, file_size)
+
+    lines: list[str] = b"".join(chunks).decode("utf-8").splitlines(keepends=True)
+
+    if len(lines) != len(DATA) + 1 or not lines[0].startswith('{"summaries"'):
+        convert_save_file(file_path)
+        return read_lines(file_path, progress)
+
+    return lines
+
+
+def get_slot_line_index(slot_id: str) -> int:
+    """Return line index of record for 'slot_id' in save file.
+    ARGS:
+        slot_id: slot key as in constant 'DATA'.
+    RETURNS:
+        Line index.
+    """
+    return list(DATA).index(slot_id) + 1
+
+
+def convert_save_file(file_path: str) -> None:
+    """Convert save file from earlier versions (single JSON object with full records for all slots) into the current
+    layout. Unreadable files are kept as backup ('<save file>.bak') and replaced with a file with empty slots.
+    ARGS:
+        file_path: path to save file.
+    """
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            data: Any = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        data = None
+
+    if not isinstance(data, dict):
+        os.replace(file_path, file_path + ".bak")
+        data = DATA
+
+    write_save_file(file_path, data)
@@ -5,6 +5,7 @@ program.
 """
 import sys
 import os
+import json
 
 
 class Settings:
@@ -19,7 +20,82 @@ class Settings:
         self.medium_screen: tuple[int, int] = (1600,900)
         self.large_screen: tuple[int, int] = (1920,1080)
 
+        # Performance profiles as dict with profile names as keys and dicts of attribute names and values as values.
+        # Profiles only set the attributes below, from frame cap to cache sizes, and are applied via
+        # 'apply_performance_profile()'. Selectable in the settings screen (see 'gui/settings_gui.py'). Default profile is
+        # set in 'self.default_settings'.
+        # "low" is meant for old netbooks and the like, "high" for machines with power to spare.
+        self.performance_profiles: dict[str, dict[str, int | bool]] = {
+            "low": {"frame_rate": 24, "antialias": False, "smooth_scaling": False, "animations": False,
+                    "cs_layout_cache_size": 2, "scaled_image_cache_size": 32, "text_layout_cache_size": 128,
+                    "state_surface_cache_size": 128, "hit_test_cell_size": 128, "ui_registry_cache_size": 1,
+                    "dirty_rects": True},
+            "balanced": {"frame_rate": 30, "antialias": True, "smooth_scaling": False, "animations": True,
+                         "cs_layout_cache_size": 6, "scaled_image_cache_size": 64, "text_layout_cache_size": 256,
+                         "state_surface_cache_size": 256, "hit_test_cell_size": 64, "ui_registry_cache_size": 2,
+                         "dirty_rects": False},
+            "high": {"frame_rate": 60, "antialias": True, "smooth_scaling": True, "animations": True,
+                     "cs_layout_cache_size": 12, "scaled_image_cache_size": 128, "text_layout_cache_size": 512,
+                     "state_surface_cache_size": 512, "hit_test_cell_size": 32, "ui_registry_cache_size": 4,
+                     "dirty_rects": False},
+        }
+        # Name of active performance profile. Assigned in 'apply_performance_profile()'.
+        self.performance_profile: str | None = None
+
+        # Attributes set by performance profiles, including cache sizes further down. Values here match the "balanced"
+        # profile.
+        # Frame cap only. Animations and timers use the measured frame time ('ui_shared_data.frame_time'), so they run
+        # at the same speed at any frame rate.
         self.frame_rate: int = 30
+        # Render text with antialiasing.
+        self.antialias: bool = True
+        # Scale background images at runtime with 'pygame.transform.smoothscale()' instead of the faster
+        # 'pygame.transform.scale()' (see 'scale_image()' in 'gui/screen_objects.py'). Backgrounds from the pre-scaled
+        # asset atlases are always smoothly scaled.
+        self.smooth_scaling: bool = False
+        # Fade and slide animations of buttons, interactive text fields and info panels. If 'False', they jump straight
+        # to their final value.
+        self.animations: bool = True
+        # Dirty-rect mode. The whole window is treated as one dirty rect: frames in which nothing on screen can have
+        # changed (no input, no running animation, no state change) are neither drawn nor sent to the display. See
+        # 'is_frame_dirty()' in 'main.py'.
+        self.dirty_rects: bool = False
+
+        # Progress bars for real tasks (loading characters, building the character sheet, etc.) fill up as soon as the
+        # task is done. Set to 'True' to additionally play the simulated, randomly paced fill animation as a purely
+        # cosmetic effect. The bar never runs ahead of the real task either way.
+        self.cosmetic_progress_bars: bool = False
+
+        # Maximum number of computed character sheet layouts kept in 'CharacterSheet.layout_cache' (see
+        # 'gui/cs_model.py'). Each entry holds the group background images for one character and screen size.
+        self.cs_layout_cache_size: int = 6
+        # Maximum number of art assets scaled to element sizes kept in the UI registry (see 'get_scaled_image()' in
+        # 'gui/ui_helpers.py').
+        self.scaled_image_cache_size: int = 64
+        # Maximum number of multi-line text layouts kept in 'text_layout_cache' (see 'get_text_layout()' in
+        # 'gui/screen_objects.py').
+        self.text_layout_cache_size: int = 256
+        # Maximum number of pre-rendered background surfaces for buttons and interactive text fields kept in
+        # 'state_surface_cache' (see 'get_state_surface()' in 'gui/screen_objects.py').
+        self.state_surface_cache_size: int = 256
+        # Cell size in pixels for hit-test grids of selectable screen elements (see 'gui/hit_test.py').
+        self.hit_test_cell_size: int = 64
+        # Maximum number of UI registries, one per window size and performance profile, kept in 'ui_registry_cache' (see
+        # 'get_ui_registry()' in 'gui/ui_registry.py'). Includes the active registry, so '1' rebuilds the registry on
+        # every window size change. Each registry holds its background images in full window size.
+        self.ui_registry_cache_size: int = 2
+
+        # Debug overlay with frame metrics (see 'core/metrics.py' and 'gui/debug_overlay.py'). Toggle in-program with F3,
+        # write collected metrics to 'self.metrics_file' with F4. 'self.metrics_buffer_size' is the number of frames kept.
+        self.debug_overlay: bool = False
+        self.metrics_buffer_size: int = 900
+        self.metrics_file: str = "frame_metrics.csv"
+
+        # Program states to profile with 'cProfile' as dict with state names as keys and number of captured frames as
+        # values, i.e. {"character_sheet": 60}. Captures are written to 'self.profile_dir'. States can also be set via
+        # environment variable, see 'core/profiling.py'.
+        self.profile_states: dict[str, int] = {}
+        self.profile_dir: str = "profiles"
 
         # Fonts.
         self.font: str = self.get_resource_path("gui/art/font/EagleLake-Regular.ttf")
@@ -43,20 +119,100 @@ class Settings:
         self.progress_bar_color: tuple[int, int, int] = (48, 70, 50)
         self.bar_border_color: tuple[int, int, int] = (220, 130, 75)
 
-        self.default_settings: tuple[tuple] = (self.small_screen, )
+        self.default_settings: tuple[tuple[int, int], str] = (self.small_screen, "balanced")
 
         # Empty starting attributes. Values are assigned first in 'run_character_creator()' in 'main.py' by calling the
         # 'set_default()' method.
         # This approach ensures easier maintainability if changes are made to 'self.default_settings' as everything else
-        # is handled by 'set_default()' method.
-        self.screen_size: tuple[int, int] | None = None
+        # is handled by 'set_default()' method. Values saved in the settings file are applied afterward via
+        # 'load_settings()'. 'self.screen_size' is 'False' for full screen.
+        self.screen_size: tuple[int, int] | bool | None = None
 
         # Name of the save file created in project folder via class 'SaveLoadScreen' if not present.
         self.save_file: str = "characters.sav"
+        # Name of the settings file in project folder. Written when settings are changed in the settings screen and read
+        # via 'load_settings()' before the window is created, see 'initialize_character_creator()' in 'main.py'.
+        self.settings_file: str = "settings.json"
 
     def set_default(self) -> None:
         """Set all settings variables to default values as defined in 'self.default_settings'."""
         self.screen_size: tuple[tuple] = self.default_settings[0]
+        self.apply_performance_profile(self.default_settings[1])
+
+    def apply_performance_profile(self, profile: str) -> None:
+        """Set attributes to values of performance profile 'profile' from 'self.performance_profiles'. Values are read
+        where they are used, so the profile takes effect right away, apart from text and hit-test grids of screen elements
+        that were already built (see 'SettingsGUI.select_performance_profile()' in 'gui/settings_gui.py').
+        ARGS:
+            profile: name of profile, i.e. "balanced".
+        """
+        if profile not in self.performance_profiles:
+            print(f"Unknown performance profile '{profile}'. Profile not changed.")
+            return
+
+        for attribute, value in self.performance_profiles[profile].items():
+            setattr(self, attribute, value)
+
+        self.performance_profile = profile
+
+    def load_settings(self) -> None:
+        """Apply window size and performance profile stored in 'self.settings_file'. A missing file is skipped silently,
+        unreadable files and invalid values are reported and skipped, keeping the current values."""
+        try:
+            with open(self.get_settings_file_path(), encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Settings file '{self.settings_file}' could not be read ({e}). Using default settings.")
+            return
+
+        if not isinstance(data, dict):
+            print(f"Settings file '{self.settings_file}' is invalid. Using default settings.")
+            return
+
+        # Window size is stored as list or 'false' for full screen.
+        screen_size = data.get("screen_size")
+        if screen_size is False:
+            self.screen_size = False
+        elif isinstance(screen_size, list) and tuple(screen_size) in (self.small_screen, self.medium_screen,
+                                                                      self.large_screen):
+            self.screen_size = tuple(screen_size)
+        elif screen_size is not None:
+            print(f"Invalid window size '{screen_size}' in settings file. Using default window size.")
+
+        # Profile is stored by name, see 'self.performance_profiles'.
+        profile = data.get("performance_profile")
+        if isinstance(profile, str) and profile in self.performance_profiles:
+            self.apply_performance_profile(profile)
+        elif profile is not None:
+            print(f"Invalid performance profile '{profile}' in settings file. Using default performance profile.")
+
+    def save_settings(self) -> None:
+        """Write window size and performance profile to 'self.settings_file'. Written to a temporary file first, so an
+        interrupted write can't leave a half-written settings file behind."""
+        file_path: str = self.get_settings_file_path()
+        temp_path: str = file_path + ".tmp"
+        data: dict = {"screen_size": self.screen_size, "performance_profile": self.performance_profile}
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, file_path)
+        except OSError as e:
+            print(f"Settings file '{self.settings_file}' could not be written ({e}).")
+
+    def get_settings_file_path(self) -> str:
+        """Return full path to the settings file, next to the executable when the app is frozen.
+        RETURNS:
+            file_path
+        """
+        if getattr(sys, "frozen", False):
+            base_path: str = os.path.dirname(sys.executable)
+        else:
+            base_path: str = os.path.abspath(".")
+
+        return os.path.join(base_path, self.settings_file)
 
     @staticmethod
     def get_resource_path(relative_path: str) -> str:
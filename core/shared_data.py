@@ -17,7 +17,7 @@ class SharedData:
         """Initialize shared data attributes."""
         # Variable for later instances of class objects.
         self.character: object | None = None
-        self.save_load_screen: object | None
+        self.save_load_screen: object | None = None
         self.credits_screen: object | None = None
         self.settings_gui: object = None
         self.cs_sheet: object | None = None
@@ -160,6 +160,9 @@ class SharedData:
         else:
             uisd.lang_selection_active = True
 
+        # Reposition languages, as selectable languages are moved on- or off-screen based on 'uisd.lang_selection_active'.
+        uisd.reset_position_flag()
+
     def clear_language_selection(self) -> None:
         """Reset entire language selection."""
         for language in uisd.ui_registry["lang_fields"]:
@@ -167,13 +170,14 @@ class SharedData:
         self.selected_languages: list = []
 
         uisd.lang_selection_active = True
+        uisd.reset_position_flag()
 
     def shared_data_janitor(self) -> None:
         """Reset shared data not automatically overwritten elsewhere with default values in case of a switch to a
         previous screen or the main menu.
 
-        Method is called in event handler 'naming_character_events()' when returning to character menu from
-        'name_random_character' state, in addition to its method calls in states 'pre_main_menu' and 'show_abilities'.
+        Method is called in event handler 'back_from_naming()' when returning to character menu from
+        'name_random_character' state, in addition to its calls in enter hooks of states 'main_menu' and 'show_abilities'.
         This resolves multiple issues that caused the program to freeze when switching between different screens or when
         creating a new character after one has already been created.
         """
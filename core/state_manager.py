@@ -1,277 +1,452 @@
 """
-Main functions/state managers used in 'main.py'.
+State handlers, enter/exit hooks and state graph used in 'main.py'.
+
+Each program state (see 'core/states.py') has its own handler, called once per frame while the state is active. Handlers
+draw their screen, handle events and return the next state. Work that only has to be done once when a state is entered
+or left is done in enter/exit hooks instead. The state graph 'STATE_GRAPH' at the bottom of this module declares handler,
+hooks and allowed transitions for each state and is compiled once into the lookup tables 'STATE_HANDLERS' and
+'TRANSITIONS'. State changes are applied via 'change_state()'.
+Screen objects stored in 'shared_data' (character sheet, save/load, settings and credits screens) release their surfaces
+once all states they are shown in are left, see 'SCREEN_LIFECYCLES'.
 """
 import random
+from typing import Callable
 
 import gui.gui as gui
 from gui.credits import Credits
 from gui.shared_data import ui_shared_data as uisd
 from gui.settings_gui import SettingsGUI
-from gui.cs_model import CharacterSheet
+from gui.cs_model import CharacterSheet, build_character_sheet
 from gui.sl_model import SaveLoadScreen
 
 import core.rules as rls
 import core.event_handlers as eh
 from .shared_data import shared_data as sd
+from .io_worker import io_worker
 from .character_model import Character
+from .states import State, StateNode
 
 
-def main_state_manager(screen, state: str, mouse_pos) -> str:
-    """State manager for main states, i.e. 'title_screen', 'main_menu', etc.
-    ARGS:
-        screen: PyGame window.
-        state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    state = eh.main_events(screen, state, mouse_pos)
+"""Main states."""
 
-    if state == "title_screen":
-        gui.show_title_screen(screen)
+def title_screen_state(screen, state: State, mouse_pos) -> State:
+    """Show title screen until assets are loaded and user continues."""
+    gui.show_title_screen(screen)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    elif state == "pre_main_menu":
-        sd.character = Character()
-        sd.shared_data_janitor()
-        state = "main_menu"
 
-    elif state == "main_menu":
-        gui.show_main_menu(screen, mouse_pos)
+def main_menu_state(screen, state: State, mouse_pos) -> State:
+    """Show main menu."""
+    gui.show_main_menu(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    elif state == "settings_screen":
-        state = settings_screen_state_manager(screen, state, mouse_pos)
 
-    elif state in {"init_credits", "credits"}:
-        state = credits_state_manager(screen, state)
+def settings_screen_state(screen, state: State, mouse_pos) -> State:
+    """Show settings screen."""
+    if not sd.settings_gui:
+        sd.settings_gui = SettingsGUI(screen)
 
-    elif state == "character_menu":
-        gui.show_character_menu(screen, mouse_pos)
+    sd.settings_gui.show_settings(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    return state
 
-def save_load_screen_state_manager(screen, state: str, mouse_pos) -> str:
-    """State manager for 'save/load screen'.
+def credits_state(screen, state: State, mouse_pos) -> State:
+    """Show credits."""
+    sd.credits_screen.show_credits(screen)
+    return eh.handle_events(screen, state, mouse_pos)
+
+
+def character_menu_state(screen, state: State, mouse_pos) -> State:
+    """Show menu to choose between custom and random character creation."""
+    gui.show_character_menu(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
+
+
+def enter_main_menu(screen) -> None:
+    """Start with new character and reset shared data whenever the main menu is shown."""
+    sd.character = Character()
+    sd.shared_data_janitor()
+
+
+def enter_credits(screen) -> None:
+    """Create credits screen."""
+    sd.credits_screen = Credits(screen)
+
+
+"""Save/load screen states."""
+
+def apply_io_jobs(state: State) -> State:
+    """Apply results of save file operations finished on the I/O worker thread (see 'core/io_worker.py').
     ARGS:
-        screen: PyGame window.
         state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
     RETURNS:
         state
     """
-    if state == "init_save_load_screen":
-        sd.save_load_screen = SaveLoadScreen(screen)
-        sd.save_load_screen.position_sl_elements()
-        state = "save_load_screen"
+    if sd.save_load_screen:
+        for job in io_worker.poll():
+            state = sd.save_load_screen.handle_io_job(job, state)
+
+    return state
+
+
+def save_load_screen_state(screen, state: State, mouse_pos) -> State:
+    """Show save/load screen."""
+    next_state: State = apply_io_jobs(state)
+    if next_state != state:
+        return next_state
+
+    sd.save_load_screen.show_sl_screen(mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
+
 
-    elif state == "save_load_screen":
-        sd.save_load_screen.show_sl_screen(mouse_pos)
-        state = eh.save_load_events(screen, state, mouse_pos)
+def save_load_confirmation_state(screen, state: State, mouse_pos) -> State:
+    """Show confirmation message for states 'char_not_saved', 'char_delete' and 'char_overwrite'."""
+    next_state: State = apply_io_jobs(state)
+    if next_state != state:
+        return next_state
 
-    elif state in {"char_not_saved", "char_delete", "char_overwrite"}:
-        sd.save_load_screen.format_confirm_message(state)
-        sd.save_load_screen.show_confirm_message(mouse_pos)
-        state = eh.save_load_events(screen, state, mouse_pos)
+    sd.save_load_screen.format_confirm_message(state)
+    sd.save_load_screen.show_confirm_message(mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    elif state == "loading_character":
-        loading_bar = sd.save_load_screen.loading_bar
-        sd.save_load_screen.show_loading_character_screen()
 
-        if loading_bar.finished:
-            loading_bar.reset_progress_bar()
-            uisd.position_flag = False
-            return "init_character_sheet"
+def loading_character_state(screen, state: State, mouse_pos) -> State:
+    """Show progress while character is loaded from save file."""
+    next_state: State = apply_io_jobs(state)
+    if next_state != state:
+        return next_state
 
+    sd.save_load_screen.show_loading_character_screen()
+
+    if sd.save_load_screen.loading_bar.finished:
+        return State.CHARACTER_SHEET
 
     return state
 
 
-def settings_screen_state_manager(screen, state: str, mouse_pos) -> str:
-    """State manager for settings screen state 'settings_screen'.
-    ARGS:
-        screen: PyGame window.
-        state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    if not sd.settings_gui:
-        sd.settings_gui = SettingsGUI(screen)
+def updating_save_file_state(screen, state: State, mouse_pos) -> State:
+    """Show progress while character is saved or deleted."""
+    next_state: State = apply_io_jobs(state)
+    if next_state != state:
+        return next_state
 
-    state = eh.main_events(screen, state, mouse_pos)
-    sd.settings_gui.show_settings(screen, mouse_pos)
+    sd.save_load_screen.show_updating_save_file_screen()
+
+    if sd.save_load_screen.loading_bar.finished:
+        return State.SAVE_LOAD_SCREEN
 
     return state
 
 
-def credits_state_manager(screen, state: str) -> str:
-    """'Secondary' state manager for use in 'main_state_manager' to handle credits screen object.
-    ARGS:
-        screen: PyGame window.
-        state: program state.
-    RETURNS:
-        state
-    """
-    if state == "init_credits":
-        sd.credits_screen = Credits(screen)
-        state = "credits"
+def enter_save_load_screen(screen) -> None:
+    """Create save/load screen. Screen is created again on every entry to show the current save file."""
+    sd.save_load_screen = SaveLoadScreen(screen)
+    sd.save_load_screen.position_sl_elements()
+
+
+def exit_save_file_progress(screen) -> None:
+    """Reset progress bar of save/load screen so it can be reused."""
+    sd.save_load_screen.loading_bar.reset_progress_bar()
 
-    elif state == "credits":
-        sd.credits_screen.show_credits(screen)
+
+"""Custom character creation states."""
+
+def set_abilities_state(screen, state: State, mouse_pos) -> State:
+    """Roll abilities until at least one race/class combination is possible."""
+    sd.character.set_ability_dict()
+
+    if rls.check_valid_race_class(sd.character):
+        return State.SHOW_ABILITIES
 
     return state
 
 
-def custom_character_state_manager(screen, state: str, mouse_pos) -> str:
-    """State manager for custom character creation based on user input.
-    ARGS:
-        screen: PyGame window.
-        state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    if state == "set_abilities":
-        sd.character.set_ability_dict()
-        if rls.check_valid_race_class(sd.character):
-            state = "show_abilities"
-        else:
-            state = "set_abilities"
+def show_abilities_state(screen, state: State, mouse_pos) -> State:
+    """Show rolled ability scores."""
+    gui.show_ability_scores_screen(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
+
+
+def race_class_selection_state(screen, state: State, mouse_pos) -> State:
+    """Show race/class selection."""
+    gui.show_race_class_selection_screen(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    elif state == "show_abilities":
-        sd.shared_data_janitor()
-        gui.show_ability_scores_screen(screen, mouse_pos)
-        state = eh.custom_character_events(screen, state, mouse_pos)
 
-    elif state == "race_class_selection":
-        gui.show_race_class_selection_screen(screen, mouse_pos)
-        state = eh.custom_character_events(screen, state,  mouse_pos)
+def spell_selection_state(screen, state: State, mouse_pos) -> State:
+    """Show spell selection."""
+    sd.set_default_spell(uisd.ui_registry["spell_fields"])
+    gui.show_spell_selection_screen(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    elif state == "spell_selection":
-        sd.set_default_spell(uisd.ui_registry["spell_fields"])
-        gui.show_spell_selection_screen(screen, mouse_pos)
-        state = eh.custom_character_events(screen, state, mouse_pos)
 
-    elif state == "language_selection":
-        sd.set_default_languages(uisd.ui_registry["lang_fields"])
+def language_selection_state(screen, state: State, mouse_pos) -> State:
+    """Show language selection, or pass straight through to naming screen if character can't learn extra languages."""
+    sd.set_default_languages(uisd.ui_registry["lang_fields"])
 
-        if not uisd.language_flag:
-            sd.character.set_languages(uisd.ui_registry["lang_fields"])
-            return "name_character"
-        else:
-            gui.show_language_selection_screen(screen, mouse_pos)
+    if not uisd.language_flag:
+        sd.character.set_languages(uisd.ui_registry["lang_fields"])
+        return State.NAME_CHARACTER
 
-        state = eh.custom_character_events(screen, state, mouse_pos)
+    gui.show_language_selection_screen(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    elif state == "name_character":
-        if uisd.language_flag:
-            sd.clear_language_selection()
 
-        gui.show_naming_screen(screen, mouse_pos)
-        state = eh.naming_character_events(screen, state, mouse_pos)
+def naming_state(screen, state: State, mouse_pos) -> State:
+    """Show naming screen for states 'name_character' and 'name_random_character'."""
+    gui.show_naming_screen(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-        if sd.random_money_flag or sd.custom_money_flag or uisd.dice_roll_complete:
-            sd.random_money_flag, sd.custom_money_flag, uisd.dice_roll_complete = False, False, False
 
-    elif state == "select_starting_money":
-        gui.show_starting_money_screen(screen, mouse_pos)
-        state = eh.custom_character_events(screen, state, mouse_pos)
+def starting_money_state(screen, state: State, mouse_pos) -> State:
+    """Show starting money screen for states 'select_starting_money' and 'custom_input_money'."""
+    gui.show_starting_money_screen(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    elif state == "custom_input_money":
-        gui.show_starting_money_screen(screen, mouse_pos)
-        state = eh.custom_starting_money_events(screen, state, mouse_pos)
 
-    elif state == "confirm_character":
-        gui.show_created_character_confirmation_screen(screen, mouse_pos)
-        state = eh.custom_character_events(screen,state, mouse_pos)
+def confirm_character_state(screen, state: State, mouse_pos) -> State:
+    """Show confirmation for created character."""
+    gui.show_created_character_confirmation_screen(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
 
-    elif state == "create_character_sheet":
-        progress_bar = uisd.ui_registry["creation_progress_bar"]
-        gui.show_building_character_sheet_screen(screen)
 
-        if progress_bar.finished:
-            progress_bar.reset_progress_bar()
-            uisd.position_flag = False
-            return "creation_complete"
+def create_character_sheet_state(screen, state: State, mouse_pos) -> State:
+    """Build character sheet with progress bar for states 'create_character_sheet' and
+    'create_random_character_sheet'."""
+    progress_bar = uisd.ui_registry["creation_progress_bar"]
+    if not progress_bar.source:
+        progress_bar.set_progress_source(build_character_sheet(screen))
+    gui.show_building_character_sheet_screen(screen)
 
-    elif state == "creation_complete":
-        gui.show_character_complete_screen(screen, mouse_pos)
-        state = eh.custom_character_events(screen, state, mouse_pos)
+    if progress_bar.finished:
+        if state == State.CREATE_RANDOM_CHARACTER_SHEET:
+            return State.NAME_RANDOM_CHARACTER
+        return State.CREATION_COMPLETE
 
     return state
 
 
-def random_character_state_manager(screen, state: str, mouse_pos) -> str:
-    """State manager for random character creation.
-    ARGS:
-        screen: PyGame window.
-        state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    if state == "random_character":
-        if not sd.possible_characters:
-            sd.character.set_ability_dict()
-
-            if rls.check_valid_race_class(sd.character):
-                sd.possible_characters = rls.build_possible_characters_list(sd.character)
-                sd.selected_race, sd.selected_class = random.choice(sd.possible_characters).split()
-                sd.character.set_race(sd.selected_race)
-                sd.character.set_class(sd.selected_class)
-                sd.character.set_character_values()
-                sd.character.set_random_selections(uisd.ui_registry["spell_fields"], rls.set_language_flag(sd.character),
-                                                   uisd.ui_registry["lang_fields"])
-                state = "set_random_money"
-
-            else:
-                state = "random_character"
-
-    elif state == "set_random_money":
-        sd.character.money = rls.roll_starting_money()
-        state = "create_random_character_sheet"
-
-    elif state == "create_random_character_sheet":
-        progress_bar = uisd.ui_registry["creation_progress_bar"]
-        gui.show_building_character_sheet_screen(screen)
-
-        if progress_bar.finished:
-            progress_bar.reset_progress_bar()
-            uisd.position_flag = False
-            return "name_random_character"
-
-    elif state == "name_random_character":
-        # 'creation_complete' state that follows afterward is handled in 'custom_character()' to avoid duplicate code.
-        gui.show_naming_screen(screen, mouse_pos)
-        state = eh.naming_character_events(screen, state, mouse_pos)
+def creation_complete_state(screen, state: State, mouse_pos) -> State:
+    """Show message for completed character creation."""
+    gui.show_character_complete_screen(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
+
+
+def enter_show_abilities(screen) -> None:
+    """Reset selections from previous runs through character creation."""
+    sd.shared_data_janitor()
+
+
+def enter_name_character(screen) -> None:
+    """Reset language selection and starting money choice."""
+    if uisd.language_flag:
+        sd.clear_language_selection()
+
+    sd.random_money_flag, sd.custom_money_flag, uisd.dice_roll_complete = False, False, False
+
+
+def exit_create_character_sheet(screen) -> None:
+    """Reset progress bar for character sheet creation so it can be reused."""
+    uisd.ui_registry["creation_progress_bar"].reset_progress_bar()
+
+
+"""Random character creation states."""
+
+def random_character_state(screen, state: State, mouse_pos) -> State:
+    """Roll abilities until at least one race/class combination is possible, then pick random race, class, spell and
+    languages."""
+    if not sd.possible_characters:
+        sd.character.set_ability_dict()
+
+        if rls.check_valid_race_class(sd.character):
+            sd.possible_characters = rls.build_possible_characters_list(sd.character)
+            sd.selected_race, sd.selected_class = random.choice(sd.possible_characters).split()
+            sd.character.set_race(sd.selected_race)
+            sd.character.set_class(sd.selected_class)
+            sd.character.set_character_values()
+            sd.character.set_random_selections(uisd.ui_registry["spell_fields"], rls.set_language_flag(sd.character),
+                                               uisd.ui_registry["lang_fields"])
+            return State.SET_RANDOM_MONEY
 
     return state
 
 
-def character_sheet_state_manager(screen, state: str, mouse_pos) -> str:
-    """State manager character sheet screen.
-    ARGS:
-        screen: PyGame window.
-        state: program state.
-        mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
-    RETURNS:
-        state
-    """
-    if state == "init_character_sheet":
+def set_random_money_state(screen, state: State, mouse_pos) -> State:
+    """Roll starting money."""
+    sd.character.money = rls.roll_starting_money()
+    return State.CREATE_RANDOM_CHARACTER_SHEET
+
+
+"""Character sheet states."""
+
+def character_sheet_state(screen, state: State, mouse_pos) -> State:
+    """Show character sheet."""
+    sd.cs_sheet.show_character_sheet_screen(mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
+
+
+def sheet_confirmation_state(screen, state: State, mouse_pos) -> State:
+    """Show confirmation message when leaving character sheet of unsaved character."""
+    sd.cs_sheet.show_exit_confirm_message(screen, mouse_pos)
+    return eh.handle_events(screen, state, mouse_pos)
+
+
+def enter_character_sheet(screen) -> None:
+    """Create character sheet, or reuse sheet built in state 'create_character_sheet' unless character values have
+    changed since."""
+    if not (sd.cs_sheet and sd.cs_sheet.is_up_to_date()):
         sd.cs_sheet = CharacterSheet(screen)
         sd.cs_sheet.position_cs_elements()
 
-        if uisd.is_loaded:
-            sd.cs_sheet.is_saved = uisd.is_loaded
-            uisd.is_loaded = False
+    if uisd.is_loaded:
+        sd.cs_sheet.is_saved = uisd.is_loaded
+        uisd.is_loaded = False
 
-        state = "character_sheet"
 
-    elif state == "character_sheet":
-        sd.cs_sheet.show_character_sheet_screen(mouse_pos)
-        state = eh.cs_sheet_events(screen, state, mouse_pos)
+"""State graph."""
 
-    elif state == "sheet_confirmation":
-        sd.cs_sheet.show_exit_confirm_message(screen, mouse_pos)
-        state = eh.cs_sheet_events(screen, state, mouse_pos)
+def enter_screen(screen) -> None:
+    """Reset position flag for screen-specific UI placement, and alpha values of buttons shared by several screens.
+    Called on every state change before the enter hook of the new state."""
+    uisd.reset_position_flag()
+    uisd.ui_registry["continue_button"].reset_fade_alpha()
+    uisd.ui_registry["skip_button"].reset_fade_alpha()
+    uisd.ui_registry["back_button"].reset_fade_alpha()
 
-    return state
+
+def update_screen_lifecycles(state: State, next_state: State) -> None:
+    """Call 'on_exit()' of screen objects in 'shared_data' whose states are left with the state change, and 'on_enter()'
+    of screen objects whose states are entered. Screens release their heavy surfaces in 'on_exit()' and restore them in
+    'on_enter()', so only surfaces of the active screen are kept. Screens not kept (see 'SCREEN_LIFECYCLES') are
+    dropped from 'shared_data' once left.
+    ARGS:
+        state: program state that is left.
+        next_state: program state that is entered.
+    """
+    for attr, (states, keep) in SCREEN_LIFECYCLES.items():
+        screen_object = getattr(sd, attr)
+        if not screen_object:
+            continue
+
+        if state in states and next_state not in states:
+            if hasattr(screen_object, "on_exit"):
+                screen_object.on_exit()
+            if not keep:
+                setattr(sd, attr, None)
+
+        elif next_state in states and state not in states and hasattr(screen_object, "on_enter"):
+            screen_object.on_enter()
+
+
+def change_state(screen, state: State, next_state: State) -> State:
+    """Leave 'state' and enter 'next_state', calling exit and enter hooks. Transitions not declared in 'STATE_GRAPH' are
+    still applied, but reported.
+    ARGS:
+        screen: PyGame window.
+        state: current program state.
+        next_state: state returned by handler of 'state'.
+    RETURNS:
+        next_state
+    """
+    next_state = State(next_state)
+
+    if next_state not in TRANSITIONS[state]:
+        print(f"Undeclared state transition '{state}' -> '{next_state}'.")
+
+    if STATE_GRAPH[state].on_exit:
+        STATE_GRAPH[state].on_exit(screen)
+
+    enter_screen(screen)
+    if STATE_GRAPH[next_state].on_enter:
+        STATE_GRAPH[next_state].on_enter(screen)
+
+    # Screen lifecycles are updated last, so screens created by enter hooks are already in place.
+    update_screen_lifecycles(state, next_state)
+
+    return next_state
+
+
+# State graph with states as keys and 'StateNode' instances as values. Validate with 'python -m core.states' after
+# changes.
+STATE_GRAPH: dict[State, StateNode] = {
+    # Main states.
+    State.TITLE_SCREEN: StateNode(title_screen_state, (State.MAIN_MENU,)),
+    State.MAIN_MENU: StateNode(main_menu_state, (State.CHARACTER_MENU, State.SAVE_LOAD_SCREEN, State.SETTINGS_SCREEN,
+                                                 State.CREDITS), on_enter=enter_main_menu),
+    State.SETTINGS_SCREEN: StateNode(settings_screen_state, (State.MAIN_MENU,)),
+    State.CREDITS: StateNode(credits_state, (State.MAIN_MENU,), on_enter=enter_credits),
+    State.CHARACTER_MENU: StateNode(character_menu_state, (State.SET_ABILITIES, State.RANDOM_CHARACTER,
+                                                           State.MAIN_MENU)),
+
+    # Save/load screen states.
+    State.SAVE_LOAD_SCREEN: StateNode(save_load_screen_state, (State.UPDATING_SAVE_FILE, State.LOADING_CHARACTER,
+                                                               State.CHAR_NOT_SAVED, State.CHAR_DELETE,
+                                                               State.CHAR_OVERWRITE, State.MAIN_MENU,
+                                                               State.CHARACTER_SHEET),
+                                      on_enter=enter_save_load_screen),
+    State.CHAR_NOT_SAVED: StateNode(save_load_confirmation_state, (State.SAVE_LOAD_SCREEN, State.LOADING_CHARACTER)),
+    State.CHAR_DELETE: StateNode(save_load_confirmation_state, (State.SAVE_LOAD_SCREEN, State.UPDATING_SAVE_FILE)),
+    State.CHAR_OVERWRITE: StateNode(save_load_confirmation_state, (State.SAVE_LOAD_SCREEN, State.UPDATING_SAVE_FILE)),
+    State.LOADING_CHARACTER: StateNode(loading_character_state, (State.CHARACTER_SHEET, State.SAVE_LOAD_SCREEN),
+                                       on_exit=exit_save_file_progress),
+    State.UPDATING_SAVE_FILE: StateNode(updating_save_file_state, (State.SAVE_LOAD_SCREEN,),
+                                        on_exit=exit_save_file_progress),
+
+    # Custom character creation states.
+    State.SET_ABILITIES: StateNode(set_abilities_state, (State.SHOW_ABILITIES,)),
+    State.SHOW_ABILITIES: StateNode(show_abilities_state, (State.CHARACTER_MENU, State.SET_ABILITIES,
+                                                           State.RACE_CLASS_SELECTION), on_enter=enter_show_abilities),
+    State.RACE_CLASS_SELECTION: StateNode(race_class_selection_state, (State.SHOW_ABILITIES, State.SPELL_SELECTION,
+                                                                       State.LANGUAGE_SELECTION)),
+    State.SPELL_SELECTION: StateNode(spell_selection_state, (State.RACE_CLASS_SELECTION, State.LANGUAGE_SELECTION)),
+    State.LANGUAGE_SELECTION: StateNode(language_selection_state, (State.SPELL_SELECTION, State.RACE_CLASS_SELECTION,
+                                                                   State.NAME_CHARACTER)),
+    State.NAME_CHARACTER: StateNode(naming_state, (State.LANGUAGE_SELECTION, State.SPELL_SELECTION,
+                                                   State.RACE_CLASS_SELECTION, State.SELECT_STARTING_MONEY),
+                                    on_enter=enter_name_character),
+    State.SELECT_STARTING_MONEY: StateNode(starting_money_state, (State.NAME_CHARACTER, State.CONFIRM_CHARACTER,
+                                                                  State.CUSTOM_INPUT_MONEY)),
+    State.CUSTOM_INPUT_MONEY: StateNode(starting_money_state, (State.NAME_CHARACTER, State.CONFIRM_CHARACTER,
+                                                               State.SELECT_STARTING_MONEY)),
+    State.CONFIRM_CHARACTER: StateNode(confirm_character_state, (State.SELECT_STARTING_MONEY,
+                                                                 State.CREATE_CHARACTER_SHEET)),
+    State.CREATE_CHARACTER_SHEET: StateNode(create_character_sheet_state, (State.CREATION_COMPLETE,),
+                                            on_exit=exit_create_character_sheet),
+    State.CREATION_COMPLETE: StateNode(creation_complete_state, (State.CHARACTER_SHEET,)),
+
+    # Random character creation states.
+    State.RANDOM_CHARACTER: StateNode(random_character_state, (State.SET_RANDOM_MONEY,)),
+    State.SET_RANDOM_MONEY: StateNode(set_random_money_state, (State.CREATE_RANDOM_CHARACTER_SHEET,)),
+    State.CREATE_RANDOM_CHARACTER_SHEET: StateNode(create_character_sheet_state, (State.NAME_RANDOM_CHARACTER,),
+                                                   on_exit=exit_create_character_sheet),
+    State.NAME_RANDOM_CHARACTER: StateNode(naming_state, (State.CHARACTER_MENU, State.CREATION_COMPLETE)),
+
+    # Character sheet states.
+    State.CHARACTER_SHEET: StateNode(character_sheet_state, (State.SAVE_LOAD_SCREEN, State.MAIN_MENU,
+                                                             State.SHEET_CONFIRMATION), on_enter=enter_character_sheet),
+    State.SHEET_CONFIRMATION: StateNode(sheet_confirmation_state, (State.MAIN_MENU, State.CHARACTER_SHEET,
+                                                                   State.SAVE_LOAD_SCREEN)),
+}
+
+# Screen objects in 'shared_data' with the states they are shown in, and whether they are kept once these states are
+# left. Screens created again by enter hooks on every entry aren't kept. See 'update_screen_lifecycles()'.
+SCREEN_LIFECYCLES: dict[str, tuple[frozenset[State], bool]] = {
+    "settings_gui": (frozenset((State.SETTINGS_SCREEN,)), True),
+    "credits_screen": (frozenset((State.CREDITS,)), False),
+    "save_load_screen": (frozenset((State.SAVE_LOAD_SCREEN, State.CHAR_NOT_SAVED, State.CHAR_DELETE,
+                                    State.CHAR_OVERWRITE, State.LOADING_CHARACTER, State.UPDATING_SAVE_FILE)), False),
+    "cs_sheet": (frozenset((State.CHARACTER_SHEET, State.SHEET_CONFIRMATION)), True),
+}
+
+# States whose screens only change on user input or while animations are running, i.e. without progress bars, timers,
+# blinking cursors or background jobs. In dirty-rect mode frames of these states are skipped if nothing has changed (see
+# 'is_frame_dirty()' in 'main.py').
+STATIC_STATES: frozenset[State] = frozenset((State.MAIN_MENU, State.SETTINGS_SCREEN, State.CHARACTER_MENU,
+                                             State.SHOW_ABILITIES, State.RACE_CLASS_SELECTION, State.SPELL_SELECTION,
+                                             State.LANGUAGE_SELECTION, State.CONFIRM_CHARACTER, State.CREATION_COMPLETE,
+                                             State.CHARACTER_SHEET, State.SHEET_CONFIRMATION))
+
+# Lookup tables compiled from 'STATE_GRAPH'. Transitions include the state itself, as handlers return it while the state
+# stays active.
+STATE_HANDLERS: dict[State, Callable] = {state: node.handler for state, node in STATE_GRAPH.items()}
+TRANSITIONS: dict[State, frozenset[State]] = {state: node.transitions | {state} for state, node in STATE_GRAPH.items()}
@@ -0,0 +1,152 @@
+"""
+Program states and state graph declarations.
+
+Program states are members of 'State'. As 'StrEnum' members they compare equal to their string values, so state names
+used in settings, benchmark scripts and metrics keep working.
+The state graph itself, with handler, enter/exit hooks and allowed transitions for each state, is declared as
+'STATE_GRAPH' at the bottom of 'core/state_manager.py' and compiled once into lookup tables used by 'run_frame()' in
+'main.py'.
+
+The graph can be validated offline from project root:
+    python -m core.states
+Reports transitions to undeclared states, states without handler, states unreachable from 'INITIAL_STATE' and dead
+states from which the main menu can't be reached anymore. Exit code is 1 if problems are found.
+"""
+import sys
+from enum import StrEnum
+from typing import Callable
+
+
+class State(StrEnum):
+    """Program states."""
+    # Main states.
+    TITLE_SCREEN = "title_screen"
+    MAIN_MENU = "main_menu"
+    SETTINGS_SCREEN = "settings_screen"
+    CREDITS = "credits"
+    CHARACTER_MENU = "character_menu"
+
+    # Save/load screen states.
+    SAVE_LOAD_SCREEN = "save_load_screen"
+    CHAR_NOT_SAVED = "char_not_saved"
+    CHAR_DELETE = "char_delete"
+    CHAR_OVERWRITE = "char_overwrite"
+    LOADING_CHARACTER = "loading_character"
+    UPDATING_SAVE_FILE = "updating_save_file"
+
+    # Custom character creation states.
+    SET_ABILITIES = "set_abilities"
+    SHOW_ABILITIES = "show_abilities"
+    RACE_CLASS_SELECTION = "race_class_selection"
+    SPELL_SELECTION = "spell_selection"
+    LANGUAGE_SELECTION = "language_selection"
+    NAME_CHARACTER = "name_character"
+    SELECT_STARTING_MONEY = "select_starting_money"
+    CUSTOM_INPUT_MONEY = "custom_input_money"
+    CONFIRM_CHARACTER = "confirm_character"
+    CREATE_CHARACTER_SHEET = "create_character_sheet"
+    CREATION_COMPLETE = "creation_complete"
+
+    # Random character creation states.
+    RANDOM_CHARACTER = "random_character"
+    SET_RANDOM_MONEY = "set_random_money"
+    CREATE_RANDOM_CHARACTER_SHEET = "create_random_character_sheet"
+    NAME_RANDOM_CHARACTER = "name_random_character"
+
+    # Character sheet states.
+    CHARACTER_SHEET = "character_sheet"
+    SHEET_CONFIRMATION = "sheet_confirmation"
+
+
+INITIAL_STATE: State = State.TITLE_SCREEN
+# State every other state has to be able to return to, see 'validate_state_graph()'.
+HUB_STATE: State = State.MAIN_MENU
+
+
+class StateNode:
+    """Node of the state graph."""
+
+    def __init__(self, handler: Callable, transitions: tuple[State, ...], on_enter: Callable | None = None,
+                 on_exit: Callable | None = None) -> None:
+        """Initialize state node.
+        ARGS:
+            handler: function called once per frame while the state is active. Takes 'screen', 'state' and 'mouse_pos'
+                and returns the next state.
+            transitions: states the handler is allowed to return besides the state itself.
+            on_enter: optional function taking 'screen', called once when the state is entered. Default is 'None'.
+            on_exit: optional function taking 'screen', called once when the state is left. Default is 'None'.
+        """
+        self.handler: Callable = handler
+        self.transitions: frozenset[State] = frozenset(transitions)
+        self.on_enter: Callable | None = on_enter
+        self.on_exit: Callable | None = on_exit
+
+
+def get_reachable_states(graph: dict[State, StateNode], start: State) -> set[State]:
+    """Return all states reachable from 'start' via declared transitions, including 'start'.
+    ARGS:
+        graph: state graph.
+        start: state to start from.
+    RETURNS:
+        set of reachable states.
+    """
+    reachable: set[State] = {start}
+    pending: list[State] = [start]
+
+    while pending:
+        state: State = pending.pop()
+        for next_state in graph[state].transitions if state in graph else ():
+            if next_state not in reachable:
+                reachable.add(next_state)
+                pending.append(next_state)
+
+    return reachable
+
+
+def validate_state_graph(graph: dict[State, StateNode]) -> list[str]:
+    """Check state graph for undeclared, missing, unreachable and dead states.
+    ARGS:
+        graph: state graph.
+    RETURNS:
+        list of problem messages. Empty if there are none.
+    """
+    problems: list[str] = []
+
+    for state in State:
+        if state not in graph:
+            problems.append(f"'{state}' has no handler.")
+
+    for state, node in graph.items():
+        for next_state in node.transitions:
+            if next_state not in graph:
+                problems.append(f"'{state}' has transition to undeclared state '{next_state}'.")
+
+    reachable: set[State] = get_reachable_states(graph, INITIAL_STATE)
+    for state in graph:
+        if state not in reachable:
+            problems.append(f"'{state}' is unreachable from '{INITIAL_STATE}'.")
+        elif HUB_STATE not in get_reachable_states(graph, state):
+            problems.append(f"'{state}' is a dead state, '{HUB_STATE}' can't be reached from it.")
+
+    return problems
+
+
+def main() -> None:
+    """Validate state graph from 'core/state_manager.py' and print report."""
+    from .state_manager import STATE_GRAPH
+
+    problems: list[str] = validate_state_graph(STATE_GRAPH)
+    transition_count: int = sum(len(node.transitions) for node in STATE_GRAPH.values())
+    print(f"{len(STATE_GRAPH)} states, {transition_count} transitions.")
+
+    for problem in problems:
+        print(problem)
+
+    if problems:
+        sys.exit(1)
+
+    print("No problems found.")
+
+
+if __name__ == "__main__":
+    main()
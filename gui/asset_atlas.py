@@ -0,0 +1,244 @@
+"""
+Pre-scaled asset atlases for the art assets in 'gui/art/'.
+
+For each supported window size ('settings.small_screen', 'settings.medium_screen', 'settings.large_screen') all images in
+'ATLAS_ASSETS' are scaled once at build time and written as raw pixel data into a single file
+'atlas_<width>x<height>.bin' in 'ATLAS_DIR'. Each image is zlib compressed separately, so images can be decoded
+independently. The manifest 'manifest.json' holds file offset, compressed length, size and pixel format of each image.
+At runtime 'load_images()' (called in 'initialize_ui_registry()' in 'gui/ui_registry.py') only reads the atlas for the
+active window size, so there is no PNG decoding and no scaling of background images at start or after a window size
+change. If no atlas exists for the window size (i.e. fullscreen or atlas not baked), images are loaded from their PNG
+files and scaled the same way as during baking.
+Loading is split into 'decode_images()', which doesn't touch the window and can run on a background thread (see
+'gui/preload.py'), and 'convert_images()', which converts images to the window's pixel format on the main thread.
+
+Baking is done from 'build_linux.spec'/'build_win.spec' before the executable is built, or manually from project root:
+    python -m gui.asset_atlas [--sizes small_screen medium_screen large_screen]
+NOTE: atlases are not updated automatically. Run the command again after changing any image in 'ATLAS_ASSETS'.
+"""
+import os
+import json
+import zlib
+import argparse
+from typing import Callable
+
+import pygame
+
+from core.settings import settings
+
+
+# Version of atlas format. Atlases with a different version in the manifest are ignored.
+ATLAS_VERSION: int = 2
+ATLAS_DIR: str = "gui/art/atlas"
+MANIFEST_FILE: str = "manifest.json"
+# Window size attributes in 'Settings' atlases are baked for by default.
+ATLAS_SIZES: tuple[str, ...] = ("small_screen", "medium_screen", "large_screen")
+
+# Images as dict with names as keys and tuples of file path and scaling mode as values. Scaling modes:
+#   "screen": scaled to window size. Opaque, stored without alpha channel.
+#   "fit": scaled down (never up) to fit into window, keeping aspect ratio.
+#   "source": kept at source size. Used for images that are drawn larger than the window (see 'CharacterSheet').
+ATLAS_ASSETS: dict[str, tuple[str, str]] = {
+    "background_image": ("gui/art/background.png", "screen"),
+    "title_background_image": ("gui/art/title_background.png", "screen"),
+    "wood_image": ("gui/art/wood.png", "source"),
+    "wood_ornate_image": ("gui/art/wood_ornate.png", "fit"),
+    "parchment_image_00": ("gui/art/parchment01.png", "fit"),
+    "parchment_image_01": ("gui/art/parchment02.png", "fit"),
+    "parchment_image_02": ("gui/art/parchment03.png", "fit"),
+}
+# Images needed to show the title screen. When assets are preloaded, only these are loaded before the first frame (see
+# 'gui/preload.py').
+TITLE_SCREEN_IMAGES: tuple[str, ...] = ("title_background_image", "wood_image", "wood_ornate_image")
+
+# Images converted last via 'convert_images()' by name, for screen objects that need an image outside the UI registry
+# (see 'get_image()').
+loaded_images: dict[str, pygame.Surface] = {}
+
+
+def get_size_key(screen_size: tuple[int, int]) -> str:
+    """Return manifest key for 'screen_size', i.e. '1280x720'."""
+    return f"{screen_size[0]}x{screen_size[1]}"
+
+
+def prepare_image(image: pygame.Surface, mode: str, screen_size: tuple[int, int]) -> pygame.Surface:
+    """Scale image according to its scaling mode (see 'ATLAS_ASSETS').
+    ARGS:
+        image: image surface loaded from file.
+        mode: scaling mode "screen", "fit" or "source".
+        screen_size: window size to scale for.
+    RETURNS:
+        scaled image surface.
+    """
+    if mode == "screen":
+        return pygame.transform.smoothscale(image, screen_size)
+
+    if mode == "fit":
+        factor: float = min(1.0, screen_size[0] / image.get_width(), screen_size[1] / image.get_height())
+        if factor < 1.0:
+            return pygame.transform.smoothscale(image, (round(image.get_width() * factor),
+                                                        round(image.get_height() * factor)))
+
+    return image
+
+
+"""Baking atlases."""
+
+def bake_atlas(screen_size: tuple[int, int]) -> dict:
+    """Scale all images for 'screen_size' and write them to atlas file in 'ATLAS_DIR'.
+    ARGS:
+        screen_size: window size to bake atlas for.
+    RETURNS:
+        manifest entry for atlas with file name and regions.
+    """
+    file_name: str = f"atlas_{get_size_key(screen_size)}.bin"
+    regions: dict[str, dict] = {}
+    offset: int = 0
+
+    with open(os.path.join(ATLAS_DIR, file_name), "wb") as f:
+        for name, (path, mode) in ATLAS_ASSETS.items():
+            image: pygame.Surface = prepare_image(pygame.image.load(path), mode, screen_size)
+            pixel_format: str = "RGB" if mode == "screen" else "RGBA"
+            data: bytes = zlib.compress(pygame.image.tobytes(image, pixel_format))
+
+            regions[name] = {"offset": offset, "length": len(data), "size": list(image.get_size()),
+                             "format": pixel_format}
+            f.write(data)
+            offset += len(data)
+
+    return {"file": file_name, "regions": regions}
+
+
+def bake_atlases(size_attributes: tuple[str, ...] | list[str] = ATLAS_SIZES) -> None:
+    """Bake atlases for window sizes and write manifest.
+    ARGS:
+        size_attributes: names of window size attributes in 'Settings'. Default is 'ATLAS_SIZES'.
+    """
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    manifest: dict = {"version": ATLAS_VERSION, "atlases": {}}
+
+    for size_attribute in size_attributes:
+        screen_size: tuple[int, int] = getattr(settings, size_attribute)
+        manifest["atlases"][get_size_key(screen_size)] = bake_atlas(screen_size)
+        print(f"Baked atlas for {size_attribute} {get_size_key(screen_size)}.")
+
+    with open(os.path.join(ATLAS_DIR, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+"""Loading images at runtime."""
+
+def get_atlas_entry(screen_size: tuple[int, int]) -> dict | None:
+    """Return manifest entry of atlas for 'screen_size', or 'None' if there is no valid atlas.
+    ARGS:
+        screen_size: active window size.
+    RETURNS:
+        manifest entry with file name and regions, or 'None'.
+    """
+    try:
+        with open(settings.get_resource_path(os.path.join(ATLAS_DIR, MANIFEST_FILE)), encoding="utf-8") as f:
+            manifest: dict = json.load(f)
+        entry: dict = manifest["atlases"][get_size_key(screen_size)]
+    except (OSError, KeyError, ValueError):
+        return None
+
+    if manifest.get("version") != ATLAS_VERSION or set(entry["regions"]) != set(ATLAS_ASSETS):
+        return None
+
+    return entry
+
+
+def decode_images(screen_size: tuple[int, int], names: tuple[str, ...] | list[str],
+                  progress: Callable | None = None) -> dict[str, pygame.Surface]:
+    """Decode images from atlas for 'screen_size' if available, else from PNG files. Images are not converted to the
+    window's pixel format (see 'convert_images()'), so this function is safe to call from a background thread.
+    ARGS:
+        screen_size: active window size.
+        names: image names from 'ATLAS_ASSETS'.
+        progress: optional callable called with '(done, total)' in images after each decoded image.
+    RETURNS:
+        dict with image names as keys and unconverted image surfaces as values.
+    """
+    entry: dict | None = get_atlas_entry(screen_size)
+    images: dict[str, pygame.Surface] = {}
+
+    if entry:
+        try:
+            with open(settings.get_resource_path(os.path.join(ATLAS_DIR, entry["file"])), "rb") as f:
+                for name in names:
+                    region: dict = entry["regions"][name]
+                    f.seek(region["offset"])
+                    data: bytes = zlib.decompress(f.read(region["length"]))
+                    images[name] = pygame.image.frombytes(data, tuple(region["size"]), region["format"])
+                    if progress:
+                        progress(len(images), len(names))
+            return images
+
+        except (OSError, zlib.error, ValueError):
+            # Damaged atlas, fall back to image files.
+            images.clear()
+
+    for name in names:
+        path, mode = ATLAS_ASSETS[name]
+        images[name] = prepare_image(pygame.image.load(settings.get_resource_path(path)), mode, screen_size)
+        if progress:
+            progress(len(images), len(names))
+
+    return images
+
+
+def convert_images(images: dict[str, pygame.Surface]) -> dict[str, pygame.Surface]:
+    """Convert decoded images to the window's pixel format for fast blitting and add them to 'loaded_images'. Window
+    has to be created before.
+    ARGS:
+        images: dict with image names from 'ATLAS_ASSETS' as keys and image surfaces from 'decode_images()' as values.
+    RETURNS:
+        dict with image names as keys and converted image surfaces as values.
+    """
+    converted: dict[str, pygame.Surface] = {}
+
+    for name, image in images.items():
+        converted[name] = image.convert() if ATLAS_ASSETS[name][1] == "screen" else image.convert_alpha()
+
+    loaded_images.update(converted)
+
+    return converted
+
+
+def load_images(screen_size: tuple[int, int], names: tuple[str, ...] | list[str] = tuple(ATLAS_ASSETS)) \
+        -> dict[str, pygame.Surface]:
+    """Decode and convert images for 'screen_size'.
+    ARGS:
+        screen_size: active window size.
+        names: image names from 'ATLAS_ASSETS'. Default is all images.
+    RETURNS:
+        dict with image names as keys and image surfaces as values.
+    """
+    return convert_images(decode_images(screen_size, names))
+
+
+def get_image(name: str) -> pygame.Surface:
+    """Return image loaded for the current screen size, or load it from its PNG file if no images are loaded yet.
+    ARGS:
+        name: image name from 'ATLAS_ASSETS'.
+    RETURNS:
+        image surface.
+    """
+    if name not in loaded_images:
+        return pygame.image.load(settings.get_resource_path(ATLAS_ASSETS[name][0]))
+
+    return loaded_images[name]
+
+
+def main() -> None:
+    """Parse command line arguments and bake atlases."""
+    parser = argparse.ArgumentParser(description="Bake pre-scaled asset atlases for supported window sizes.")
+    parser.add_argument("--sizes", nargs="+", choices=ATLAS_SIZES, default=list(ATLAS_SIZES),
+                        help="window sizes to bake atlases for (default: all)")
+    args = parser.parse_args()
+
+    bake_atlases(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
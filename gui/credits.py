@@ -6,6 +6,7 @@ from core.settings import settings
 from .screen_objects import TextField
 from .ui_helpers import draw_screen_title
 from .shared_data import ui_shared_data as uisd
+from .tween import tween_scheduler
 
 
 class Credits:
@@ -43,15 +44,49 @@ class Credits:
                                                                           (art_ui_title, art_ui_name),
                                                                           (font_creator_title, font_creator_name))
 
-        self.fading_speed: int = int(7 * (30 / settings.frame_rate))
+        # Scrolling speed in pixels per second and distance in pixels over which credits fade out at the top of the
+        # screen.
+        self.scroll_speed: float = self.screen_rect.height / 10
+        self.fade_distance: float = self.screen_rect.height / 8
+
+        self.start_scrolling()
+
+    def start_scrolling(self) -> None:
+        """Start tween scrolling credits from the bottom of the screen until the last credited name has left the top of
+        the screen (see 'gui/tween.py'). Scrolling starts over again once finished."""
+        self.credits_pos_y_start = self.screen_rect.bottom + 5
+        # Y-position of first element when the last one has fully left the screen.
+        pos_y_end: int = self.screen_rect.top - self.get_credits_height()
+
+        tween_scheduler.start(self, "credits_pos_y_start", pos_y_end,
+                              (self.credits_pos_y_start - pos_y_end) / self.scroll_speed, on_complete=self.start_scrolling)
+
+    def get_credits_height(self) -> int:
+        """Return height of credits from top of the first element to bottom of the last one, as positioned in
+        'show_credits()'.
+        RETURNS:
+            height in pixels.
+        """
+        height: int = 0
+
+        for category in self.credits_elements:
+            height += sum(item.text_rect.height for item in category[:-1]) + self.category_spacing
+
+        # Spacing after last category isn't part of the credits, the last credited name is.
+        return int(height - self.category_spacing + self.credits_elements[-1][-1].text_rect.height)
+
+    def on_exit(self) -> None:
+        """Stop scrolling once the credits screen is left. Called from 'update_screen_lifecycles()' in
+        'core/state_manager.py'."""
+        tween_scheduler.cancel(self, "credits_pos_y_start")
 
     def show_credits(self, screen) -> None:
         """Position and draw credits on screen.
         ARGS:
             screen: PyGame window.
         """
-
         draw_screen_title(screen, self.credits_title)
+        self.dynamic_pos_y = self.credits_pos_y_start
 
         for category in self.credits_elements:
             for item in category:
@@ -69,33 +104,17 @@ class Credits:
 
                 item.draw_text()
 
-        self.dynamic_credits_position()
-
-    def dynamic_credits_position(self) -> None:
-        """Dynamically change position of credits elements for scrolling effect.
-        """
-        # Change starting y-position for each frame and set new starting value for dynamically changed y-position to
-        # make text move across the screen.
-        self.credits_pos_y_start -= self.screen_rect.height / 300
-        self.dynamic_pos_y = self.credits_pos_y_start
-
-        # Reset y-positions when last credit left top of the screen to start over again from the bottom.
-        if self.credits_elements[-1][-1].text_rect.bottom <= self.screen_rect.top:
-            self.credits_pos_y_start = self.screen_rect.bottom + 5
-            self.dynamic_pos_y = self.credits_pos_y_start
-
     def fade_out_credits(self, item: TextField) -> None:
-        """Fade out credits item when it reaches top of the screen, then reset alpha transparency to opaque when it has
-        fully left the screen.
+        """Fade out credits item based on its position once it reaches the top quarter of the screen, so it is fully
+        transparent after moving up by 'self.fade_distance'. Items below the top quarter are opaque, ensuring they are
+        opaque again when they reappear at the bottom.
         ARGS:
             item: 'TextField' instance.
         """
-        # Set item transparency based on position on screen for fade-out effect.
-        if item.text_rect.top <= self.screen_rect.height / 4 and not item.text_rect.bottom <= self.screen_rect.top:
-            item.text_surface.set_alpha(item.background_alpha)
-            item.background_alpha -= self.fading_speed
-        # Reset transparency when the item has fully left the top of the screen, ensuring it is opaque when it
-        # reappears at the bottom.
-        elif item.background_alpha != 255:
-            item.background_alpha = 255
+        fade_start: float = self.screen_rect.height / 4
+        alpha: int = int(255 * (item.text_rect.top - (fade_start - self.fade_distance)) / self.fade_distance)
+        alpha = max(0, min(alpha, 255))
+
+        if item.background_alpha != alpha:
+            item.background_alpha = alpha
             item.text_surface.set_alpha(item.background_alpha)
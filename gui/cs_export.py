@@ -0,0 +1,376 @@
+"""
+Headless export of character sheets to PNG files or a single multi-page PDF file, independent of the main program loop.
+
+Character sheets are drawn onto an off-screen surface using SDL's dummy video driver, so no window is opened. Input is
+either a save file as written by the save/load screen (see 'core/save_file.py') or a JSONL file with one serialized
+character (see 'serialize()' in 'core/character_model.py') per line. Save files from earlier versions are read as well,
+but unlike in the save/load screen never converted, so exporting leaves the save file untouched.
+
+Batch export runs on a process pool. Each worker process initializes pygame and the UI registry only once (see
+'init_export()'), so fonts (see 'get_font()' in 'gui/screen_objects.py') and scaled art are reused for every sheet it
+renders. The number of sheets handed to the pool at any time is limited, so even very large batches are never read
+into memory as a whole.
+
+PDF export writes one character sheet per page while the batch is rendered (see class 'PdfStreamWriter'), so only the
+pages currently in flight are held in memory no matter how many sheets are exported. Pages are embedded as JPEG images
+of the rendered sheets, with all text drawn in the bundled font from 'settings.font'. Use a larger sheet size for print
+quality, as the sheet layout scales with it.
+
+Usage from project root:
+    python -m gui.cs_export <save file or .jsonl file> [-f png|pdf] [-o OUTPUT] [-s WIDTHxHEIGHT] [-w WORKERS]
+"""
+import os
+import io
+import re
+import json
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Iterator
+
+# Use SDL's dummy video driver unless a driver is set explicitly. Has to be set before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from core.settings import settings
+from core.character_model import Character
+import core.save_file as save_file
+
+from .cs_model import CharacterSheet
+from .shared_data import ui_shared_data as uisd
+from .ui_registry import initialize_ui_registry
+
+
+# Number of sheets handed to the process pool per worker before waiting for results.
+JOBS_PER_WORKER: int = 2
+# Default sheet sizes for each export format as 'WIDTHxHEIGHT' string.
+DEFAULT_SIZES: dict[str, str] = {"png": "1280x720", "pdf": "2560x1440"}
+# Page width in PDF units (1/72 inch), page height follows aspect ratio of the sheet. Equals width of landscape A4.
+PDF_PAGE_WIDTH: int = 842
+
+
+class PdfStreamWriter:
+    """Write a PDF file page by page. Each page is written to file as soon as it is added, only object offsets and page
+    IDs are kept in memory until the cross-reference table is written in 'close()'."""
+
+    def __init__(self, file_path: str) -> None:
+        """Open PDF file and write header.
+        ARGS:
+            file_path: path for PDF file.
+        """
+        self.file = open(file_path, "wb")
+        # Byte offset for each object in file, index is object ID - 1.
+        self.offsets: list[int] = []
+        self.page_ids: list[int] = []
+
+        self.file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        # Reserve IDs 1 and 2 for catalog and page tree, which are written last in 'close()'.
+        self.offsets += [0, 0]
+
+    def add_object(self, body: bytes, object_id: int = 0) -> int:
+        """Write PDF object to file.
+        ARGS:
+            body: object content.
+            object_id: ID for reserved objects. Default is '0' for a new ID.
+        RETURNS:
+            object_id
+        """
+        if not object_id:
+            self.offsets.append(0)
+            object_id = len(self.offsets)
+
+        self.offsets[object_id - 1] = self.file.tell()
+        self.file.write(f"{object_id} 0 obj\n".encode() + body + b"\nendobj\n")
+
+        return object_id
+
+    def add_stream(self, dictionary: str, data: bytes) -> int:
+        """Write PDF stream object to file.
+        ARGS:
+            dictionary: stream dictionary entries without '/Length'.
+            data: stream data.
+        RETURNS:
+            object ID.
+        """
+        header: bytes = f"<< {dictionary} /Length {len(data)} >>\nstream\n".encode()
+        return self.add_object(header + data + b"\nendstream")
+
+    def add_jpeg_page(self, jpeg: bytes, image_size: tuple[int, int]) -> None:
+        """Write new page showing a JPEG image across the entire page.
+        ARGS:
+            jpeg: JPEG file data.
+            image_size: size of image in pixels as tuple '(width, height)'.
+        """
+        width, height = image_size
+        page_height: float = round(PDF_PAGE_WIDTH * height / width, 2)
+
+        image_id: int = self.add_stream(f"/Type /XObject /Subtype /Image /Width {width} /Height {height} "
+                                        f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode", jpeg)
+        content_id: int = self.add_stream("", f"q {PDF_PAGE_WIDTH} 0 0 {page_height} 0 0 cm /Sheet Do Q".encode())
+        page_id: int = self.add_object(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PDF_PAGE_WIDTH} {page_height}] "
+                                       f"/Resources << /XObject << /Sheet {image_id} 0 R >> >> "
+                                       f"/Contents {content_id} 0 R >>".encode())
+        self.page_ids.append(page_id)
+
+    def close(self) -> None:
+        """Write page tree, catalog, cross-reference table and trailer, and close file."""
+        kids: str = " ".join(f"{page_id} 0 R" for page_id in self.page_ids)
+        self.add_object(f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>".encode(), 2)
+        self.add_object(b"<< /Type /Catalog /Pages 2 0 R >>", 1)
+
+        xref_offset: int = self.file.tell()
+        self.file.write(f"xref\n0 {len(self.offsets) + 1}\n0000000000 65535 f \n".encode())
+        for offset in self.offsets:
+            self.file.write(f"{offset:010d} 00000 n \n".encode())
+        self.file.write(f"trailer\n<< /Size {len(self.offsets) + 1} /Root 1 0 R >>\n"
+                        f"startxref\n{xref_offset}\n%%EOF\n".encode())
+
+        self.file.close()
+
+
+def init_export(screen_size: tuple[int, int]) -> None:
+    """Initialize pygame and UI registry for headless rendering. Called once per worker process.
+    ARGS:
+        screen_size: size of rendered character sheets as tuple '(width, height)'.
+    """
+    pygame.init()
+    settings.set_default()
+    settings.screen_size = screen_size
+    # Every sheet in a batch is rendered only once, so cached layouts would never be reused.
+    settings.cs_layout_cache_size = 0
+    # Images in UI registry are converted for the display format, so a (hidden) display surface is still needed.
+    screen = pygame.display.set_mode(screen_size)
+    uisd.ui_registry = initialize_ui_registry(screen)
+
+
+def render_character_sheet(data: dict[str, Any]) -> pygame.Surface:
+    """Draw character sheet for serialized character onto a new off-screen surface.
+    ARGS:
+        data: serialized character dict.
+    RETURNS:
+        surface with character sheet.
+    """
+    character: Character = Character()
+    character.deserialize(data)
+
+    surface: pygame.Surface = pygame.Surface(settings.screen_size)
+    surface.blit(uisd.ui_registry["background_image"], (0, 0))
+
+    cs_sheet: CharacterSheet = CharacterSheet(surface, character)
+    cs_sheet.position_cs_elements()
+    cs_sheet.draw_static_elements()
+
+    return surface
+
+
+def export_character_sheet(data: dict[str, Any], file_path: str) -> str:
+    """Render character sheet for serialized character and save it as PNG file. Worker function for the process pool.
+    ARGS:
+        data: serialized character dict.
+        file_path: path for PNG file.
+    RETURNS:
+        file_path
+    """
+    pygame.image.save(render_character_sheet(data), file_path)
+    return file_path
+
+
+def render_jpeg_page(data: dict[str, Any]) -> bytes:
+    """Render character sheet for serialized character and return it as JPEG data. Worker function for the process
+    pool.
+    ARGS:
+        data: serialized character dict.
+    RETURNS:
+        JPEG file data.
+    """
+    jpeg: io.BytesIO = io.BytesIO()
+    pygame.image.save(render_character_sheet(data), jpeg, "sheet.jpg")
+    jpeg_data: bytes = jpeg.getvalue()
+    # Pygame keeps a reference to file objects it saved to, so the buffer has to be released explicitly.
+    jpeg.close()
+
+    return jpeg_data
+
+
+def read_characters(file_path: str) -> Iterator[dict[str, Any]]:
+    """Yield serialized characters from save file or JSONL file one by one. Empty save slots and blank lines are
+    skipped. The file is only read, save files from earlier versions are not converted.
+    ARGS:
+        file_path: path to save file or JSONL file.
+    YIELDS:
+        serialized character dict.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        first_line: str = f.readline()
+
+    try:
+        first_record: Any = json.loads(first_line)
+    except json.JSONDecodeError:
+        first_record = None
+
+    # Save files from earlier versions are a single JSON object with full records for all slots, written either in one
+    # line or indented.
+    is_legacy_save_file: bool = ((isinstance(first_record, dict) and bool(first_record.keys() & save_file.DATA.keys()))
+                                 or (first_record is None and first_line.strip() == "{"))
+
+    if isinstance(first_record, dict) and "summaries" in first_record:
+        # Slot records follow the header line, one per line.
+        with open(file_path, encoding="utf-8") as f:
+            f.readline()
+            for line in f:
+                if line.strip():
+                    for data in json.loads(line).values():
+                        if data:
+                            yield data
+
+    elif is_legacy_save_file:
+        with open(file_path, encoding="utf-8") as f:
+            slots: dict[str, Any] = json.load(f)
+
+        for slot_id in save_file.DATA:
+            if slots.get(slot_id):
+                yield slots[slot_id]
+
+    else:
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def get_sheet_file_name(index: int, data: dict[str, Any]) -> str:
+    """Return PNG file name for character sheet, i.e. '0007_Thorin_Dwarf_Fighter.png'.
+    ARGS:
+        index: position of character in batch.
+        data: serialized character dict.
+    RETURNS:
+        file name string.
+    """
+    name: str = "_".join(str(data.get(key) or "") for key in save_file.SUMMARY_KEYS)
+    name = re.sub(r"[^\w\-]+", "_", name).strip("_")
+
+    return f"{index:04d}_{name}.png"
+
+
+def export_batch(file_path: str, output_dir: str, screen_size: tuple[int, int], workers: int) -> int:
+    """Export character sheets for all characters in a save file or JSONL file as PNG files.
+    ARGS:
+        file_path: path to save file or JSONL file.
+        output_dir: directory for PNG files. Created if it doesn't exist.
+        screen_size: size of rendered character sheets as tuple '(width, height)'.
+        workers: number of worker processes.
+    RETURNS:
+        number of exported character sheets.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    exported: int = 0
+    pending: set[Future] = set()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_export, initargs=(screen_size,)) as pool:
+        for index, data in enumerate(read_characters(file_path)):
+            sheet_path: str = os.path.join(output_dir, get_sheet_file_name(index, data))
+            pending.add(pool.submit(export_character_sheet, data, sheet_path))
+
+            # Wait for results before submitting more sheets once the pool is saturated.
+            if len(pending) >= workers * JOBS_PER_WORKER:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                exported += count_exported(finished)
+
+        exported += count_exported(wait(pending).done)
+
+    return exported
+
+
+def export_pdf(file_path: str, output_path: str, screen_size: tuple[int, int], workers: int) -> int:
+    """Export character sheets for all characters in a save file or JSONL file into a single PDF file, one sheet per
+    page. Pages are written in input order as soon as they are rendered.
+    ARGS:
+        file_path: path to save file or JSONL file.
+        output_path: path for PDF file.
+        screen_size: size of rendered character sheets as tuple '(width, height)'.
+        workers: number of worker processes.
+    RETURNS:
+        number of exported character sheets.
+    """
+    pdf: PdfStreamWriter = PdfStreamWriter(output_path)
+    exported: int = 0
+    pending: deque[Future] = deque()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_export, initargs=(screen_size,)) as pool:
+            for data in read_characters(file_path):
+                pending.append(pool.submit(render_jpeg_page, data))
+
+                # Write oldest page first to keep input order once the pool is saturated.
+                if len(pending) >= workers * JOBS_PER_WORKER:
+                    exported += write_pdf_page(pdf, pending.popleft(), screen_size)
+
+            while pending:
+                exported += write_pdf_page(pdf, pending.popleft(), screen_size)
+    finally:
+        pdf.close()
+
+    return exported
+
+
+def write_pdf_page(pdf: PdfStreamWriter, future: Future, screen_size: tuple[int, int]) -> int:
+    """Wait for rendered page and add it to PDF file. Print error if page could not be rendered.
+    ARGS:
+        pdf: instance of class 'PdfStreamWriter'.
+        future: future from 'export_pdf()' returning JPEG data.
+        screen_size: size of rendered character sheets as tuple '(width, height)'.
+    RETURNS:
+        '1' if page was added, else '0'.
+    """
+    if future.exception():
+        print(f"\n\tCharacter sheet could not be exported: {future.exception()}")
+        return 0
+
+    pdf.add_jpeg_page(future.result(), screen_size)
+    return 1
+
+
+def count_exported(futures: set[Future]) -> int:
+    """Print errors of finished export jobs and return number of successfully exported sheets.
+    ARGS:
+        futures: set of finished futures from 'export_batch()'.
+    RETURNS:
+        number of successful jobs.
+    """
+    exported: int = 0
+
+    for future in futures:
+        if future.exception():
+            print(f"\n\tCharacter sheet could not be exported: {future.exception()}")
+        else:
+            exported += 1
+
+    return exported
+
+
+def main() -> None:
+    """Parse command line arguments and run batch export."""
+    parser = argparse.ArgumentParser(description="Export character sheets as PNG files or a multi-page PDF file.")
+    parser.add_argument("file", help="save file or JSONL file with one serialized character per line")
+    parser.add_argument("-f", "--format", choices=("png", "pdf"), default="png", help="export format")
+    parser.add_argument("-o", "--output", help="output directory for PNG files or path for PDF file")
+    parser.add_argument("-s", "--size", help="sheet size as WIDTHxHEIGHT")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    args = parser.parse_args()
+
+    size: str = args.size or DEFAULT_SIZES[args.format]
+    width, height = (int(value) for value in size.lower().split("x"))
+    workers: int = max(args.workers, 1)
+
+    if args.format == "pdf":
+        output: str = args.output or "character_sheets.pdf"
+        exported: int = export_pdf(args.file, output, (width, height), workers)
+    else:
+        output: str = args.output or "character_sheets"
+        exported: int = export_batch(args.file, output, (width, height), workers)
+
+    print(f"{exported} character sheet(s) exported to '{output}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,16 @@
 Helper class to organize and access character sheet objects as attributes.
 """
 import random
+from typing import Callable, Iterator
+
 import pygame
 
 from core.character_model import Character
 from core.shared_data import shared_data
+from core.settings import settings
 from core.rules import CLASS_CATEGORIES, ABILITIES, SAVING_THROWS
 
-from .screen_objects import TextField, Button
+from .screen_objects import TextField, Button, scale_image
 from .ui_helpers import draw_screen_title, draw_single_element_background_image, draw_image
 from .shared_data import ui_shared_data as uisd
 
@@ -16,12 +19,23 @@ from .shared_data import ui_shared_data as uisd
 class CharacterSheet:
     """A class to store and manage character sheet elements."""
 
-    def __init__(self, screen) -> None:
+    # Cache for computed character sheet layouts, shared by all instances. Keys are tuples of character hash, screen
+    # size and 'settings.smooth_scaling', values are dicts as created in 'store_layout()'. Oldest entries are removed
+    # once the cache holds more than 'settings.cs_layout_cache_size' entries.
+    layout_cache: dict[tuple[str, tuple[int, int], bool], dict] = {}
+    # Cache for scaled character sheet background images with screen size and 'settings.smooth_scaling' as key, as the
+    # scaling method depends on the performance profile.
+    sheet_bg_cache: dict[tuple[tuple[int, int], bool], pygame.Surface] = {}
+
+    def __init__(self, screen, character: Character | None = None) -> None:
         """Initialize the CharacterSheet object with elements.
         ARGS:
-            screen: PyGame window.
+            screen: PyGame window or any other surface the sheet is drawn on (see 'gui/cs_export.py').
+            character: instance of class 'Character' shown on sheet. Default is 'None' for 'shared_data.character'.
         """
-        self.character: Character = shared_data.character
+        self.character: Character = character if character else shared_data.character
+        # Hash of character values the sheet is built with. See 'is_up_to_date()'.
+        self.character_hash: str = self.character.content_hash()
 
         self.screen = screen
         self.screen_rect: pygame.Rect = screen.get_rect()
@@ -31,9 +45,7 @@ class CharacterSheet:
         # Size attributes.
         self.edge_spacing: int = uisd.ui_registry["default_edge_spacing"]
         text_medium: int = uisd.ui_registry["text_medium"]
-        self.text_standard: int = int(self.screen_height / 50)
-        text_large: int = int(self.screen_height / 45)
-        title_size: int = int(self.screen_height / 35)
+        self.text_standard, text_large, title_size = self.get_font_sizes(self.screen_height)
         self.max_line_length: int = int(self.screen_width / 3)  # Maximum length (width) for text fields before line break.
 
         # Units of measurement used on character sheet.
@@ -344,22 +356,39 @@ class CharacterSheet:
         # sideways. Just switch flag to 'True' and tweak everything via 'draw_custom_backgrounds()'.
         self.manual_bg_flag: bool = False
 
+        # Surface holding the fully drawn character sheet without buttons, see 'show_character_sheet_screen()'. Redrawn
+        # only when 'self.character.revision' differs from 'self.composite_revision'.
+        self.composite_surface: pygame.Surface | None = None
+        self.composite_revision: int = -1
+        # Set to 'True' while background images and composite surface are released, see 'on_exit()'.
+        self.released: bool = False
+
 
     """Main methods to position/display character sheet. Called from function 'character_sheet_state_manager()' in
     'core/state_manager.py'."""
 
     def show_character_sheet_screen(self, mouse_pos) -> None:
-        """Draw character sheet elements on screen.
+        """Draw character sheet elements on screen. All non-interactive elements are drawn only once and stored in
+        'self.composite_surface', which is then blitted every frame until the character changes.
         ARGS:
             mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
         """
-        self.draw_cs_background()
+        if not self.composite_surface or self.composite_revision != self.character.revision:
+            self.draw_static_elements()
+            self.composite_surface = self.screen.copy()
+            self.composite_revision = self.character.revision
+        else:
+            self.screen.blit(self.composite_surface, (0, 0))
 
-        draw_screen_title(self.screen, self.title)
         for button in self.button_group:
             draw_single_element_background_image(self.screen, button, "wood")
             button.draw_button(mouse_pos)
 
+    def draw_static_elements(self) -> None:
+        """Draw all character sheet elements except buttons on screen."""
+        self.draw_cs_background()
+        draw_screen_title(self.screen, self.title)
+
         for group in (self.basic_info_group_0, self.basic_info_group_1):
             for field in group:
                 field.draw_text()
@@ -379,8 +408,151 @@ class CharacterSheet:
 
     def position_cs_elements(self) -> None:
         """Position character sheet elements on screen."""
-        valinor: tuple[int, int] = (-9999, self.screen_rect.centery)  # Off-screen position for unused elements based on race/class.
-                                                                      # Can only be reached by sailing the 'Straight Road'.
+        for step in self.get_position_steps():
+            step()
+
+    def get_position_steps(self) -> tuple[Callable, ...]:
+        """Return methods which position all character sheet elements when called in order. Allows for the character
+        sheet to be built step by step, see function 'build_character_sheet()' at the bottom of this module.
+        If a layout for the same character values and screen size is found in 'CharacterSheet.layout_cache', it is
+        applied instead of computing the layout again.
+        RETURNS:
+            tuple of methods.
+        """
+        if self.manual_bg_flag:
+            return (self.position_anchors_and_buttons, self.position_ability_scores, self.position_saving_throws,
+                    self.position_weight_carrying_capacity, self.position_weapon, self.position_race_class_elements,
+                    self.position_specials, self.position_class_specials, self.position_inventory,
+                    self.position_spells, self.draw_custom_backgrounds)
+
+        if self.get_layout_key() in CharacterSheet.layout_cache:
+            return (self.apply_cached_layout, )
+
+        # Get dict with background image surfaces and rects for each group on character sheet and store the computed
+        # layout in cache afterward.
+        return (self.position_anchors_and_buttons, self.position_ability_scores, self.position_saving_throws,
+                self.position_weight_carrying_capacity, self.position_weapon, self.position_race_class_elements,
+                self.position_specials, self.position_class_specials, self.position_inventory, self.position_spells,
+                self.get_groups_backgrounds_dict, self.store_layout)
+
+    def is_up_to_date(self) -> bool:
+        """Check if character values have changed since the character sheet was built.
+        RETURNS:
+            'True' if sheet shows the current character values, else 'False'.
+        """
+        return self.character is shared_data.character and self.character_hash == self.character.content_hash()
+
+
+    """Screen lifecycle methods. Called from 'update_screen_lifecycles()' in 'core/state_manager.py' when the character
+    sheet states are left or entered."""
+
+    def on_exit(self) -> None:
+        """Release composite surface and background images while the character sheet isn't shown. The sheet itself is
+        kept, as its 'is_saved' attribute is still used on the save/load screen."""
+        self.composite_surface = None
+        self.composite_revision = -1
+        self.sheet_bg_image_surface = None
+        self.groups_bg_images = {}
+        self.released = True
+
+    def on_enter(self) -> None:
+        """Restore background images released in 'on_exit()' from 'CharacterSheet.sheet_bg_cache' and
+        'CharacterSheet.layout_cache', or compute them again if the layout has been removed from the cache in the
+        meantime. The composite surface is redrawn with the next call of 'show_character_sheet_screen()'."""
+        if not self.released:
+            return
+
+        self.sheet_bg_image_surface, self.sheet_bg_image_rect = self.get_and_format_sheet_background()
+
+        if not self.manual_bg_flag:
+            layout: dict | None = CharacterSheet.layout_cache.pop(self.get_layout_key(), None)
+
+            if layout:
+                # Re-insert entry to mark it as most recently used.
+                CharacterSheet.layout_cache[self.get_layout_key()] = layout
+                self.groups_bg_images = layout["groups_bg_images"].copy()
+            else:
+                self.get_groups_backgrounds_dict()
+                self.store_layout()
+
+        self.released = False
+
+
+    """Helper methods for use within this class.
+    
+    Each section of the character sheet has its own dedicated methods for formatting, positioning, and drawing. 
+    Some of these methods may be similar or even identical, but they've been kept separate for the sake of clarity and
+    easier future modification of individual sections."""
+
+    """Methods for caching of computed character sheet layouts."""
+
+    def get_layout_key(self) -> tuple[str, tuple[int, int], bool]:
+        """Return key for 'CharacterSheet.layout_cache' based on character values, screen size and scaling method of
+        group background images.
+        RETURNS:
+            tuple of character hash, screen size and 'settings.smooth_scaling'.
+        """
+        return self.character_hash, self.screen_rect.size, settings.smooth_scaling
+
+    def get_layout_fields(self) -> tuple[TextField, ...]:
+        """Return all text fields positioned via 'position_cs_elements()' in fixed order. Dynamically modified fields
+        (i.e. 'self.spell') are not included as they are positioned via their Y-position lists when drawn.
+        RETURNS:
+            tuple of TextField instances.
+        """
+        fields: tuple[TextField, ...] = (self.abilities, self.saving_throws, self.special_abilities, self.spells,
+                                         self.class_specials, self.carrying_cap, self.inventory, self.money,
+                                         self.weapon_label, self.armor_label, self.armor_header_ac, self.armor_char,
+                                         self.armor_char_ac, self.shield_char, self.shield_char_ac)
+        fields += self.basic_info_group_0 + self.basic_info_group_1 + self.weapon_header_group + self.weapon_group
+
+        for array in (self.ability_groups, self.saving_throw_groups, self.weight_group):
+            fields += self.get_section_from_array(array)
+
+        return fields
+
+    def store_layout(self) -> None:
+        """Store computed layout (texts and rects of all positioned fields, Y-position lists for dynamic fields and
+        group background images) in 'CharacterSheet.layout_cache'. Remove the oldest entry if cache is full."""
+        layout: dict = {
+            "fields": tuple((field.text, field.text_rect.copy()) for field in self.get_layout_fields()),
+            "specials_pos_y_list": self.specials_pos_y_list.copy(),
+            "class_special_pos_y_list": self.class_special_pos_y_list.copy(),
+            "inventory_pos_y_list": self.inventory_pos_y_list.copy(),
+            "spell_pos_y_list": self.spell_pos_y_list.copy(),
+            "groups_bg_images": self.groups_bg_images.copy(),
+        }
+
+        CharacterSheet.layout_cache[self.get_layout_key()] = layout
+
+        while len(CharacterSheet.layout_cache) > settings.cs_layout_cache_size:
+            del CharacterSheet.layout_cache[next(iter(CharacterSheet.layout_cache))]
+
+    def apply_cached_layout(self) -> None:
+        """Apply layout from 'CharacterSheet.layout_cache' to character sheet elements. Fields are only re-rendered if
+        their text was formatted while the layout was computed (i.e. '+' for ability score bonuses)."""
+        layout: dict = CharacterSheet.layout_cache.pop(self.get_layout_key())
+        # Re-insert entry to mark it as most recently used.
+        CharacterSheet.layout_cache[self.get_layout_key()] = layout
+
+        self.position_anchors_and_buttons()
+
+        for field, (text, rect) in zip(self.get_layout_fields(), layout["fields"]):
+            if field.text != text:
+                field.text = text
+                field.render_new_text_surface()
+            field.text_rect = rect.copy()
+
+        self.specials_pos_y_list = layout["specials_pos_y_list"].copy()
+        self.class_special_pos_y_list = layout["class_special_pos_y_list"].copy()
+        self.inventory_pos_y_list = layout["inventory_pos_y_list"].copy()
+        self.spell_pos_y_list = layout["spell_pos_y_list"].copy()
+        self.groups_bg_images = layout["groups_bg_images"].copy()
+
+    """Helper methods for positioning."""
+
+    def position_anchors_and_buttons(self) -> None:
+        """Position anchor elements and screen buttons."""
         self.position_anchors()
 
         self.main_menu_button.button_rect.bottomright = (self.screen_rect.right - self.edge_spacing,
@@ -388,11 +560,10 @@ class CharacterSheet:
         self.save_load_button.button_rect.bottomleft = (self.screen_rect.left + self.edge_spacing,
                                                         self.screen_rect.bottom - self.edge_spacing)
 
-        self.position_ability_scores()
-        self.position_saving_throws()
-        self.position_weight_carrying_capacity()
-        self.position_weapon()
-
+    def position_race_class_elements(self) -> None:
+        """Position armor elements and move anchor objects off-screen if irrelevant for character race/class."""
+        valinor: tuple[int, int] = (-9999, self.screen_rect.centery)  # Off-screen position for unused elements based on race/class.
+                                                                      # Can only be reached by sailing the 'Straight Road'.
         # Move anchor objects to Valinor if irrelevant for character race/class.
         if self.character.class_name not in CLASS_CATEGORIES["spell_using_classes"]:
             self.spells.text_rect.center = valinor
@@ -403,26 +574,24 @@ class CharacterSheet:
         else:
             self.armor_label.text_rect.center = valinor
 
+    def position_specials(self) -> None:
+        """Get Y-positions for special abilities elements."""
         self.specials_pos_y_list: list[int] = self.get_position_dynamic_field(self.special_ability, self.character.race_specials,
                                                                               self.special_abilities, text_prefix=" - ")
+
+    def position_class_specials(self) -> None:
+        """Get Y-positions for class specials elements."""
         self.class_special_pos_y_list: list[int] = self.get_position_dynamic_field(self.class_special, self.character.class_specials,
                                                                                    self.class_specials)
+
+    def position_inventory(self) -> None:
+        """Get Y-positions for inventory elements."""
         self.inventory_pos_y_list: list[object] = self.get_position_dynamic_field(self.inventory_item, self.inventory_item_list,
                                                                                   self.inventory)
-        self.spell_pos_y_list: list[int] = self.get_position_dynamic_field(self.spell, self.character.spells, self.spells)
 
-        if not self.manual_bg_flag:
-            # Get dict with background image surfaces and rects for each group on character sheet.
-            self.get_groups_backgrounds_dict()
-        else:
-            self.draw_custom_backgrounds()
-
-
-    """Helper methods for use within this class.
-    
-    Each section of the character sheet has its own dedicated methods for formatting, positioning, and drawing. 
-    Some of these methods may be similar or even identical, but they've been kept separate for the sake of clarity and
-    easier future modification of individual sections."""
+    def position_spells(self) -> None:
+        """Get Y-positions for spell elements."""
+        self.spell_pos_y_list: list[int] = self.get_position_dynamic_field(self.spell, self.character.spells, self.spells)
 
     def position_anchors(self) -> None:
         """Assign screen positions to elements in 'self.screen_grid_array' based on their grid index.
@@ -664,6 +833,16 @@ class CharacterSheet:
 
         return languages_str
 
+    @staticmethod
+    def get_font_sizes(screen_height: int) -> tuple[int, int, int]:
+        """Return font sizes used on the character sheet. Also used to open fonts in advance in 'gui/preload.py'.
+        ARGS:
+            screen_height: height of the surface the sheet is drawn on.
+        RETURNS:
+            tuple of font sizes for standard text, large text and sheet title.
+        """
+        return int(screen_height / 50), int(screen_height / 45), int(screen_height / 35)
+
     @staticmethod
     def position_first_group_element(index: int, group: tuple[TextField, ...],
                                      array: tuple[tuple[TextField, ...], ...], anchor: TextField) -> None:
@@ -721,13 +900,6 @@ class CharacterSheet:
             # overwritten with the newly calculated 'pos_y'.
             pos_y_list.append(field_object.text_rect.height)
 
-            # Create object with default values to hard reset 'field_object'. Quick and dirty fix for 'field_object'
-            # refusing to be reset any other way if 'multi_line' is 'True'.
-            if field_object.multi_line:
-                default_object: TextField = TextField(self.screen, "", self.text_standard, multi_line=True,
-                                                      surface_width=self.max_line_length)
-                field_object: TextField = default_object
-
         return pos_y_list
 
     @staticmethod
@@ -1002,7 +1174,11 @@ class CharacterSheet:
         height: float = self.screen_height * height_mult
         center: tuple[int, int] = self.screen_rect.center
 
-        sheet_bg_image_surface = pygame.transform.scale(self.sheet_bg_type, (width, height))
+        key: tuple[tuple[int, int], bool] = (self.screen_rect.size, settings.smooth_scaling)
+        if key not in CharacterSheet.sheet_bg_cache:
+            CharacterSheet.sheet_bg_cache[key] = scale_image(self.sheet_bg_type, (width, height))
+
+        sheet_bg_image_surface: pygame.Surface = CharacterSheet.sheet_bg_cache[key]
         sheet_bg_image_rect: pygame.Rect = sheet_bg_image_surface.get_rect(center=center)
 
         return sheet_bg_image_surface, sheet_bg_image_rect
@@ -1037,7 +1213,7 @@ class CharacterSheet:
         center: tuple[int, int] = ((group_left + (group_width // 2)), (group_top + (group_height // 2)))
 
         image = pygame.Surface.copy(random_selected_image)
-        image_surface = pygame.transform.scale(image, (image_width, image_height))
+        image_surface = scale_image(image, (image_width, image_height))
         image_rect = image_surface.get_rect(center=center)
 
         return image_surface, image_rect
@@ -1049,3 +1225,27 @@ class CharacterSheet:
         # Example/template for use of 'draw_image()'.
         draw_image(self.screen, image_type="parchment", width=150, height=100, center=(300, 200), parchment=0)
         draw_image(self.screen, image_type="wood", width=75, height=50, center=(300, 200))
+
+
+def build_character_sheet(screen) -> Iterator[tuple[int, int]]:
+    """Build and position character sheet for current character step by step and store it in 'shared_data.cs_sheet'
+    once it is finished. Used as progress source for the progress bar in states 'create_character_sheet' and
+    'create_random_character_sheet' (see 'core/state_manager.py').
+    ARGS:
+        screen: PyGame window.
+    YIELDS:
+        '(done, total)' tuple after each step.
+    """
+    cs_sheet: CharacterSheet = CharacterSheet(screen)
+    steps: tuple[Callable, ...] = cs_sheet.get_position_steps()
+    total: int = len(steps) + 1
+
+    yield 1, total
+
+    for done, step in enumerate(steps, start=2):
+        step()
+
+        if done == total:
+            shared_data.cs_sheet = cs_sheet
+
+        yield done, total
@@ -0,0 +1,74 @@
+"""
+Debug overlay showing frame metrics collected by 'frame_metrics' (see 'core/metrics.py').
+Only instance of class 'DebugOverlay', 'debug_overlay', is created at the bottom of this module and used in
+'run_character_creator()' in 'main.py'.
+
+Keys (checked once per frame, independent of event handling in 'core/event_handlers.py'):
+    F3: toggle overlay and frame metrics collection.
+    F4: write collected frame metrics to CSV file 'settings.metrics_file'.
+"""
+import pygame
+
+from core.metrics import frame_metrics
+from core.settings import settings
+
+from .screen_objects import get_font
+from .tween import tween_scheduler
+
+
+class DebugOverlay:
+    """Draw frame metrics for the last frame in the top left corner of the screen."""
+
+    def __init__(self) -> None:
+        """Initialize key states for toggling overlay."""
+        # Key states from previous frame to register key presses only once.
+        self.toggle_key_down: bool = False
+        self.dump_key_down: bool = False
+
+    def handle_keys(self) -> None:
+        """Toggle overlay or write CSV file when the corresponding key is pressed."""
+        keys = pygame.key.get_pressed()
+
+        if keys[pygame.K_F3] and not self.toggle_key_down:
+            frame_metrics.toggle()
+        if keys[pygame.K_F4] and not self.dump_key_down:
+            frame_metrics.dump_csv(settings.metrics_file)
+
+        self.toggle_key_down, self.dump_key_down = keys[pygame.K_F3], keys[pygame.K_F4]
+
+    def draw(self, screen, clock: pygame.time.Clock) -> None:
+        """Draw metrics of the last recorded frame on screen.
+        ARGS:
+            screen: PyGame window.
+            clock: pygame clock from main loop. Used for FPS.
+        """
+        record: dict | None = frame_metrics.get_last_record()
+        if not frame_metrics.enabled or not record:
+            return
+
+        font: pygame.font.Font = get_font(int(screen.get_height() / 50))
+        budget_ms: float = 1000 / settings.frame_rate
+        lines: tuple[str, ...] = (
+            f"FPS: {clock.get_fps():.1f}",
+            f"Frame: {record['frame_ms']:.2f} ms / {budget_ms:.1f} ms",
+            f"State: {record['state']}",
+            f"{record['state_manager'] or '-'}: {record['state_manager_ms']:.2f} ms",
+            f"Blits: {record['blits']}  Scales: {record['scales']}  Renders: {record['renders']}",
+            f"Tweens: {len(tween_scheduler.tweens)}",
+        )
+
+        # Text color switches to warning color if frame exceeds frame rate budget.
+        text_color: tuple[int, int, int] = settings.light_text_color if record["frame_ms"] <= budget_ms \
+            else settings.inactive_continue_button_hover_color
+        line_height: int = font.get_linesize()
+        padding: int = int(line_height / 2)
+
+        panel: pygame.Surface = pygame.Surface((int(screen.get_width() / 3), line_height * len(lines) + padding * 2))
+        panel.set_alpha(200)
+        screen.blit(panel, (0, 0))
+
+        for index, line in enumerate(lines):
+            screen.blit(font.render(line, True, text_color), (padding, padding + index * line_height))
+
+
+debug_overlay: DebugOverlay = DebugOverlay()
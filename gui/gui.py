@@ -258,11 +258,10 @@ def show_created_character_confirmation_screen(screen, mouse_pos) -> None:
 
 
 def show_building_character_sheet_screen(screen) -> None:
-    """Show screen with character sheet creation 'progress'.
-    Honestly it's not much more than a ProgressBar instance that does absolutely nothing except looking busy...
-    seriously! There is no actual process running in the background. But that's the spot in the program where the user
-    should get the impression that something is processed, so like in any office job: look busy when the boss is
-    watching ;)
+    """Show screen with character sheet creation progress.
+    The progress bar is driven by 'build_character_sheet()' in 'gui/cs_model.py', which builds the character sheet step
+    by step, so the bar is finished as soon as the sheet is. Set 'settings.cosmetic_progress_bars' to 'True' if you
+    still want it to look busy like in any office job when the boss is watching ;)
     ARGS:
         screen: PyGame window.
     """
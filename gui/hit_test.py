@@ -0,0 +1,125 @@
+"""
+Spatial hit-test index for interactive screen elements.
+
+Screens with lists of selectable options (race/class, spell and language selection, window sizes on the settings screen,
+character slots on the save/load screen) build a 'HitTestGrid' for these options when the screen is positioned, and store
+it in 'uisd.hit_test_grids' via 'set_hit_test_grid()'. The grid divides the window into square cells of
+'settings.hit_test_cell_size' pixels and lists each element in all cells its rect overlaps, so resolving the element under
+the mouse only checks the few elements of a single cell instead of every option on screen.
+Event handlers in 'core/event_handlers.py' resolve the clicked option via 'get_element_at()' and dispatch to it directly.
+For drawing, the option under the mouse is resolved once per frame from the grids of the current state via
+'update_hovered_element()', and options compare themselves with it instead of checking their own rects (see
+'TextField.is_hovered()' in 'gui/screen_objects.py'). Elements in no grid, i.e. fixed buttons, check their rects directly.
+
+NOTE: grids are built from the element rects at the time the screen is positioned. Screens that move their elements
+afterward have to call 'set_hit_test_grid()' again. Grids are dropped when the UI registry is re-initialized after a
+window size or performance profile change (see 'SettingsGUI.reinitialize_ui_registry()' in 'gui/settings_gui.py').
+"""
+from typing import Any, Iterable
+
+import pygame
+
+from core.settings import settings
+
+from .screen_objects import InteractiveText
+from .shared_data import ui_shared_data as uisd
+
+
+def get_hit_rect(element: Any) -> pygame.Rect:
+    """Return rect used for mouse collision of 'element'.
+    ARGS:
+        element: instance of 'InteractiveText' or 'Button'.
+    RETURNS:
+        'interactive_rect' for 'InteractiveText', 'button_rect' for 'Button'.
+    """
+    if isinstance(element, InteractiveText):
+        return element.interactive_rect
+
+    return element.button_rect
+
+
+class HitTestGrid:
+    """Uniform grid of screen elements for fast lookup of the element at a given position."""
+
+    def __init__(self, elements: Iterable[Any], cell_size: int) -> None:
+        """Initialize grid and add 'elements' to all cells their rects overlap.
+        ARGS:
+            elements: instances of 'InteractiveText' or 'Button'. Elements added later are treated as drawn on top of
+                earlier ones if rects overlap.
+            cell_size: width and height of grid cells in pixels.
+        """
+        self.cell_size: int = max(int(cell_size), 1)
+        # Dict with cell coordinates as keys and lists of tuples of rect and element as values.
+        self.cells: dict[tuple[int, int], list[tuple[pygame.Rect, Any]]] = {}
+
+        for element in elements:
+            rect: pygame.Rect = get_hit_rect(element)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+
+            for cell_x in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1):
+                for cell_y in range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1):
+                    self.cells.setdefault((cell_x, cell_y), []).append((rect, element))
+
+    def element_at(self, pos: tuple[int, int]) -> Any:
+        """Return topmost element whose rect collides with 'pos', or 'None' if there is none.
+        ARGS:
+            pos: position on screen, i.e. mouse position.
+        RETURNS:
+            element or 'None'.
+        """
+        cell: tuple[int, int] = (pos[0] // self.cell_size, pos[1] // self.cell_size)
+
+        # Rects are checked again as elements may only partially cover the cell.
+        for rect, element in reversed(self.cells.get(cell, ())):
+            if rect.collidepoint(pos):
+                return element
+
+        return None
+
+
+def set_hit_test_grid(key: str, elements: Iterable[Any]) -> None:
+    """Build hit-test grid for 'elements' and store it in 'uisd.hit_test_grids'. Called when a screen is positioned.
+    ARGS:
+        key: name of grid, i.e. "spell_fields".
+        elements: instances of 'InteractiveText' or 'Button'.
+    """
+    elements = tuple(elements)
+    uisd.hit_test_grids[key] = HitTestGrid(elements, settings.hit_test_cell_size)
+
+    for element in elements:
+        element.hit_test_grid = key
+
+
+def get_element_at(key: str, pos: tuple[int, int]) -> Any:
+    """Return element of hit-test grid 'key' at 'pos'.
+    ARGS:
+        key: name of grid as set in 'set_hit_test_grid()'.
+        pos: position on screen, i.e. mouse position.
+    RETURNS:
+        element or 'None' if no element is at 'pos' or grid hasn't been built yet.
+    """
+    grid: HitTestGrid | None = uisd.hit_test_grids.get(key)
+
+    if not grid:
+        return None
+
+    return grid.element_at(pos)
+
+
+def update_hovered_element(grid_keys: tuple[str, ...], mouse_pos) -> None:
+    """Resolve element under the mouse once per frame from the hit-test grids of the current state and store it in
+    'uisd.hovered_element'. Grids that haven't been built yet are skipped, so their elements check their rects directly
+    until they are (see 'TextField.is_hovered()' in 'gui/screen_objects.py').
+    ARGS:
+        grid_keys: names of hit-test grids of the current state (see 'OPTION_GRIDS' in 'core/event_handlers.py').
+        mouse_pos: position of mouse on screen.
+    """
+    uisd.hover_grids = tuple(key for key in grid_keys if key in uisd.hit_test_grids)
+    uisd.hovered_element = None
+
+    for key in uisd.hover_grids:
+        element: Any = get_element_at(key, mouse_pos)
+        if element:
+            uisd.hovered_element = element
+            return
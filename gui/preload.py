@@ -0,0 +1,95 @@
+"""
+Asset preloading while the title screen is shown.
+
+At program start the UI registry is initialized with only the images needed for the title screen (see 'preload'
+argument of 'initialize_ui_registry()' in 'gui/ui_registry.py'). The remaining work is done by 'preload_assets()', which
+is set as progress source for the title screen's progress bar in 'initialize_character_creator()' in 'main.py', so the
+bar shows the real progress and the user can't continue before everything is loaded:
+    - Decoding remaining images from the asset atlas or PNG files on the I/O worker thread (see 'core/io_worker.py').
+    - Converting decoded images and adding them to the UI registry.
+    - Opening fonts for the character sheet.
+    - Rendering text and background images of all info panels (race/class, spell and ability screens).
+Fonts and info panels are handled on the main thread (pygame's font rendering isn't thread-safe), spread over several
+frames so the title screen stays responsive.
+"""
+import time
+from typing import Any, Callable, Iterator
+
+from core.io_worker import io_worker, IOJob
+from core.settings import settings
+
+from .asset_atlas import ATLAS_ASSETS, TITLE_SCREEN_IMAGES, decode_images, convert_images, loaded_images
+from .cs_model import CharacterSheet
+from .screen_objects import InfoPanel, InteractiveText, get_font
+from .shared_data import ui_shared_data as uisd
+from .ui_registry import get_art_asset_entries
+
+
+# Share of a frame (at 'settings.frame_rate') used for main thread steps before the next frame is drawn.
+FRAME_SHARE: float = 0.5
+
+
+def get_info_panels(root: Any, panels: list[InfoPanel]) -> None:
+    """Walk 'root' recursively and add all info panels to 'panels', including panels of 'InteractiveText' instances.
+    ARGS:
+        root: object to walk, i.e. 'ui_registry'.
+        panels: list to add found info panels to. Every panel is only added once.
+    """
+    if isinstance(root, dict):
+        root = tuple(root.values())
+    elif isinstance(root, InteractiveText) and root.panel:
+        root = root.panel
+
+    if isinstance(root, (list, tuple)):
+        for item in root:
+            get_info_panels(item, panels)
+    elif isinstance(root, InfoPanel) and root not in panels:
+        panels.append(root)
+
+
+def preload_assets(screen) -> Iterator[tuple[int, int]]:
+    """Load remaining assets step by step. Used as progress source for the title screen's progress bar.
+    ARGS:
+        screen: PyGame window.
+    YIELDS:
+        '(done, total)' tuple once per frame, counting images, fonts and info panels.
+    """
+    screen_size: tuple[int, int] = screen.get_size()
+    image_names: tuple[str, ...] = tuple(name for name in ATLAS_ASSETS if name not in TITLE_SCREEN_IMAGES)
+    # Job is checked via 'job.done' below. It skips the I/O worker's completion queue, which is only polled while a
+    # save/load screen exists and would keep the decoded images alive until then.
+    job: IOJob = io_worker.submit("preload_images", decode_images, screen_size, image_names, polled=False)
+
+    panels: list[InfoPanel] = []
+    get_info_panels(uisd.ui_registry, panels)
+    steps: list[Callable] = [lambda size=size: get_font(size) for size in CharacterSheet.get_font_sizes(screen_size[1])]
+    steps += [panel.prepare for panel in panels if not panel.prepared]
+    total: int = len(image_names) + len(steps)
+
+    while not job.done:
+        yield job.progress[0], total
+
+    if job.error:
+        # Decode images on the main thread instead, so errors show up as they would without preloading.
+        print(f"Preloading images failed: {job.error}")
+        job.result = decode_images(screen_size, image_names)
+
+    convert_images(job.result)
+    # Decoded images are only needed for conversion.
+    job.result = None
+    uisd.ui_registry.update(get_art_asset_entries(loaded_images))
+    done: int = len(image_names)
+    yield done, total
+
+    frame_budget: float = FRAME_SHARE / settings.frame_rate
+    frame_start: float = time.perf_counter()
+
+    for step in steps:
+        step()
+        done += 1
+
+        if time.perf_counter() - frame_start >= frame_budget:
+            yield done, total
+            frame_start = time.perf_counter()
+
+    yield total, total
@@ -13,11 +13,143 @@ See documentation in relevant modules for details.
 """
 import pygame
 import random
+import queue
 
 from pygame_textinput import TextInputVisualizer
 
 from core.settings import settings
 
+from .asset_atlas import get_image
+from .shared_data import ui_shared_data as uisd
+from .tween import tween_scheduler, linear, ease_out_cubic
+
+# Cache for font objects, see 'get_font()'.
+font_cache: dict[tuple[str, int], pygame.font.Font] = {}
+# Cache for multi-line text layouts, see 'get_text_layout()'.
+text_layout_cache: dict[tuple[str, pygame.font.Font, int, tuple[int, int]], tuple[tuple[tuple[str, int, int], ...], int]] = {}
+# Cache for pre-rendered background surfaces of buttons and interactive text fields, see 'get_state_surface()'.
+state_surface_cache: dict[tuple[tuple[int, int], str | tuple[int, int, int], int, int], pygame.Surface] = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """Return font object for 'settings.font' in given size. The font file is only opened once per size, the returned
+    object is shared by all screen objects using that size.
+    ARGS:
+        size: font size.
+    RETURNS:
+        font object.
+    """
+    key: tuple[str, int] = (settings.font, size)
+
+    if key not in font_cache:
+        font_cache[key] = pygame.font.Font(settings.font, size)
+
+    return font_cache[key]
+
+
+def get_text_layout(text: str, font: pygame.font.Font, width: int, text_pos: tuple[int, int]) \
+        -> tuple[tuple[tuple[str, int, int], ...], int]:
+    """Return layout for multi-line text, i.e. position of each word and total height, with line breaks where a word
+    doesn't fit into 'width' and at newlines in 'text'. Words are only measured, not rendered.
+    Layouts are kept in 'text_layout_cache' for up to 'settings.text_layout_cache_size' combinations of arguments, least
+    recently used ones are dropped first.
+    ARGS:
+        text: text string.
+        font: font object used for rendering.
+        width: width of the text surface.
+        text_pos: starting point for text in text surface.
+    RETURNS:
+        tuple of '(word, x, y)' tuples and surface height.
+    """
+    key: tuple[str, pygame.font.Font, int, tuple[int, int]] = (text, font, width, text_pos)
+
+    # Re-insert cached layout to mark it as most recently used.
+    layout = text_layout_cache.pop(key, None)
+    if layout is None:
+        layout = build_text_layout(text, font, width, text_pos)
+        while text_layout_cache and len(text_layout_cache) >= settings.text_layout_cache_size:
+            del text_layout_cache[next(iter(text_layout_cache))]
+    text_layout_cache[key] = layout
+
+    return layout
+
+
+def get_state_surface(size: tuple[int, int], color: str | tuple[int, int, int], border_radius: int = 0,
+                      border_width: int = 0) -> pygame.Surface:
+    """Return surface with a rect in 'color' drawn onto it, used as background for normal, hover, clicked and selected
+    states of buttons and interactive text fields, and for button borders. Surfaces are rendered once and shared by all
+    screen objects of the same size, which only set the surface's alpha value before blitting it.
+    Surfaces are kept in 'state_surface_cache' for up to 'settings.state_surface_cache_size' combinations of arguments,
+    least recently used ones are dropped first.
+    ARGS:
+        size: width and height of surface.
+        color: color of rect.
+        border_radius: radius for rounded corners of rect. Default is '0'.
+        border_width: width of rect border. Default is '0' for a filled rect.
+    RETURNS:
+        surface
+    """
+    key: tuple[tuple[int, int], str | tuple[int, int, int], int, int] = (size, color, border_radius, border_width)
+
+    # Re-insert cached surface to mark it as most recently used.
+    surface: pygame.Surface | None = state_surface_cache.pop(key, None)
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=border_radius, width=border_width)
+        while state_surface_cache and len(state_surface_cache) >= settings.state_surface_cache_size:
+            del state_surface_cache[next(iter(state_surface_cache))]
+    state_surface_cache[key] = surface
+
+    return surface
+
+
+def scale_image(image: pygame.Surface, size: tuple[int | float, int | float]) -> pygame.Surface:
+    """Return 'image' scaled to 'size' for use as background image. Uses 'pygame.transform.smoothscale()' if
+    'settings.smooth_scaling' is 'True', and the faster 'pygame.transform.scale()' otherwise.
+    ARGS:
+        image: image surface.
+        size: width and height of scaled image.
+    RETURNS:
+        scaled image surface.
+    """
+    size: tuple[int, int] = (int(size[0]), int(size[1]))
+
+    # 'smoothscale()' only works with 24 and 32 bit surfaces.
+    if settings.smooth_scaling and image.get_bitsize() in (24, 32):
+        return pygame.transform.smoothscale(image, size)
+
+    return pygame.transform.scale(image, size)
+
+
+def build_text_layout(text: str, font: pygame.font.Font, width: int, text_pos: tuple[int, int]) \
+        -> tuple[tuple[tuple[str, int, int], ...], int]:
+    """Compute layout for multi-line text in a single pass. See 'get_text_layout()' for ARGS and RETURNS."""
+    x, y = text_pos
+    line_height: int = font.get_height()
+    space: int = font.size(" ")[0]
+    height: int = line_height
+    words: list[tuple[str, int, int]] = []
+    lines: list[str] = text.splitlines()
+
+    for line_index, line in enumerate(lines, start=1):
+        for word in line.split(" "):
+            word_width: int = font.size(word)[0]
+
+            if x + word_width >= width:
+                # Word doesn't fit, move to next line.
+                x, y = text_pos[0], y + line_height
+                height += line_height
+
+            words.append((word, x, y))
+            x += word_width + space
+
+        # Check if we are at the last line to avoid addition of empty line at the end.
+        if line_index < len(lines):
+            x, y = text_pos[0], y + line_height
+            height += line_height
+
+    return tuple(words), height
+
 
 class TextField:
     """Represent field of text."""
@@ -52,19 +184,19 @@ class TextField:
             self.text_color: str | tuple[int, int, int] = settings.greyed_out_text_color
         else:
             self.text_color: str | tuple[int, int, int] = text_color
-        self.font: pygame.font.Font = pygame.font.Font(settings.font, self.size)
+        self.font: pygame.font.Font = get_font(self.size)
 
         self.padding: int = int(self.screen_rect.width / 40)
 
         # Get surface for mult-line text field.
         if multi_line:
             self.surface_width: int = surface_width
-            self.surface_height: int = self.font.get_height()  # Starting value for use in 'render_multiline_surface()'
+            self.surface_height: int = self.font.get_height()  # Set to actual height in 'render_multiline_surface()'.
             self.text_pos: tuple[int, int] = text_pos
             self.text_surface: pygame.Surface = self.render_multiline_surface()
         # Get surface for standard, one-line text field.
         else:
-            self.text_surface: pygame.Surface = self.font.render(self.text, True, self.text_color)
+            self.text_surface: pygame.Surface = self.font.render(self.text, settings.antialias, self.text_color)
 
         if self.bg_color:
             self.background_rect: pygame.Rect = self.text_surface.get_rect().inflate(self.padding, self.padding)
@@ -80,7 +212,24 @@ class TextField:
         # not)!
         self.fade_alpha: int = 0
         self.background_alpha: int = 255
-        self.fade_speed: int = int(25 * (30 / settings.frame_rate))
+        # Duration in seconds for a full fade-in/out from 0 to 255 or back, see 'alpha_fade_in()' and 'alpha_fade_out()'.
+        self.fade_time: float = 0.35
+        # Name of hit-test grid holding the field, set in 'set_hit_test_grid()' in 'gui/hit_test.py'. See 'is_hovered()'.
+        self.hit_test_grid: str | None = None
+
+    def is_hovered(self, rect: pygame.Rect, mouse_pos) -> bool:
+        """Check if mouse is over the field. Fields in a hit-test grid of the current state are compared with the
+        element resolved once per frame ('uisd.hovered_element'), others check 'rect' directly.
+        ARGS:
+            rect: rect of the field used for mouse collision.
+            mouse_pos: position of mouse on screen.
+        RETURNS:
+            'True' if mouse is over the field, else 'False'.
+        """
+        if self.hit_test_grid in uisd.hover_grids:
+            return self is uisd.hovered_element
+
+        return rect.collidepoint(mouse_pos)
 
     def draw_text(self) -> None:
         """Draw the text field on the screen."""
@@ -92,62 +241,19 @@ class TextField:
 
     def render_multiline_surface(self) -> pygame.Surface:
         """Render and return multi line text surface.
-        The method splits the text into lines and words, renders each word using the specified font, and dynamically
-        expands the surface height if a word doesn't fit the current line.
+        The layout (line breaks and surface height) is computed from word sizes first (see 'get_text_layout()'), so the
+        surface is created only once in its final size before the words are rendered onto it.
         RETURNS:
             text_surface
         """
+        words, self.surface_height = get_text_layout(self.text, self.font, self.surface_width, self.text_pos)
         text_surface: pygame.Surface = pygame.Surface((self.surface_width, self.surface_height), pygame.SRCALPHA)
 
-        x, y = self.text_pos
-        space = self.font.size(" ")[0]
-        # 2D array, each row is a list of words.
-        words = [word.split(" ") for word in self.text.splitlines()]
-
-        for line_index, line in enumerate(words, start=1):
-            for word in line:
-                # Render each word and check if it fits the current line.
-                word_surface = self.font.render(word, True, self.text_color)
-                word_width = word_surface.get_width()
-
-                if x + word_width >= text_surface.get_width():
-                    # If the word doesn't fit, create more space and move to next line.
-                    text_surface, x, y = self.expand_multiline_surface(text_surface, y)
-
-                # Draw the word and advance horizontal position.
-                text_surface.blit(word_surface, (x, y))
-                x += word_width + space
-
-            # Check if we are at the last line to avoid addition of empty line at the end.
-            if line_index < len(words):
-                text_surface, x, y = self.expand_multiline_surface(text_surface, y)
+        text_surface.blits([(self.font.render(word, settings.antialias, self.text_color), (x, y)) for word, x, y in words if word],
+                           doreturn=False)
 
         return text_surface
 
-    def expand_multiline_surface(self, text_surface: pygame.Surface, y: int) -> tuple[pygame.Surface, int, int]:
-        """Helper function for use in 'render_multiline_surface()' to expand 'text_surface' to accommodate new lines of
-        text automatically through use of a temporary surface.
-        ARGS:
-            text_surface: pygame surface to be expanded for multi-line texts.
-            y: current Y-position of text line.
-        RETURNS:
-            text_surface, x, y: new text surface and coordinates for next line.
-        """
-        x = self.text_pos[0]  # Reset 'x' for next line.
-        y += self.font.get_height()  # Set 'y' for next line.
-
-        # Create a temporary surface to accommodate the new line of text.
-        # The new height is calculated by adding the current surface height to the font height.
-        # Blit the existing text surface onto the temporary surface, then update text_surface to reference the
-        # expanded surface.
-        new_height = self.surface_height + self.font.get_height()
-        temporary_surface = pygame.Surface((self.surface_width, new_height), pygame.SRCALPHA)
-        temporary_surface.blit(text_surface, (0,0))
-        text_surface = temporary_surface
-        self.surface_height = new_height  # Update surface height
-
-        return text_surface, x, y
-
     def render_new_text_surface(self, settings_gui: bool = False) -> None:
         """Re-render 'text_surface' attribute and get new 'text_rect'. This method is for use after an already created
         instance has its 'text' attribute changed to ensure that further changes to, for example, its position are applied
@@ -158,50 +264,44 @@ class TextField:
                           Ignore in all other cases. Default is 'False'.
         """
         if settings_gui:
-            self.font: pygame.font.Font = pygame.font.Font(settings.font, self.size)
+            self.font: pygame.font.Font = get_font(self.size)
 
         if self.multi_line:
             self.text_surface: pygame.Surface = self.render_multiline_surface()
         else:
-            self.text_surface: pygame.Surface = self.font.render(self.text, True, self.text_color)
+            self.text_surface: pygame.Surface = self.font.render(self.text, settings.antialias, self.text_color)
 
         self.text_rect: pygame.Rect = self.text_surface.get_rect()
 
-    def blit_surface(self, surface: pygame.Surface, rect: pygame.Rect, color: str | tuple[int, int, int]) -> None:
-        """Fill 'surface' with 'color' attribute and blit it onto the screen at 'rect'.
+    def blit_surface(self, rect: pygame.Rect, color: str | tuple[int, int, int], alpha: int) -> None:
+        """Blit pre-rendered surface filled with 'color' onto the screen at 'rect'.
         ARGS:
-            surface: pygame surface.
             rect: pygame rect.
             color: color attribute.
+            alpha: alpha transparency value for surface.
         """
-        surface.fill(color)
+        surface: pygame.Surface = get_state_surface(rect.size, color)
+        surface.set_alpha(alpha)
         self.screen.blit(surface, rect)
 
     """Following methods allow for fade-in/out effects for background surfaces on mouse collision in conjunction with
     alpha transparency attribute 'self.fade_alpha'.
     See application in 'Button' and 'InteractiveText' class methods as examples."""
 
-    def alpha_fade_in(self, surface: pygame.Surface) -> None:
-        """Check and set alpha transparency for 'surface', and limit 'self.fade_alpha' value to max of 255. Then apply to
-        'surface' for fade-in effect.
-        For use as effect on mouse hover, method should be called from within an 'if self.rect.collidepoint(mouse_pos)'
+    def alpha_fade_in(self) -> None:
+        """Start tween raising 'self.fade_alpha' to 255 for fade-in effect (see 'gui/tween.py'). The value is applied
+        to the background surface when it is blitted.
+        For use as effect on mouse hover, method should be called from within an 'if self.is_hovered(rect, mouse_pos)'
         statement.
-        ARGS:
-            surface: pygame surface.
         """
-        if self.fade_alpha < 255:
-            self.fade_alpha += self.fade_speed
-            surface.set_alpha(self.fade_alpha)
-        elif self.fade_alpha != 255:
-            self.fade_alpha = 255
-            surface.set_alpha(self.fade_alpha)
-
-    def alpha_fade_out(self, surface: pygame.Surface, rect: pygame.Rect, color: str | tuple[int, int, int], mouse_pos,
-                       button: bool = False, interactive: bool = False) -> None:
-        """Check and set alpha transparency for 'surface', and limit 'self.fade_alpha' value to min of 0. Then apply to
-        'surface' for fade-out effect.
+        fade_time: float = self.fade_time if settings.animations else 0
+        tween_scheduler.start(self, "fade_alpha", 255, fade_time * (255 - self.fade_alpha) / 255)
+
+    def alpha_fade_out(self, rect: pygame.Rect, color: str | tuple[int, int, int], mouse_pos, button: bool = False,
+                       interactive: bool = False) -> None:
+        """Start tween lowering 'self.fade_alpha' to 0 for fade-out effect (see 'gui/tween.py'), and blit background
+        surface in 'color' with the current value until the fade-out is finished.
         ARGS:
-            surface: pygame surface for color fade-out effect to be applied to.
             rect: rect to hold surface position to be blit onto.
             color: color for surface for fade-out effect to be applied to.
             mouse_pos: position of mouse on screen. Handed down by pygame from main loop.
@@ -212,21 +312,21 @@ class TextField:
 
         NOTE: Defaults values for 'button' and 'interactive' are 'False', representing other classes.
         """
-        if not rect.collidepoint(mouse_pos) and self.fade_alpha != 0:
-            if self.fade_alpha >= 0:
-                self.fade_alpha -= self.fade_speed
-                surface.set_alpha(self.fade_alpha)
-
-                if button:
-                    self.blit_button_surface(surface, rect, color)  # type: ignore
-                elif interactive:
-                    self.blit_interactive_surface(surface, rect, color)  # type: ignore
-                else:
-                    self.blit_surface(surface, rect, color)
+        if self.fade_alpha != 0 and not self.is_hovered(rect, mouse_pos):
+            fade_time: float = self.fade_time if settings.animations else 0
+            tween_scheduler.start(self, "fade_alpha", 0, fade_time * self.fade_alpha / 255)
+
+            if button:
+                self.blit_button_surface(rect, color, self.fade_alpha)  # type: ignore
+            elif interactive:
+                self.blit_interactive_surface(rect, color, self.fade_alpha)  # type: ignore
+            else:
+                self.blit_surface(rect, color, self.fade_alpha)
 
-            elif self.fade_alpha != 0:
-                self.fade_alpha = 0
-                surface.set_alpha(self.fade_alpha)
+    def reset_fade_alpha(self) -> None:
+        """Stop running fade and reset 'self.fade_alpha' to 0, i.e. for buttons shared by several screens."""
+        tween_scheduler.cancel(self, "fade_alpha")
+        self.fade_alpha = 0
 
 
 class Button(TextField):
@@ -257,50 +357,41 @@ class Button(TextField):
         self.border_width: int = int(self.border_radius / 3)
         self.border_color: str | tuple[int, int, int] = settings.button_border_color
 
-        # 'None' attribute to store the button surface, created in 'draw_button()', to represent the button background.
-        # This ensures it is only created once when drawn, and after any changes to 'button_rect' size are made in other
-        # functions when 'Button' instance is used.
-        self.button_surface: None | pygame.Surface = None
-
     def draw_button(self, mouse_pos) -> None:
         """Draw the button on the screen, changing color based on hover or click using 'mouse_pos' as initialized in
-        main loop in 'main.py'.
+        main loop in 'main.py'. Background and border are pre-rendered surfaces from 'get_state_surface()', sized to
+        'button_rect' when drawn, so changes to its size made elsewhere are picked up automatically.
         ARGS:
             mouse_pos: position of mouse on screen.
         """
-        if not self.button_surface:
-            self.button_surface = pygame.Surface((self.button_rect.width - self.border_width,
-                                                  self.button_rect.height - self.border_width), pygame.SRCALPHA)
-
-        if self.button_rect.collidepoint(mouse_pos):
-            self.alpha_fade_in(self.button_surface)
-            if pygame.mouse.get_pressed()[0]:
-                self.blit_button_surface(self.button_surface, self.button_rect, self.rect_clicked_color)
+        if self.is_hovered(self.button_rect, mouse_pos):
+            self.alpha_fade_in()
+            if uisd.mouse_pressed:
+                self.blit_button_surface(self.button_rect, self.rect_clicked_color, self.fade_alpha)
             else:
-                self.blit_button_surface(self.button_surface, self.button_rect, self.rect_hover_color)
+                self.blit_button_surface(self.button_rect, self.rect_hover_color, self.fade_alpha)
         elif self.bg_color and self.fade_alpha == 0:
-            self.button_surface.set_alpha(self.background_alpha)
-            self.blit_button_surface(self.button_surface, self.button_rect, self.bg_color)
+            self.blit_button_surface(self.button_rect, self.bg_color, self.background_alpha)
 
-        self.alpha_fade_out(self.button_surface, self.button_rect, self.rect_hover_color, mouse_pos, button=True)
+        self.alpha_fade_out(self.button_rect, self.rect_hover_color, mouse_pos, button=True)
 
         self.text_rect.center = self.button_rect.center
         self.screen.blit(self.text_surface, self.text_rect)
 
-        pygame.draw.rect(self.screen, self.border_color, self.button_rect,
-                         border_radius=self.border_radius, width=self.border_width)
+        self.screen.blit(get_state_surface(self.button_rect.size, self.border_color, self.border_radius,
+                                           self.border_width), self.button_rect)
 
-    def blit_button_surface(self, surface: pygame.Surface, rect: pygame.Rect, color: str | tuple[int, int, int]) -> None:
-        """Fill 'surface' with 'color' and blit it onto the screen at 'rect', ensuring the button's background fits
-        inside the button's borders with rounded corners.
+    def blit_button_surface(self, rect: pygame.Rect, color: str | tuple[int, int, int], alpha: int) -> None:
+        """Blit pre-rendered surface with rounded corners in 'color' onto the screen at 'rect', ensuring the button's
+        background fits inside the button's borders.
         ARGS:
-            surface: pygame surface.
             rect: pygame rect.
             color: color attribute.
+            alpha: alpha transparency value for surface.
         """
-        surface.fill((0, 0, 0, 0))
-
-        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=self.border_radius)
+        surface: pygame.Surface = get_state_surface((rect.width - self.border_width, rect.height - self.border_width),
+                                                    color, self.border_radius)
+        surface.set_alpha(alpha)
         surface_pos: tuple[int, int] = (int(rect.left + self.border_width / 2), int(rect.top + self.border_width / 2))
         self.screen.blit(surface, surface_pos)
 
@@ -338,63 +429,52 @@ class InteractiveText(TextField):
         self.corner_radius: int = int(self.screen_rect.height / 100)
         # Create rect for field to allow for easier positioning of the 'text_rect' if field size is changed later.
         self.interactive_rect: pygame.Rect = self.text_surface.get_rect()
-        # 'None' attribute to store the interactive text surface, created in 'draw_interactive_text()', to represent the
-        # field background. This ensures it is only initialized when drawn, and after any changes to 'interactive_rect'
-        # are made in other functions.
-        self.interactive_text_surface: None | pygame.Surface = None
 
     def draw_interactive_text(self, mouse_pos) -> None:
-        """Draw interactive text field on the screen.
+        """Draw interactive text field on the screen. Backgrounds are pre-rendered surfaces from 'get_state_surface()',
+        sized to 'interactive_rect' when drawn, so changes to its size made elsewhere are picked up automatically.
         ARGS:
             mouse_pos: position of mouse on screen.
         """
-        if not self.interactive_text_surface:
-            self.interactive_text_surface = pygame.Surface((self.interactive_rect.width, self.interactive_rect.height), pygame.SRCALPHA)
-
-        if self.selected or self.bg_color:
-            self.interactive_text_surface.set_alpha(self.background_alpha)
-            if self.selected:
-                self.blit_interactive_surface(self.interactive_text_surface, self.interactive_rect, self.rect_selected_color)
-            elif self.bg_color:
-                self.blit_interactive_surface(self.interactive_text_surface, self.interactive_rect, self.bg_color)
+        if self.selected:
+            self.blit_interactive_surface(self.interactive_rect, self.rect_selected_color, self.background_alpha)
+        elif self.bg_color:
+            self.blit_interactive_surface(self.interactive_rect, self.bg_color, self.background_alpha)
 
-        if self.interactive_rect.collidepoint(mouse_pos):
+        if self.is_hovered(self.interactive_rect, mouse_pos):
             self.handle_mouse_interaction()
 
-        self.alpha_fade_out(self.interactive_text_surface, self.interactive_rect, self.rect_hover_color, mouse_pos,
-                            interactive=True)
+        self.alpha_fade_out(self.interactive_rect, self.rect_hover_color, mouse_pos, interactive=True)
 
         self.text_rect.center = self.interactive_rect.center
         self.screen.blit(self.text_surface, self.text_rect)
 
-    def blit_interactive_surface(self, surface, rect: pygame.Rect, color: str | tuple[int, int, int]) -> None:
-        """Fill 'surface' with 'color' and blit it onto the screen at 'rect' with rounded corners.
+    def blit_interactive_surface(self, rect: pygame.Rect, color: str | tuple[int, int, int], alpha: int) -> None:
+        """Blit pre-rendered surface with rounded corners in 'color' onto the screen at 'rect'.
         ARGS:
-            surface: pygame surface.
             rect: pygame rect.
             color: color attribute.
+            alpha: alpha transparency value for surface.
         """
-        surface.fill((0, 0, 0, 0))
-
-        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=self.corner_radius)
+        surface: pygame.Surface = get_state_surface(rect.size, color, self.corner_radius)
+        surface.set_alpha(alpha)
         self.screen.blit(surface, rect)
 
     def handle_mouse_interaction(self) -> None:
         """Handle interactive functions for the class object.
         NOTE: info panel interactions are handled via method 'handle_mouse_interaction_info_panel()' further down."""
-        self.alpha_fade_in(self.interactive_text_surface)
+        self.alpha_fade_in()
 
-        if self.select and pygame.mouse.get_pressed()[0]:
-            self.blit_interactive_surface(self.interactive_text_surface, self.interactive_rect, self.rect_clicked_color)
+        if self.select and uisd.mouse_pressed:
+            self.blit_interactive_surface(self.interactive_rect, self.rect_clicked_color, self.fade_alpha)
         else:
-            self.blit_interactive_surface(self.interactive_text_surface, self.interactive_rect, self.rect_hover_color)
+            self.blit_interactive_surface(self.interactive_rect, self.rect_hover_color, self.fade_alpha)
 
         if self.select:
-            is_pressed = pygame.mouse.get_pressed()[0]
-            if is_pressed and not self.was_pressed:
+            if uisd.mouse_pressed and not self.was_pressed:
                 self.selected = not self.selected
 
-            self.was_pressed = is_pressed
+            self.was_pressed = uisd.mouse_pressed
         else:
             self.was_pressed = False
 
@@ -411,7 +491,7 @@ class InteractiveText(TextField):
         This method is called from the helper function 'show_info_panels()' in 'gui/ui_helpers.py' to ensure info panels
         are always drawn on top of every other object on screen."""
         if self.panel:
-            if self.interactive_rect.collidepoint(mouse_pos):
+            if self.is_hovered(self.interactive_rect, mouse_pos):
                 for i in self.panel:  # type: ignore
                     i.draw_info_panel(show_panel=True)
             else:
@@ -454,8 +534,19 @@ class InfoPanel(TextField):
                 Default position is 'None', centering the field on the screen. NOTE: 'pos=None' will set 'slide=False'
                 as centered info panels have no sliding animation implemented.
             slide: add function for info panel to 'slide-in/off' the screen. Default is 'True'.
+
+        NOTE: Text and background image are rendered in 'prepare()' when the panel is drawn for the first time, or before
+        that by 'preload_assets()' in 'gui/preload.py' while the title screen is shown.
         """
+        # Arguments for deferred initialization in 'prepare()'.
+        self.init_args: tuple = (screen, text, size, bg_color, text_color, multi_line, surface_width, text_pos, pos, slide)
+        self.prepared: bool = False
+
+    def prepare(self) -> None:
+        """Render text and background image and set starting position of the info panel. See note in '__init__()'."""
+        screen, text, size, bg_color, text_color, multi_line, surface_width, text_pos, pos, slide = self.init_args
         super().__init__(screen, text, size, bg_color, text_color, multi_line, surface_width, text_pos)
+        self.prepared = True
         self.pos: None | str = pos
         # Set 'slide' attribute from default 'True' to 'False' if 'pos=None' argument is passed, equalling a centered
         # info panels which has no sliding animation implemented. Avoids having to pass 'slide=False' manually when
@@ -464,8 +555,7 @@ class InfoPanel(TextField):
             slide = False
 
         # Background image.
-        bg_image_file_path: str = settings.get_resource_path("gui/art/parchment03.png")
-        self.bg_image, self.bg_rect = self.get_bg_image_and_rect(bg_image_file_path)
+        self.bg_image, self.bg_rect = self.get_bg_image_and_rect(get_image("parchment_image_02"))
 
         self.slide: bool = slide
 
@@ -487,22 +577,22 @@ class InfoPanel(TextField):
         if self.pos:
             self.get_bg_rect_position()
 
-        if self.slide:
-            self.initial_speed: dict[str, int] = {"horizontal": int(self.bg_rect.width / 10),
-                                                  "vertical": int(self.bg_rect.height / 10),}
-            self.medium_speed: dict[str, int] = {"horizontal": int(self.bg_rect.width / 25),
-                                                 "vertical": int(self.bg_rect.height / 25),}
-            self.slow_speed: dict[str, int] = {"horizontal": int(self.bg_rect.width / 50),
-                                               "vertical": int(self.bg_rect.height / 50),}
-            # Slide-out speed.
-            self.exit_speed: dict[str, int] = {"horizontal": int(self.bg_rect.width / 7),
-                                               "vertical": int(self.bg_rect.height / 7),}
+        # Durations in seconds for sliding the panel fully onto or off the screen, see 'slide_panel_in()' and
+        # 'slide_panel_out()'.
+        self.slide_in_time: float = 0.8
+        self.slide_out_time: float = 0.25
 
     def draw_info_panel(self, show_panel: bool) -> None:
         """Draw info panel on screen.
         ARGS:
             show_panel: Bool to trigger if object is to be drawn on or moved onto screen, or removed from it.
         """
+        if not self.prepared:
+            # Panel that has never been shown isn't on screen, so there is nothing to slide out.
+            if not show_panel:
+                return
+            self.prepare()
+
         if show_panel:
             if self.slide and self.pos:
                 self.slide_panel_in()
@@ -519,83 +609,53 @@ class InfoPanel(TextField):
                 self.screen.blit(self.text_surface, self.text_rect)
 
     def slide_panel_in(self) -> None:
-        """Animates the info panel sliding onto the screen from its starting edge or corner. The panel moves incrementally
-        based on its 'pos' attribute and dynamically adjusts its speed depending on how far it is from its target. Once
-        the final screen position is reached, it snaps into place to prevent 'overshooting'."""
+        """Animate the info panel sliding onto the screen from its starting edge or corner. The panel starts fast and
+        slows down towards its final screen position (see 'gui/tween.py')."""
         bg_rct: pygame.Rect = self.bg_rect
         sc_rct: pygame.Rect = self.screen_rect
 
-        initial_speed_range = {"horizontal": int(bg_rct.width * 0.5),
-                               "vertical": int(bg_rct.height * 0.5),}  # 50%
-        medium_speed_range = {"horizontal": int(bg_rct.width * 0.75),
-                               "vertical": int(bg_rct.height * 0.75),}  # 75%
-
-        # Area of info panel that is visible on screen.
-        visible_area_top: int = sc_rct.top + bg_rct.bottom
-        visible_area_bottom: int = sc_rct.bottom - bg_rct.top
-        visible_area_left: int = sc_rct.left + bg_rct.right
-        visible_area_right: int = sc_rct.right - bg_rct.left
-
-        if "top" in self.pos and bg_rct.bottom >= sc_rct.top > bg_rct.top:
-            if visible_area_top > medium_speed_range["vertical"]:
-                bg_rct.top += self.slow_speed["vertical"]
-            if medium_speed_range["vertical"] >= visible_area_top > initial_speed_range["vertical"]:
-                bg_rct.top += self.medium_speed["vertical"]
-            if visible_area_top <= initial_speed_range["vertical"]:
-                bg_rct.top += self.initial_speed["vertical"]
-
-            bg_rct.top = min(bg_rct.top, sc_rct.top)
-
-        elif "bottom" in self.pos and bg_rct.top <= sc_rct.bottom < bg_rct.bottom:
-            if visible_area_bottom > medium_speed_range["vertical"]:
-                bg_rct.bottom -= self.slow_speed["vertical"]
-            if medium_speed_range["vertical"] >= visible_area_bottom > initial_speed_range["vertical"]:
-                bg_rct.bottom -= self.medium_speed["vertical"]
-            if visible_area_bottom <= initial_speed_range["vertical"]:
-                bg_rct.bottom -= self.initial_speed["vertical"]
-
-            bg_rct.bottom = max(bg_rct.bottom, sc_rct.bottom)
-
-        if "left" in self.pos and bg_rct.right >= sc_rct.left > bg_rct.left:
-            if visible_area_left > medium_speed_range["horizontal"]:
-                bg_rct.left += self.slow_speed["horizontal"]
-            if medium_speed_range["horizontal"] >= visible_area_left > initial_speed_range["horizontal"]:
-                bg_rct.left += self.medium_speed["horizontal"]
-            if visible_area_left <= initial_speed_range["horizontal"]:
-                bg_rct.left += self.initial_speed["horizontal"]
-
-            bg_rct.left = min(bg_rct.left, sc_rct.left)
-
-        elif "right" in self.pos and bg_rct.left <= sc_rct.right < bg_rct.right:
-            if visible_area_right > medium_speed_range["horizontal"]:
-                bg_rct.right -= self.slow_speed["horizontal"]
-            if medium_speed_range["horizontal"] >= visible_area_right > initial_speed_range["horizontal"]:
-                bg_rct.right -= self.medium_speed["horizontal"]
-            if visible_area_right <= initial_speed_range["horizontal"]:
-                bg_rct.right -= self.initial_speed["horizontal"]
-
-            bg_rct.right = max(bg_rct.right, sc_rct.right)
+        if "top" in self.pos:
+            self.slide_to("y", sc_rct.top, bg_rct.height, self.slide_in_time)
+        elif "bottom" in self.pos:
+            self.slide_to("y", sc_rct.bottom - bg_rct.height, bg_rct.height, self.slide_in_time)
+
+        if "left" in self.pos:
+            self.slide_to("x", sc_rct.left, bg_rct.width, self.slide_in_time)
+        elif "right" in self.pos:
+            self.slide_to("x", sc_rct.right - bg_rct.width, bg_rct.width, self.slide_in_time)
 
     def slide_panel_out(self) -> None:
-        """Animate the info panel sliding off-screen from its on-screen position. The method adjusts the panel's position
-        incrementally based on its 'pos' attribute until it reaches it's original off-screen position.
-        Once the panel reaches its final position, it is snapped into place to prevent 'overshooting'."""
+        """Animate the info panel sliding off-screen from its on-screen position at constant speed until it reaches its
+        original off-screen position."""
         bg_rct: pygame.Rect = self.bg_rect
         sc_rct: pygame.Rect = self.screen_rect
 
-        if "top" in self.pos and bg_rct.bottom > sc_rct.top:
-            bg_rct.bottom -= self.exit_speed["vertical"]
-            bg_rct.bottom = max(bg_rct.bottom, sc_rct.top)
-        elif "bottom" in self.pos and bg_rct.top < sc_rct.bottom:
-            bg_rct.top += self.exit_speed["vertical"]
-            bg_rct.top = min(bg_rct.top, sc_rct.bottom)
+        if "top" in self.pos:
+            self.slide_to("y", sc_rct.top - bg_rct.height, bg_rct.height, self.slide_out_time, slide_in=False)
+        elif "bottom" in self.pos:
+            self.slide_to("y", sc_rct.bottom, bg_rct.height, self.slide_out_time, slide_in=False)
+
+        if "left" in self.pos:
+            self.slide_to("x", sc_rct.left - bg_rct.width, bg_rct.width, self.slide_out_time, slide_in=False)
+        elif "right" in self.pos:
+            self.slide_to("x", sc_rct.right, bg_rct.width, self.slide_out_time, slide_in=False)
 
-        if "left" in self.pos and bg_rct.right > sc_rct.left:
-            bg_rct.right -= self.exit_speed["horizontal"]
-            bg_rct.right = max(bg_rct.right, sc_rct.left)
-        elif "right" in self.pos and bg_rct.left < sc_rct.right:
-            bg_rct.left += self.exit_speed["horizontal"]
-            bg_rct.left = min(bg_rct.left, sc_rct.right)
+    def slide_to(self, axis: str, end: int, distance: int, duration: float, slide_in: bool = True) -> None:
+        """Start tween moving 'self.bg_rect' along one axis. The duration is scaled to the remaining distance, so a
+        slide reversed halfway keeps its speed. Does nothing if the tween is already running or the panel is in place.
+        ARGS:
+            axis: "x" or "y".
+            end: final coordinate for 'axis'.
+            distance: full distance of the slide in pixels, i.e. panel height for vertical slides.
+            duration: duration in seconds for the full distance.
+            slide_in: use easing for slide-in if 'True', constant speed for slide-out if 'False'. Default is 'True'.
+        """
+        remaining: int = abs(end - getattr(self.bg_rect, axis))
+        easing = ease_out_cubic if slide_in else linear
+        if not settings.animations:
+            duration = 0
+
+        tween_scheduler.start(self.bg_rect, axis, end, duration * remaining / max(distance, 1), easing)
 
     def get_bg_rect_position(self) -> None:
         """Set starting info panel positions based on 'self.pos' argument."""
@@ -646,19 +706,17 @@ class InfoPanel(TextField):
             else:
                 self.bg_rect.right = anchor_x
 
-    def get_bg_image_and_rect(self, file) -> tuple:
-        """Create image from file and return 'bg_image' and 'bg_rect'.
+    def get_bg_image_and_rect(self, image: pygame.Surface) -> tuple:
+        """Scale image to panel size and return 'bg_image' and 'bg_rect'.
         ARGS:
-            file: path to image file.
+            image: background image surface (see 'get_image()' in 'gui/asset_atlas.py').
         RETURNS:
             bg_image, bg_rect
         """
-        bg_image_file_path: str = file
-        bg_image_file = pygame.image.load(bg_image_file_path)
         bg_image_width = self.text_rect.width * 1.4
         bg_image_height = self.text_rect.height * 1.8
 
-        bg_image = pygame.transform.scale(bg_image_file, (bg_image_width, bg_image_height))
+        bg_image = scale_image(image, (bg_image_width, bg_image_height))
         bg_rect: pygame.Rect = bg_image.get_rect(center=self.text_rect.center)
 
         return bg_image, bg_rect
@@ -715,9 +773,13 @@ class TextInputField:
 
 
 class ProgressBar:
-    """Represent a visual-only loading progress bar.
-    NOTE: This class creates a progress bar that 'simulates' loading without reflecting actual data processing or task
-    completion. It is purely for visual effect to enhance the user experience."""
+    """Represent a loading progress bar.
+    NOTE: By default, this class creates a progress bar that 'simulates' loading without reflecting actual data
+    processing or task completion. It is purely for visual effect to enhance the user experience.
+    If a progress source is set via 'set_progress_source()', the bar shows the real progress of a task instead and is
+    finished as soon as the task is. See 'create_character_sheet' and 'loading_character' states in
+    'core/state_manager.py' as examples. Simulated progress can be added on top as cosmetic effect via setting
+    'settings.cosmetic_progress_bars'."""
 
     def __init__(self, screen, height: int | float = 30, length: int | float = 3, time: int | float = 5) -> None:
         """Initialize loading progress bar.
@@ -745,9 +807,10 @@ class ProgressBar:
         self.bar_color: str | tuple[int, int, int] = settings.progress_bar_color
 
         # Set starting value for loading 'progress' to 1.
-        self.progress: int = 1
+        self.progress: int | float = 1
 
-        self.speed: int = int(self.progress_bar_length / (time * settings.frame_rate))
+        # Fill speed in pixels per second. Applied with the measured frame time, see 'draw_progress_bar()'.
+        self.speed: float = self.progress_bar_length / time
 
         # Container rect.
         """NOTE: Change coordinates for this rect to position the progress bar as a whole!"""
@@ -762,16 +825,21 @@ class ProgressBar:
         # in 'gui/gui.py' and corresponding event handler for possible applications.
         self.finished: bool = False
 
+        # Source for real progress of a task (see 'set_progress_source()') and progress as fraction between 0 and 1.
+        # Both are 'None' for simulated progress.
+        self.source: object = None
+        self.real_progress: float | None = None
+
         # Attributes ror random speed-up/slow-down events. Used in 'progress_manager()' and 'set_random_progress()'
         # methods further down.
-        self.chance_per_second: float = 0.2  # 0.2% chance of event per frame.
+        self.chance_per_second: float = 6  # Average number of events per second outside of cooldown.
         self.cooldown: bool = False
         self.cooldown_seconds: int | float = time / 2
-        self.cooldown_timer: int = 0
-        self.duration_timer: int = 0  # Timer for duration of event in frames.
+        self.cooldown_timer: float = 0  # Remaining cooldown in seconds.
+        self.duration_timer: float = 0  # Remaining duration of event in seconds.
         # Create 'backup' of set speed to be used for resetting of 'self.speed' if a random speed-up/slow-down event
         # modifies it.
-        self.speed_backup: int = self.speed
+        self.speed_backup: float = self.speed
 
     def draw_progress_bar(self) -> None:
         """Draw progress bar on screen until 'self.progress' value equals the specific value for 'self.length'."""
@@ -783,21 +851,90 @@ class ProgressBar:
         if (container_left != progress_left) or (container_centery != progress_centery):
             self.build_progress_bar()
 
+        self.update_progress()
+
+        if self.real_progress is not None and not settings.cosmetic_progress_bars:
+            self.draw_real_progress()
+            return
+
         if self.progress <= self.progress_bar_length:
             self.progress_manager(mode="trigger")
             pygame.draw.rect(self.screen, self.border_color, self.container_rect, border_radius=self.border_radius,
                              width=self.border_width)
             pygame.draw.rect(self.screen, self.bar_color, self.progress_bar_rect, border_radius=self.inner_border_radius)
-            self.progress += self.speed
-            self.progress_bar_rect.width = self.progress
+            self.progress += self.speed * uisd.frame_time
+            if self.real_progress is not None and self.real_progress < 1:
+                # Cosmetic progress never runs ahead of the real task.
+                self.progress = min(self.progress, int(self.progress_bar_length * self.real_progress))
+            self.progress_bar_rect.width = int(self.progress)
         else:
             self.finished = True
 
         self.progress_manager(mode="reset")
 
+    def set_progress_source(self, source) -> None:
+        """Set source for real progress of a task. The source is checked once per frame in 'draw_progress_bar()' until
+        the bar is reset via 'reset_progress_bar()'.
+        ARGS:
+            source: one of the following:
+                - callable returning a '(done, total)' tuple or a fraction between 0 and 1.
+                - iterator (i.e. a generator doing the actual work step by step) yielding '(done, total)' tuples. It is
+                  advanced by one step per frame and counts as finished once it is exhausted.
+                - 'queue.Queue' instance receiving '(done, total)' tuples, i.e. from another thread.
+                - '(done, total)' tuple for fixed progress.
+        """
+        self.source = source
+
+    def update_progress(self) -> None:
+        """Get current progress from 'self.source' and apply it via 'set_progress()'."""
+        source = self.source
+
+        if source is None:
+            return
+
+        if isinstance(source, tuple):
+            progress = source
+        elif isinstance(source, queue.Queue):
+            # Only the latest progress update in the queue is relevant.
+            progress = None
+            while not source.empty():
+                progress = source.get_nowait()
+            if progress is None:
+                return
+        elif callable(source):
+            progress = source()
+        else:
+            progress = next(source, (1, 1))
+
+        if isinstance(progress, tuple):
+            self.set_progress(*progress)
+        else:
+            self.set_progress(progress, 1)
+
+    def set_progress(self, done: int | float, total: int | float) -> None:
+        """Switch progress bar to real progress and set amount of finished work.
+        ARGS:
+            done: amount of work done.
+            total: total amount of work.
+        """
+        self.real_progress = min(done / total, 1) if total else 1
+
+    def draw_real_progress(self) -> None:
+        """Draw progress bar for real progress as set in 'set_progress()' and set 'self.finished' once the task is
+        done."""
+        self.progress = max(1, int(self.progress_bar_length * self.real_progress))
+        self.progress_bar_rect.width = self.progress
+
+        pygame.draw.rect(self.screen, self.border_color, self.container_rect, border_radius=self.border_radius,
+                         width=self.border_width)
+        pygame.draw.rect(self.screen, self.bar_color, self.progress_bar_rect, border_radius=self.inner_border_radius)
+
+        if self.real_progress >= 1:
+            self.finished = True
+
     def build_progress_bar(self) -> None:
         """Create progress bar rect and position it at the center of the container rect."""
-        self.progress_bar_rect = pygame.Rect(self.center_screen_pos, (self.progress, self.progress_bar_height))
+        self.progress_bar_rect = pygame.Rect(self.center_screen_pos, (int(self.progress), self.progress_bar_height))
         self.progress_bar_rect.left, self.progress_bar_rect.centery = (self.container_rect.left + self.border_width,
                                                                            self.container_rect.centery)
 
@@ -810,20 +947,20 @@ class ProgressBar:
         if mode == "trigger":
             # Only trigger random event if there's no cooldown, event count < 2, and event duration timer is done.
             if not self.cooldown and self.duration_timer <= 0:
-                if random.random() < self.chance_per_second:
+                if random.random() < self.chance_per_second * uisd.frame_time:
                     self.set_random_progress()  # Trigger random event.
                     self.cooldown = True
-                    self.cooldown_timer: int = int(settings.frame_rate * self.cooldown_seconds)
+                    self.cooldown_timer: float = self.cooldown_seconds
 
             if self.duration_timer > 0:
-                self.duration_timer -= 1
+                self.duration_timer -= uisd.frame_time
 
             if self.duration_timer <= 0:
-                self.speed: int = self.speed_backup
+                self.speed: float = self.speed_backup
 
         elif mode == "reset":
             if self.cooldown:
-                self.cooldown_timer -= 1
+                self.cooldown_timer -= uisd.frame_time
                 if self.cooldown_timer <= 0:
                     self.cooldown: bool = False
 
@@ -837,31 +974,29 @@ class ProgressBar:
         speed_up_value_min_max: int | float = random.uniform(2, 3)  # multiplier
         speed_up_duration_min_max: int | float = random.uniform(1, 2)  # seconds
 
-        stop_duration: int = int(settings.frame_rate * stop_duration_min_max)  # frames
+        stop_duration: float = stop_duration_min_max  # seconds
         jump: int = int(self.progress_bar_length / (100 * jump_value_min_max))  # pixels
-        slow: int = int(self.speed * slow_value)  # pixels
-        speed_up: int = int(self.speed * speed_up_value_min_max)  # pixels
+        slow: float = self.speed * slow_value  # pixels per second
+        speed_up: float = self.speed * speed_up_value_min_max  # pixels per second
 
-        events: tuple[tuple[str, int], ...] = (("stop", stop_duration),
-                                               ("jump", jump),
-                                               ("slow", slow),
-                                               ("speed_up", speed_up))
+        events: tuple[tuple[str, int | float], ...] = (("stop", stop_duration),
+                                                       ("jump", jump),
+                                                       ("slow", slow),
+                                                       ("speed_up", speed_up))
 
         event_type, value = random.choice(events)
 
         if event_type == "stop":
-            self.duration_timer: int = stop_duration
-            self.speed: int = 0
+            self.duration_timer: float = stop_duration
+            self.speed: float = 0
         elif event_type == "jump":
             self.progress += jump
         elif event_type == "slow":
-            self.speed: int = slow
-            # Convert duration from seconds to frames and set timer.
-            self.duration_timer: int = int(settings.frame_rate * slow_duration_min_max)
+            self.speed: float = slow
+            self.duration_timer: float = slow_duration_min_max
         elif event_type == "speed_up":
-            self.speed: int = speed_up
-            # Convert duration from seconds to frames and set timer.
-            self.duration_timer: int = int(settings.frame_rate * speed_up_duration_min_max)
+            self.speed: float = speed_up
+            self.duration_timer: float = speed_up_duration_min_max
 
     def reset_progress_bar(self) -> None:
         """Resets progress bar attributes to starting values so instance can be re-reused.
@@ -873,6 +1008,8 @@ class ProgressBar:
         """
         self.progress = 1
         self.finished = False
+        self.source = None
+        self.real_progress = None
         self.speed = self.speed_backup
         self.progress_bar_rect = None
         self.build_progress_bar()
@@ -6,9 +6,11 @@ import pygame
 from core.settings import settings
 
 from .screen_objects import TextField, InteractiveText, Button
-from .ui_helpers import draw_screen_title, draw_single_element_background_image
-from .ui_registry import initialize_ui_registry
+from .ui_helpers import draw_screen_title, draw_single_element_background_image, get_scaled_image
+from .ui_registry import get_ui_registry
 from .shared_data import ui_shared_data as uisd
+from .hit_test import set_hit_test_grid, get_element_at
+from .tween import tween_scheduler
 
 
 class SettingsGUI:
@@ -42,27 +44,61 @@ class SettingsGUI:
         )
         self.size_buttons_list: list[InteractiveText] = [item[0] for item in self.size_settings]
 
-        # Selected window attribute initialized with starting value 'None'. Default value is then assigned when
-        # 'self.get_default_settings()' is called.
+        # Performance profile settings elements.
+        self.performance_field: TextField = TextField(screen, "Performance", self.text_large)
+        profile_button_low: InteractiveText = InteractiveText(screen, "Low", self.text_medium, select=True)
+        profile_button_balanced: InteractiveText = InteractiveText(screen, "Balanced", self.text_medium, select=True)
+        profile_button_high: InteractiveText = InteractiveText(screen, "High", self.text_medium, select=True)
+
+        # Performance profile UI objects and corresponding profile names in 'settings.performance_profiles'.
+        self.profile_settings: tuple[tuple[InteractiveText, str], ...] = (
+            (profile_button_low, "low"),
+            (profile_button_balanced, "balanced"),
+            (profile_button_high, "high")
+        )
+        self.profile_buttons_list: list[InteractiveText] = [item[0] for item in self.profile_settings]
+
+        # Selected window and profile attributes initialized with starting value 'None'. Default values are then assigned
+        # when 'self.get_default_settings()' is called.
         self.selected_window_size: InteractiveText | None = None
+        self.selected_profile: InteractiveText | None = None
 
         # Collection of ALL instances from module 'gui.screen_objects' used in settings screen as created above.
         self.settings_gui_objects: tuple[TextField | InteractiveText, ...] = (self.title, self.window_size_field,
                                                                               window_size_button_small, window_size_button_medium,
-                                                                              window_size_button_large, window_size_button_full)
+                                                                              window_size_button_large, window_size_button_full,
+                                                                              self.performance_field, profile_button_low,
+                                                                              profile_button_balanced, profile_button_high)
 
         self.get_default_settings()
+        # Drop grids of a previous instance, so they're built for this instance's buttons (see
+        # 'format_settings_screen_elements()').
+        uisd.hit_test_grids.pop("window_sizes", None)
+        uisd.hit_test_grids.pop("performance_profiles", None)
+
+    def on_exit(self) -> None:
+        """Release hit-test grids of window size and performance profile buttons while the settings screen isn't shown.
+        They are built again when the screen is drawn next (see 'format_settings_screen_elements()'). Called from
+        'update_screen_lifecycles()' in 'core/state_manager.py'."""
+        uisd.hit_test_grids.pop("window_sizes", None)
+        uisd.hit_test_grids.pop("performance_profiles", None)
 
     def get_default_settings(self) -> None:
-        """Set default settings as defined in 'core.settings.py'."""
+        """Select buttons for active window size and performance profile, as set from 'core.settings.py' defaults or
+        the settings file."""
         size_setting_index: int = 1
         size_button_index: int = 0
 
         for setting in self.size_settings:
-            if setting[size_setting_index] in settings.default_settings:
+            if setting[size_setting_index] == settings.screen_size:
                 self.selected_window_size: InteractiveText = setting[size_button_index]
                 self.selected_window_size.selected = True
 
+        for button, profile in self.profile_settings:
+            if profile == settings.performance_profile:
+                self.selected_profile: InteractiveText = button
+                self.selected_profile.selected = True
+
     def show_settings(self, screen, mouse_pos) -> None:
         """Display settings screen.
             ARGS:
@@ -82,11 +118,11 @@ class SettingsGUI:
         self.window_size_field.draw_text()
 
         for button in self.size_buttons_list:
-            # Reset the surface if it exists and its size doesn't match the rect. Prevents unnecessary reassignments
-            # while ensuring it updates when window size is changed.
-            if button.interactive_text_surface and (button.interactive_text_surface.get_size() != button.interactive_rect.size):  # type: ignore
-                button.interactive_text_surface = None
+            button.draw_interactive_text(mouse_pos)
+
+        self.performance_field.draw_text()
 
+        for button in self.profile_buttons_list:
             button.draw_interactive_text(mouse_pos)
 
     def format_settings_screen_elements(self, screen) -> None:
@@ -100,18 +136,47 @@ class SettingsGUI:
         window_size_large: pygame.Rect = self.size_buttons_list[2].interactive_rect
         window_size_full: pygame.Rect = self.size_buttons_list[3].interactive_rect
 
+        profile_anchor: pygame.Rect = self.profile_buttons_list[0].interactive_rect
+        profile_balanced: pygame.Rect = self.profile_buttons_list[1].interactive_rect
+        profile_high: pygame.Rect = self.profile_buttons_list[2].interactive_rect
+
+        button_width: int = int(screen.get_rect().width / 8)
+        button_height: int = int(screen.get_rect().height / 12)
+
         for button in self.size_buttons_list:
-            button.interactive_rect.width, button.interactive_rect.height = screen.get_rect().width / 8, screen.get_rect().height  / 12
+            button.interactive_rect.width, button.interactive_rect.height = button_width, button_height
+        # Profile buttons share the width of the two window size button columns.
+        for button in self.profile_buttons_list:
+            button.interactive_rect.width, button.interactive_rect.height = int((2 * button_width) / 3), button_height
+
+        # Top of the whole block of window size and profile buttons, so the block is centered vertically.
+        block_top: int = int(screen_y - (3 * button_height + 2 * spacing) / 2)
 
-        self.window_size_field.text_rect.centery = screen_y
-        self.window_size_field.text_rect.right = screen_x - spacing
         # Position selection fields for window sizes. 'window_size_anchor' is placed first as anchor for positioning
         # of further buttons. To move the entire block only the anchor has to be moved.
-        window_size_anchor.left, window_size_anchor.bottom = screen_x + spacing, int(screen_y - spacing / 2)
+        window_size_anchor.left, window_size_anchor.top = screen_x + spacing, block_top
         window_size_medium.left, window_size_medium.bottom = window_size_anchor.right + spacing, window_size_anchor.bottom
         window_size_large.left, window_size_large.top = window_size_anchor.left, window_size_anchor.bottom + spacing
         window_size_full.left, window_size_full.top = window_size_anchor.right + spacing, window_size_anchor.bottom + spacing
 
+        self.window_size_field.text_rect.centery = window_size_anchor.bottom + int(spacing / 2)
+        self.window_size_field.text_rect.right = screen_x - spacing
+
+        # Position selection fields for performance profiles below window sizes, same as above.
+        profile_anchor.left, profile_anchor.top = window_size_anchor.left, window_size_large.bottom + spacing
+        profile_balanced.left, profile_balanced.top = profile_anchor.right + int(spacing / 2), profile_anchor.top
+        profile_high.right, profile_high.top = window_size_full.right, profile_anchor.top
+
+        self.performance_field.text_rect.centery = profile_anchor.centery
+        self.performance_field.text_rect.right = screen_x - spacing
+
+        # Positions only change with window size or profile, which drop all hit-test grids (see
+        # 'reinitialize_ui_registry()').
+        if "window_sizes" not in uisd.hit_test_grids:
+            set_hit_test_grid("window_sizes", self.size_buttons_list)
+        if "performance_profiles" not in uisd.hit_test_grids:
+            set_hit_test_grid("performance_profiles", self.profile_buttons_list)
+
     @staticmethod
     def format_position_element_background(screen) -> None:
         """Format, position and draw element background on screen.
@@ -120,7 +185,7 @@ class SettingsGUI:
         """
         bg_image_width = screen.get_rect().width / 1.2
         bg_image_height = screen.get_rect().height / 2
-        bg_image = pygame.transform.scale(uisd.ui_registry["parchment_images"][0], (bg_image_width, bg_image_height))
+        bg_image = get_scaled_image(uisd.ui_registry["parchment_images"][0], bg_image_width, bg_image_height)
         bg_rect = bg_image.get_rect(center=screen.get_rect().center)
 
         screen.blit(bg_image, bg_rect)
@@ -135,13 +200,11 @@ class SettingsGUI:
         size_setting_index: int = 1
         size_button_index: int = 0
 
-        for size in self.size_buttons_list:
-            if size.interactive_rect.collidepoint(mouse_pos):
-                if self.selected_window_size != size:
-                    self.selected_window_size.selected = False
-                    self.selected_window_size = size
-                    self.selected_window_size.selected = True
-                break
+        size: InteractiveText | None = get_element_at("window_sizes", mouse_pos)
+        if size and self.selected_window_size != size:
+            self.selected_window_size.selected = False
+            self.selected_window_size = size
+            self.selected_window_size.selected = True
 
         for button in self.size_buttons_list:
             button.selected = (button == self.selected_window_size)
@@ -154,12 +217,12 @@ class SettingsGUI:
                     pygame.display.set_mode(settings.screen_size)
                 else:
                     pygame.display.set_mode((0,0), pygame.FULLSCREEN)
-                # Wait 200ms to avoid immediate click registration directly after new window size is set.
-                pygame.time.wait(200)
+                # Drop events queued while the window was recreated, so they aren't handled for the new layout. Events
+                # already drained in this frame are dropped in 'handle_events()' in 'core/event_handlers.py'.
+                pygame.event.clear()
 
-                uisd.ui_registry = initialize_ui_registry(screen)
-                # Update text size of screen elements in settings screen. See method docstring for details.
-                self.update_text_size()
+                self.reinitialize_ui_registry(screen)
+                settings.save_settings()
 
             # Re-assign window size to 'selected_window_size' by comparing 'text' attributes with
             # 'setting[size_button_index]', replacing 'selected_window_size' with equivalent object and set its attribute
@@ -169,6 +232,41 @@ class SettingsGUI:
                 self.selected_window_size = setting[size_button_index]
                 self.selected_window_size.selected = True
 
+    def select_performance_profile(self, screen, profile_button: InteractiveText) -> None:
+        """Selection logic for performance profile. Apply selected profile via 'settings.apply_performance_profile()'
+        and re-initialize dict 'ui_registry', so text and background images of screen elements are rendered with the
+        profile's settings.
+        ARGS:
+            screen: PyGame window.
+            profile_button: clicked profile button from hit-test grid "performance_profiles".
+        """
+        if profile_button == self.selected_profile:
+            return
+
+        for button, profile in self.profile_settings:
+            button.selected = (button == profile_button)
+            if button.selected:
+                self.selected_profile = button
+                settings.apply_performance_profile(profile)
+
+        self.reinitialize_ui_registry(screen)
+        settings.save_settings()
+
+    def reinitialize_ui_registry(self, screen) -> None:
+        """Switch dict 'ui_registry' to the registry for the new window size or performance profile after either changed,
+        and update text of screen elements in settings screen. Registries used before are taken from the cache (see
+        'get_ui_registry()' in 'gui/ui_registry.py'), others are built.
+        ARGS:
+            screen: PyGame window.
+        """
+        uisd.ui_registry = get_ui_registry(screen)
+        # Grids and running animations still reference elements of the previous registry, and grids positions and cell
+        # size of the previous window size and profile.
+        uisd.hit_test_grids.clear()
+        tween_scheduler.clear()
+        # Update text size of screen elements in settings screen. See method docstring for details.
+        self.update_text_size()
+
     def update_text_size(self) -> None:
         """Assign new values to text size attributes in '__init__()', then resize and render text for screen elements in
         settings screen.
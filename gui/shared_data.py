@@ -21,6 +21,20 @@ class UISharedData:
         # Prevents repositioning of screen elements if they've already been placed. Used in most screens—except ones
         # like the ability score screen (gui/gui.py), where elements reuse the same objects but with different values.
         self.position_flag: bool = False
+        # Hit-test grids of selectable elements for positioned screens (see 'gui/hit_test.py').
+        self.hit_test_grids: dict[str, object] = {}
+        # Element under the mouse in the current state's hit-test grids and names of these grids, resolved once per frame
+        # in 'run_frame()' in 'main.py' (see 'update_hovered_element()' in 'gui/hit_test.py').
+        self.hovered_element: object | None = None
+        self.hover_grids: tuple[str, ...] = ()
+        # State of left mouse button, read once per frame in 'run_frame()' in 'main.py' for all screen objects.
+        self.mouse_pressed: bool = False
+        # Time in seconds the last frame took, measured once per frame in 'run_frame()' in 'main.py'. Used for all
+        # time-based behavior, so the UI behaves the same at any frame rate.
+        self.frame_time: float = 0.0
+        # 'True' if something on screen changed in the last frame. Used in dirty-rect mode, see 'is_frame_dirty()' in
+        # 'main.py'.
+        self.last_frame_changed: bool = True
 
         # Y-position maps for race/class text elements.
         self.race_pos_y_dict: dict[str, int] = {}
@@ -35,8 +49,8 @@ class UISharedData:
         # 'True' while user is still picking languages. Turned 'False' when max is reached.
         self.lang_selection_active: bool = True
 
-        # Dice roll animation timer start and state.
-        self.dice_roll_start_time: int = 0
+        # Dice roll animation time in seconds and state.
+        self.dice_roll_time: float = 0.0
         self.dice_roll_complete: bool = False
 
     def reset_position_flag(self) -> None:
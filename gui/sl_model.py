@@ -3,32 +3,20 @@ Class to organize and access save/load screen objects as attributes.
 """
 import os
 import sys
-import json
 
 import pygame
 
 from core.shared_data import shared_data as sd
 from core.settings import settings
+from core.io_worker import io_worker, IOJob
+import core.save_file as save_file
+from core.states import State
 
-from .ui_helpers import draw_screen_title, draw_single_element_background_image, set_elements_pos_y_values
+from .ui_helpers import draw_screen_title, draw_single_element_background_image, set_elements_pos_y_values, \
+    get_scaled_image
 from .screen_objects import TextField, Button, InteractiveText, ProgressBar
 from .shared_data import ui_shared_data as uisd
-
-
-# Constant with data structure for save file.
-DATA = {
-    "slot_00": None,
-    "slot_01": None,
-    "slot_02": None,
-    "slot_03": None,
-    "slot_04": None,
-    "slot_05": None,
-    "slot_06": None,
-    "slot_07": None,
-    "slot_08": None,
-}
-# See 'Settings' instance attribute 'settings.save_file' to change name of the save file if necessary ("characters.sav"
-# by default).
+from .hit_test import set_hit_test_grid
 
 
 class SaveLoadScreen:
@@ -48,8 +36,8 @@ class SaveLoadScreen:
         text_medium: int = ui_registry["text_medium"]
         text_large: int = ui_registry["text_large"]
 
-        # Initialize save file and get file path.
-        self.save_file_path: str = self.init_save_file()
+        # Get save file path. The file itself is created and read on the I/O worker thread (see 'core/io_worker.py').
+        self.save_file_path: str = self.get_save_file_path()
 
         self.load_only: bool = uisd.load_only_flag
 
@@ -92,9 +80,17 @@ class SaveLoadScreen:
             "slot_07": slot_07,
             "slot_08": slot_08,
         }
+        # Reverse lookup of slot IDs for slots resolved via hit-test grid (see 'select_character_slot()' in
+        # 'core/event_handlers.py').
+        self.slot_ids: dict[InteractiveText, str] = {slot: slot_id for slot_id, slot in self.slots.items()}
         # Default text used to format and identify empty slots. ": EMPTY" is unique to the default text attribute for
         # empty slots.
         self.empty_slot: str = ": EMPTY"
+        # Default text for slots while slot summaries are still read from the save file.
+        self.pending_slot: str = ": ..."
+        # Set to 'True' once slot summaries are read and slots are configured. Save, load and delete operations are
+        # ignored until then.
+        self.slots_ready: bool = False
 
         self.configure_character_slots()
 
@@ -120,6 +116,16 @@ class SaveLoadScreen:
         self.loading_bar: ProgressBar = ProgressBar(screen, loading_bar_height, loading_bar_length, 4)
         self.loading_message: TextField = TextField(screen, "Loading Character", text_large,
                                                     text_color=settings.light_text_color)
+        self.saving_message: TextField = TextField(screen, "Saving Character", text_large,
+                                                   text_color=settings.light_text_color)
+        self.deleting_message: TextField = TextField(screen, "Deleting Character", text_large,
+                                                     text_color=settings.light_text_color)
+
+        # Currently running I/O job started by this screen and ID of the slot it is working on.
+        # See 'submit_io_job()' and 'handle_io_job()'.
+        self.io_job: IOJob | None = None
+        self.io_slot_id: str | None = None
+        self.submit_io_job("init_save_file", save_file.init_save_file, self.save_file_path)
 
     def show_sl_screen(self, mouse_pos) -> None:
         """Draw save/load screen elements.
@@ -160,10 +166,18 @@ class SaveLoadScreen:
             else:
                 slot.interactive_rect.top = pos_y_start + pos_y_offset * index
 
+        set_hit_test_grid("save_slots", self.slots.values())
+
+    def on_exit(self) -> None:
+        """Drop hit-test grid of character slots once the save/load screen states are left. Called from
+        'update_screen_lifecycles()' in 'core/state_manager.py', which drops the screen itself afterward as it is created
+        again on every entry."""
+        uisd.hit_test_grids.pop("save_slots", None)
+
     @staticmethod
-    def init_save_file() -> str:
-        """Return full path to the persistent save file and ensure it exists. Create and populate save file with
-        contents of constant 'DATA' if it doesn't.
+    def get_save_file_path() -> str:
+        """Return full path to the persistent save file. The file is created and populated with contents of constant
+        'DATA' in 'core/save_file.py' by I/O job "init_save_file" if it doesn't exist.
         RETURNS:
             file_path
         """
@@ -174,23 +188,88 @@ class SaveLoadScreen:
 
         file_path = os.path.join(base_path, settings.save_file)
 
-        # create the file with default contents if it doesn't exist
-        if not os.path.exists(file_path):
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(DATA, f, indent=4)
-
         return file_path
 
-    def configure_character_slots(self) -> None:
-        """Set rect size and assign text attribute to character slots."""
+    def submit_io_job(self, name: str, func, *args) -> None:
+        """Start I/O job on the worker thread and use its progress as progress source for 'self.loading_bar'. Its
+        result is applied in 'handle_io_job()' once the state machine polls the finished job.
+        ARGS:
+            name: descriptive name of the job.
+            func: function from 'core/save_file.py' to run on the worker thread.
+            args: positional arguments for 'func'.
+        """
+        self.io_job = io_worker.submit(name, func, *args)
+        self.loading_bar.set_progress_source(self.get_io_progress)
+
+    def get_io_progress(self) -> tuple[int, int]:
+        """Return progress of running I/O job. One extra step is added to the total, which is only done once the job's
+        result is applied in 'handle_io_job()'.
+        RETURNS:
+            Tuple '(done, total)'.
+        """
+        if not self.io_job:
+            return 1, 1
+
+        done, total = self.io_job.progress
+        return done, total + 1
+
+    def handle_io_job(self, job: IOJob, state: str) -> str:
+        """Apply result of finished I/O job. Called from 'apply_io_jobs()' in 'core/state_manager.py'
+        for every job polled from the I/O worker.
+        ARGS:
+            job: finished 'IOJob' instance.
+            state: program state.
+        RETURNS:
+            state
+        """
+        if job is not self.io_job:
+            # Job was started by a previous save/load screen instance and is no longer relevant.
+            return state
+
+        self.io_job = None
+
+        if job.error:
+            print(f"Save file error in '{job.name}': {job.error}")
+            if job.name == "init_save_file":
+                return state
+            return State.SAVE_LOAD_SCREEN
+
+        if job.name == "init_save_file":
+            self.configure_character_slots(job.result)
+            self.slots_ready = True
+
+        elif job.name == "load_character":
+            sd.character.deserialize(job.result)
+            uisd.is_loaded = self.io_slot_id
+
+        elif job.name == "save_character":
+            sd.cs_sheet.is_saved = self.io_slot_id
+
+        elif job.name == "delete_character":
+            # Check if deleted character is the currently active character and set its 'is_saved' attribute to 'False' if so.
+            if sd.cs_sheet and self.io_slot_id == sd.cs_sheet.is_saved:
+                sd.cs_sheet.is_saved = False
+
+        return state
+
+    def configure_character_slots(self, summaries: dict | None = None) -> None:
+        """Set rect size and assign text attribute to character slots. Only the slot summaries from the save file's
+        header are used here, full character records are parsed when a character is loaded.
+        ARGS:
+            summaries: dict with slot summaries as returned by I/O job "init_save_file". Default is 'None' to show all
+                slots as pending while the save file is still being read.
+        """
         for slot_id, slot in self.slots.items():
-            with open(self.save_file_path) as f:
-                data = json.load(f)
+            summary: dict | None = summaries[slot_id] if summaries else None
 
-            if data[slot_id]:
+            if not summaries:
+                # Set pending text ('Slot XX: ...') while slot summaries are not available yet.
+                slot_text: list[str] = slot_id.split("_")
+                slot.text = f"{slot_text[0].capitalize()} {slot_text[1]}{self.pending_slot}"
+            elif summary:
                 # Set slot's text attribute if a character is saved at 'slot_id'.
-                slot.text = (f"{data[slot_id]["name"] if data[slot_id]["name"] else "UNNAMED"}: "
-                             f"{data[slot_id]["race_name"]} {data[slot_id]["class_name"]}")
+                slot.text = (f"{summary["name"] if summary["name"] else "UNNAMED"}: "
+                             f"{summary["race_name"]} {summary["class_name"]}")
             else:
                 # Set default string ('Slot XX: EMPTY') if no character is saved at 'slot_id'.
                 slot_text: list[str] = slot_id.split("_")
@@ -203,7 +282,7 @@ class SaveLoadScreen:
         """Position and draw backǵround image for character slots on screen."""
         bg_image_width = self.slots["slot_00"].interactive_rect.width * 1.3
         bg_image_height = self.slots["slot_00"].interactive_rect.height * len(self.slots) * 2
-        bg_image = pygame.transform.scale(uisd.ui_registry["parchment_images"][1], (bg_image_width, bg_image_height))
+        bg_image = get_scaled_image(uisd.ui_registry["parchment_images"][1], bg_image_width, bg_image_height)
         bg_image_rect = bg_image.get_rect(center=self.screen.get_rect().center)
 
         self.screen.blit(bg_image, bg_image_rect)
@@ -227,78 +306,61 @@ class SaveLoadScreen:
             self.selected_slot = (slot_id, slot)
 
     def save_character(self, state: str) -> str:
-        """Check if slot is selected and save created character in JSON file, assign descriptive text to slot's text
-        attribute, and re-initialize screen to display updated slot.
+        """Check if slot is selected and start I/O job to save created character in save file. Screen is re-initialized
+        to display updated slot once the job is finished.
         ARGS:
             state: program state.
         RETURNS:
             state
         """
-        if self.selected_slot:
-            if self.empty_slot in self.selected_slot[1].text or state == "char_overwrite":
-                with open(self.save_file_path) as f:
-                    data = json.load(f)
-
-                    data[self.selected_slot[0]] = sd.character.serialize()
-                    self.selected_slot[1].text = f"{sd.character.name} {sd.character.race_name} {sd.character.class_name}"
-
-                with open(self.save_file_path, "w") as f:
-                    json.dump(data, f)
-                    state = "init_save_load_screen"
-
-                sd.cs_sheet.is_saved = self.selected_slot[0]
+        if self.selected_slot and self.slots_ready:
+            if self.empty_slot in self.selected_slot[1].text or state == State.CHAR_OVERWRITE:
+                self.io_slot_id = self.selected_slot[0]
+                self.submit_io_job("save_character", save_file.write_slot, self.save_file_path, self.io_slot_id,
+                                   sd.character.serialize())
+                state = State.UPDATING_SAVE_FILE
             else:
-                state = "char_overwrite"
+                state = State.CHAR_OVERWRITE
 
         return state
 
     def load_character(self) -> str:
-        """Load stored character from JSON file if valid slot is selected.
+        """Start I/O job to load stored character from save file if valid slot is selected. Character is deserialized in
+        'handle_io_job()' once the job is finished.
         RETURNS:
             program state as string
         """
-        if self.selected_slot and self.empty_slot not in self.selected_slot[1].text:
+        if self.selected_slot and self.slots_ready and self.empty_slot not in self.selected_slot[1].text:
             if uisd.load_only_flag or sd.cs_sheet.is_saved:
-                with open(self.save_file_path) as f:
-                    data = json.load(f)
-                    sd.character.deserialize(data[self.selected_slot[0]])
-                    uisd.is_loaded = self.selected_slot[0]
-                    return "loading_character"
+                self.io_slot_id = self.selected_slot[0]
+                self.submit_io_job("load_character", save_file.read_slot, self.save_file_path, self.io_slot_id)
+                return State.LOADING_CHARACTER
             else:
-                return "char_not_saved"
+                return State.CHAR_NOT_SAVED
 
         # If no valid slot is selected, return to the save/load screen.
-        return "init_save_load_screen"
+        return State.SAVE_LOAD_SCREEN
 
     def delete_character(self, state: str) -> str:
-        """Delete selected character from JSON file and reset file entry to default 'None'.
+        """Start I/O job to delete selected character from save file and reset file entry to default 'None'.
         ARGS:
             state: program state.
         RETURN:
             state
         """
-        if state == "char_delete":
-            # Check if deleted character is the currently active character and set its 'is_saved' attribute to 'False' if so.
-            if sd.cs_sheet:
-                if self.selected_slot[0] == sd.cs_sheet.is_saved:
-                    sd.cs_sheet.is_saved = False
-
-            with open(self.save_file_path) as f:
-                data = json.load(f)
-                data[self.selected_slot[0]] = None
-
-            with open(self.save_file_path, "w") as f:
-                json.dump(data, f)
+        if state == State.CHAR_DELETE:
+            self.io_slot_id = self.selected_slot[0]
+            self.submit_io_job("delete_character", save_file.write_slot, self.save_file_path, self.io_slot_id, None)
 
             self.selected_slot: bool = False
 
-            state = "init_save_load_screen"
+            state = State.UPDATING_SAVE_FILE
 
-        elif self.selected_slot:
+        elif self.selected_slot and self.slots_ready:
             if self.empty_slot in self.selected_slot[1].text:  #type: ignore  # calm down pycharm, I checked it!
-                state = "init_save_load_screen"
+                state = State.SAVE_LOAD_SCREEN
             else:
-                state = "char_delete"
+                state = State.CHAR_DELETE
 
         return state
 
@@ -330,13 +392,13 @@ class SaveLoadScreen:
         for button in self.confirm_buttons_group:
             button.button_rect.bottomright = uisd.ui_registry["off_screen_pos"]
 
-        if state == "char_not_saved":
+        if state == State.CHAR_NOT_SAVED:
             self.confirm_proceed_button.button_rect.top = button_top
             self.confirm_proceed_button.button_rect.right = button_right
-        elif state == "char_delete":
+        elif state == State.CHAR_DELETE:
             self.confirm_delete_button.button_rect.top = button_top
             self.confirm_delete_button.button_rect.right = button_right
-        elif state == "char_overwrite":
+        elif state == State.CHAR_OVERWRITE:
             self.confirm_overwrite_button.button_rect.top = button_top
             self.confirm_overwrite_button.button_rect.right = button_right
 
@@ -350,11 +412,11 @@ class SaveLoadScreen:
         """
         confirm: TextField = self.confirmation_message
 
-        if state == "char_not_saved":
+        if state == State.CHAR_NOT_SAVED:
             confirm.text = self.not_saved_message
-        elif state == "char_delete":
+        elif state == State.CHAR_DELETE:
             confirm.text = self.delete_message
-        elif state == "char_overwrite":
+        elif state == State.CHAR_OVERWRITE:
             confirm.text = self.overwrite_message
 
         confirm.render_new_text_surface()
@@ -362,11 +424,26 @@ class SaveLoadScreen:
 
     def show_loading_character_screen(self) -> None:
         """Show screen with progress bar when loading character."""
+        self.show_io_progress_screen(self.loading_message)
+
+    def show_updating_save_file_screen(self) -> None:
+        """Show screen with progress bar when saving or deleting character."""
+        if self.io_job and self.io_job.name == "delete_character":
+            self.show_io_progress_screen(self.deleting_message)
+        else:
+            self.show_io_progress_screen(self.saving_message)
+
+    def show_io_progress_screen(self, message: TextField) -> None:
+        """Show screen with progress bar for running I/O job. The bar only fills up completely once the job's result is
+        applied in 'handle_io_job()' (see 'get_io_progress()').
+        ARGS:
+            message: 'TextField' instance shown on top of progress bar.
+        """
         if not uisd.position_flag:
             self.loading_bar.container_rect.centery = self.screen.get_rect().centery
-            self.loading_message.text_rect.center = self.loading_bar.container_rect.center
+            message.text_rect.center = self.loading_bar.container_rect.center
 
             uisd.position_flag = True
 
         self.loading_bar.draw_progress_bar()
-        self.loading_message.draw_text()
+        message.draw_text()
@@ -0,0 +1,181 @@
+"""
+Tween scheduler for time-based animations.
+
+Animations (sliding info panels, hover fades of buttons and interactive text fields, scrolling credits) change an
+attribute of a screen object from its current value to an end value over a duration in seconds. They are started via
+'tween_scheduler.start()' and advanced once per frame from 'run_frame()' in 'main.py' with the measured frame time, so
+they take the same time at any frame rate. Only running tweens are advanced, finished ones are dropped right away.
+'tween_scheduler.is_idle()' tells if any animation is running at all.
+
+Only instance of class 'TweenScheduler', 'tween_scheduler', is created at the bottom of this module.
+"""
+import math
+from typing import Any, Callable
+
+
+# Maximum time step in seconds for a single frame. Longer frames (i.e. while the window is dragged) would otherwise let
+# animations and timers skip to their end. Also applied to 'ui_shared_data.frame_time' in 'run_frame()' in 'main.py'.
+MAX_TIME_STEP: float = 0.1
+
+
+"""Easing functions. Take progress of a tween between 0 and 1 and return eased progress."""
+
+def linear(t: float) -> float:
+    """Constant speed."""
+    return t
+
+
+def ease_in_quad(t: float) -> float:
+    """Start slow, then speed up."""
+    return t * t
+
+
+def ease_out_quad(t: float) -> float:
+    """Start fast, then slow down."""
+    return 1 - (1 - t) ** 2
+
+
+def ease_out_cubic(t: float) -> float:
+    """Start fast, then slow down more strongly than 'ease_out_quad()'."""
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_sine(t: float) -> float:
+    """Start and end slow."""
+    return -(math.cos(math.pi * t) - 1) / 2
+
+
+class Tween:
+    """Single animation of a numeric attribute."""
+
+    def __init__(self, target: Any, attr: str, start: int | float, end: int | float, duration: float,
+                 easing: Callable[[float], float] = linear, on_complete: Callable | None = None) -> None:
+        """Initialize tween.
+        ARGS:
+            target: object whose attribute is animated, i.e. a 'TextField' instance or a 'pygame.Rect'.
+            attr: name of animated attribute.
+            start: start value.
+            end: end value. Values are rounded to int if both 'start' and 'end' are int.
+            duration: duration in seconds.
+            easing: easing function. Default is 'linear'.
+            on_complete: optional function without arguments called once the tween is finished. Default is 'None'.
+        """
+        self.target: Any = target
+        self.attr: str = attr
+        self.start: int | float = start
+        self.end: int | float = end
+        self.duration: float = duration
+        self.easing: Callable[[float], float] = easing
+        self.on_complete: Callable | None = on_complete
+
+        self.elapsed: float = 0.0
+        self.round_values: bool = isinstance(start, int) and isinstance(end, int)
+
+    def update(self, dt: float) -> bool:
+        """Advance tween by 'dt' seconds and set the target's attribute to the new value.
+        ARGS:
+            dt: time step in seconds.
+        RETURNS:
+            'True' if tween is finished, else 'False'.
+        """
+        self.elapsed = min(self.elapsed + dt, self.duration)
+        progress: float = self.elapsed / self.duration if self.duration > 0 else 1.0
+
+        value: int | float = self.start + (self.end - self.start) * self.easing(progress)
+        if self.round_values:
+            value = round(value)
+        setattr(self.target, self.attr, value)
+
+        return progress >= 1
+
+
+class TweenScheduler:
+    """Store and advance running tweens. Each attribute of an object is animated by at most one tween at a time."""
+
+    def __init__(self) -> None:
+        """Initialize scheduler."""
+        # Dict with tuples of target ID and attribute name as keys and 'Tween' instances as values. Tweens keep their
+        # target alive, so IDs aren't reused while a tween is running.
+        self.tweens: dict[tuple[int, str], Tween] = {}
+
+    def start(self, target: Any, attr: str, end: int | float, duration: float,
+              easing: Callable[[float], float] = linear, on_complete: Callable | None = None) -> Tween | None:
+        """Start animating 'attr' of 'target' from its current value to 'end'. A running tween for the same attribute is
+        kept if it already heads to 'end', so the method can be called every frame while an animation is wanted, and
+        replaced otherwise (i.e. when a fade-in is reversed halfway).
+        ARGS:
+            target: object whose attribute is animated.
+            attr: name of animated attribute.
+            end: end value.
+            duration: duration in seconds.
+            easing: easing function. Default is 'linear'.
+            on_complete: optional function without arguments called once the tween is finished. Default is 'None'.
+        RETURNS:
+            running 'Tween' instance, or 'None' if attribute already has value 'end'.
+        """
+        key: tuple[int, str] = (id(target), attr)
+        tween: Tween | None = self.tweens.get(key)
+
+        if tween and tween.end == end:
+            return tween
+
+        start: int | float = getattr(target, attr)
+        if start == end:
+            self.tweens.pop(key, None)
+            return None
+
+        tween = Tween(target, attr, start, end, duration, easing, on_complete)
+        self.tweens[key] = tween
+
+        return tween
+
+    def cancel(self, target: Any, attr: str) -> None:
+        """Stop animating 'attr' of 'target'. The attribute keeps its current value.
+        ARGS:
+            target: object whose attribute is animated.
+            attr: name of animated attribute.
+        """
+        self.tweens.pop((id(target), attr), None)
+
+    def is_running(self, target: Any, attr: str) -> bool:
+        """Check if 'attr' of 'target' is currently animated.
+        ARGS:
+            target: object whose attribute is animated.
+            attr: name of animated attribute.
+        RETURNS:
+            'True' if a tween is running, else 'False'.
+        """
+        return (id(target), attr) in self.tweens
+
+    def update(self, dt: float) -> None:
+        """Advance all running tweens by 'dt' seconds and drop finished ones. Called once per frame from 'run_frame()'
+        in 'main.py'.
+        ARGS:
+            dt: time since last frame in seconds. Capped at 'MAX_TIME_STEP'.
+        """
+        dt = min(dt, MAX_TIME_STEP)
+
+        for key, tween in tuple(self.tweens.items()):
+            # Skip tweens cancelled or replaced by 'on_complete' of another tween during this update.
+            if self.tweens.get(key) is not tween:
+                continue
+
+            if tween.update(dt):
+                # Drop tween before calling 'on_complete', which may start a new tween for the same attribute.
+                del self.tweens[key]
+                if tween.on_complete:
+                    tween.on_complete()
+
+    def is_idle(self) -> bool:
+        """Check if no animation is running.
+        RETURNS:
+            'True' if there are no running tweens, else 'False'.
+        """
+        return not self.tweens
+
+    def clear(self) -> None:
+        """Stop all running tweens, i.e. when screen objects are replaced after a window size change."""
+        self.tweens.clear()
+
+
+tween_scheduler: TweenScheduler = TweenScheduler()
@@ -1,15 +1,15 @@
 """
 Background functions for GUI, i.e. value build/retrieval and object positioning functions for pygame screens.
 """
-import time
-
 import pygame
 
 from core.rules import roll_starting_money
+from core.settings import settings
 from core.shared_data import shared_data as sd
 
-from .screen_objects import TextField, Button, InteractiveText, TextInputField
+from .screen_objects import TextField, Button, InteractiveText, TextInputField, scale_image
 from .shared_data import ui_shared_data as uisd
+from .hit_test import set_hit_test_grid
 
 
 """General functions."""
@@ -122,6 +122,31 @@ def show_info_panels(elements: list | tuple, mouse_pos) -> None:
 
 """Functions for element background images."""
 
+def get_scaled_image(image: pygame.Surface, width: float | int, height: float | int) -> pygame.Surface:
+    """Return 'image' scaled to given size. Scaled images are kept in 'ui_registry["scaled_images"]', so images drawn
+    with the same size every frame are only scaled once. The cache is reset with the UI registry when the screen size
+    changes and holds up to 'settings.scaled_image_cache_size' images, least recently used ones are dropped first.
+    ARGS:
+        image: art asset surface from 'ui_registry'.
+        width: float/int for image width.
+        height: float/int for image height.
+    RETURNS:
+        scaled image surface.
+    """
+    cache: dict[tuple[pygame.Surface, int, int], pygame.Surface] = uisd.ui_registry["scaled_images"]
+    key: tuple[pygame.Surface, int, int] = (image, int(width), int(height))
+
+    # Re-insert cached image to mark it as most recently used.
+    scaled_image: pygame.Surface | None = cache.pop(key, None)
+    if scaled_image is None:
+        scaled_image = scale_image(image, (width, height))
+        while cache and len(cache) >= settings.scaled_image_cache_size:
+            del cache[next(iter(cache))]
+    cache[key] = scaled_image
+
+    return scaled_image
+
+
 def draw_image(screen, image_type: str, width: float | int, height: float | int, center: tuple[int, int] = (0,0),
                parchment: int = 0) -> None:
     """Load, scale, position and draw image on screen.
@@ -146,7 +171,7 @@ def draw_image(screen, image_type: str, width: float | int, height: float | int,
     elif image_type == "parchment":
         image = uisd.ui_registry["parchment_images"][parchment]
 
-    image_loaded = pygame.transform.scale(image, (width, height))
+    image_loaded = get_scaled_image(image, width, height)
     image_rect = image_loaded.get_rect(center=center)
 
     screen.blit(image_loaded, image_rect)
@@ -574,7 +599,7 @@ def draw_abilities_background(screen, abilities_array: tuple[tuple[object, list[
     image_width = screen_rect.width / 1.8
     image_height = ability_field_height * image_height_multiplier
 
-    image_loaded = pygame.transform.scale(image, (image_width, image_height))
+    image_loaded = get_scaled_image(image, image_width, image_height)
     image_rect = image_loaded.get_rect(centerx=screen_rect.centerx)
 
     # Set image y-position based on number of abilities in 'abilities_array' to assure background is properly centered.
@@ -693,6 +718,7 @@ def position_race_class_elements(screen, active_races: tuple[InteractiveText, ..
             else:
                 cls.text_rect.centerx, cls.text_rect.centery = class_x_pos, uisd.class_pos_y_dict[cls.text]
 
+        set_hit_test_grid("race_class_options", uisd.rc_options["races"] + uisd.rc_options["classes"])
         uisd.position_flag = True
 
 
@@ -743,6 +769,7 @@ def position_spell_selection_screen_elements(screen, spells: tuple[InteractiveTe
             else:
                 spell.interactive_rect.centery = pos_y_start + pos_y_offset * index
 
+        set_hit_test_grid("spell_fields", spells)
         uisd.position_flag = True
 
 
@@ -805,6 +832,7 @@ def position_language_selection_screen_elements(screen, languages: tuple[Interac
                 inactive_language.text_rect.centerx = screen.get_rect().centerx
                 inactive_language.text_rect.centery = uisd.lang_pos_y_dict[inactive_language.text]
 
+        set_hit_test_grid("lang_fields", languages)
         uisd.position_flag = True
 
 
@@ -842,7 +870,7 @@ def build_and_position_prompt(screen, naming_prompt: TextField) -> None:
     if not uisd.position_flag:
         # Add naming prompt to 'naming_prompt.text' attribute and render text_rect.
         naming_prompt.text = f"Name your {sd.character.race_name} {sd.character.class_name}"
-        naming_prompt.text_surface = naming_prompt.font.render(naming_prompt.text, True, naming_prompt.text_color)
+        naming_prompt.text_surface = naming_prompt.font.render(naming_prompt.text, settings.antialias, naming_prompt.text_color)
         naming_prompt.text_rect = naming_prompt.text_surface.get_rect()
 
         naming_prompt.text_rect.centerx, naming_prompt.text_rect.centery = screen.get_rect().centerx, screen.get_rect().centery / 1.3
@@ -888,11 +916,11 @@ def choose_money_option(choices: list[Button], mouse_pos) -> None:
     random_money: pygame.Rect = choices[0].button_rect
     custom_money: pygame.Rect = choices[1].button_rect
 
-    if pygame.mouse.get_pressed()[0]:
+    if uisd.mouse_pressed:
         if random_money.collidepoint(mouse_pos):
             sd.random_money_flag, sd.custom_money_flag = True, False
-            # Set dice roll timer.
-            uisd.dice_roll_start_time = time.time()
+            # Reset dice roll timer.
+            uisd.dice_roll_time = 0.0
         if custom_money.collidepoint(mouse_pos):
             sd.random_money_flag, sd.custom_money_flag = False, True
 
@@ -921,7 +949,8 @@ def draw_chosen_money_option(screen) -> None:
         draw_image(screen, "parchment", image_width, image_height, center=image_center, parchment=2)
 
         # Check timer to allow for dice roll effect.
-        if time.time() - uisd.dice_roll_start_time < dice_roll_duration:
+        if uisd.dice_roll_time < dice_roll_duration:
+            uisd.dice_roll_time += uisd.frame_time
             rolling_dice_money_field.draw_text()
             # Generate random int value for 'starting_money'.
             sd.starting_money = roll_starting_money()
@@ -930,8 +959,6 @@ def draw_chosen_money_option(screen) -> None:
         else:
             random_money_field.draw_text()
             starting_money_dice_roll(screen, random_money_field, text_large, rolling=False)
-            # Reset global dice roll timer. Not strictly necessary, but better safe than sorry.
-            uisd.dice_roll_start_time = 0
             uisd.dice_roll_complete = True
 
     elif sd.custom_money_flag:
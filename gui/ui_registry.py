@@ -8,16 +8,47 @@ from core.settings import settings
 
 from descr import abilities, races, classes, spells
 
+from .asset_atlas import ATLAS_ASSETS, TITLE_SCREEN_IMAGES, load_images
 from .screen_objects import Button, TextField, ProgressBar, InfoPanel, InteractiveText, TextInputField
 
 
-def initialize_ui_registry(screen) -> dict:
+# Cache for UI registries of previously used window sizes, see 'get_ui_registry()'.
+ui_registry_cache: dict[tuple[tuple[int, int], str | None], dict] = {}
+
+
+def get_ui_registry(screen, preload: bool = False) -> dict:
+    """Return UI registry for the current window size and performance profile. Registries are built once via
+    'initialize_ui_registry()' and kept in 'ui_registry_cache' with their rendered text and scaled images, so switching
+    back to a previously used window size doesn't build and render everything again. The cache holds up to
+    'settings.ui_registry_cache_size' registries including the active one, least recently used ones are dropped first.
+    ARGS:
+        screen: PyGame window.
+        preload: see 'initialize_ui_registry()'. Only used if the registry has to be built. Default is 'False'.
+    RETURNS:
+        ui_registry
+    """
+    key: tuple[tuple[int, int], str | None] = (screen.get_size(), settings.performance_profile)
+
+    # Re-insert cached registry to mark it as most recently used.
+    ui_registry: dict | None = ui_registry_cache.pop(key, None)
+    if ui_registry is None:
+        # Drop old registries first, so they can be released before the new one is built.
+        while ui_registry_cache and len(ui_registry_cache) >= settings.ui_registry_cache_size:
+            del ui_registry_cache[next(iter(ui_registry_cache))]
+        ui_registry = initialize_ui_registry(screen, preload)
+    ui_registry_cache[key] = ui_registry
+
+    return ui_registry
+
+
+def initialize_ui_registry(screen, preload: bool = False) -> dict:
     """Initialize instances of classes from 'screen_objects.py' for use in GUI in addition to default size and spacing
     values for automatic scalability of screen objects. Return dict of instances 'ui_registry'.
     NOTE: Instances created have to be then added manually to dict 'ui_registry'!
     Function is first called from function 'initialize_character_creator()' in 'main.py' with the returned dict being
     stored in instance 'ui_shared_data' of class 'UISharedData', from where it can be accessed when necessary.
-    'initialize_ui_registry()' needs to be called again if changes to screen size (i.e. in settings screen) are made.
+    'initialize_ui_registry()' needs to be called again if changes to screen size (i.e. in settings screen) are made. Use
+    'get_ui_registry()' for that, which reuses registries built for a window size before.
 
 
     Class overview (imported from 'screen_objects.py'):
@@ -44,9 +75,10 @@ def initialize_ui_registry(screen) -> dict:
         NOTE 2: For details on the required 'pygame_textinput' instance creation see its documentation.
 
     ProgressBar(screen, height, length, time=5)
-        Visual-only loading progress bar.
-        NOTE: This class creates a progress bar that 'simulates' loading without reflecting actual data processing or task
-        completion. It is purely for visual effect to enhance the user experience.
+        Loading progress bar.
+        NOTE: By default, this class creates a progress bar that 'simulates' loading. Progress bars for real tasks (i.e.
+        asset preloading on the title screen, see 'gui/preload.py') get their progress source via method
+        'set_progress_source()'.
 
 
     Art Asset/image implementation:
@@ -56,10 +88,14 @@ def initialize_ui_registry(screen) -> dict:
         'enter_your_image_here' has to be added to and retrieved from 'Settings' instance 'settings'.
         Example:
         background_image = pygame.transform.scale(pygame.image.load(settings.bg_image).convert(), (screen_width, screen_height))
+        NOTE: Default images are added to 'ATLAS_ASSETS' in 'gui/asset_atlas.py' instead, so they are baked into the
+        pre-scaled atlases and loaded via 'load_images()'.
 
 
     ARGS:
         screen: PyGame window.
+        preload: if 'True', only images for the title screen are loaded, further art assets are 'None' until they are
+            added by 'preload_assets()' in 'gui/preload.py' while the title screen is shown. Default is 'False'.
     RETURNS:
         gui_elements: dict containing screen objects and important size values.
     """
@@ -121,23 +157,10 @@ def initialize_ui_registry(screen) -> dict:
     class_descr = classes.get_class_descr()
     spell_descr = spells.get_spell_descr()
 
-    # Art assets.
-    path_bg_image: str = settings.get_resource_path("gui/art/background.png")
-    path_bg_title_image: str = settings.get_resource_path("gui/art/title_background.png")
-    path_wood_image: str = settings.get_resource_path("gui/art/wood.png")
-    path_wood_ornate_image: str = settings.get_resource_path("gui/art/wood_ornate.png")
-    path_parchment_01: str = settings.get_resource_path("gui/art/parchment01.png")
-    path_parchment_02: str = settings.get_resource_path("gui/art/parchment02.png")
-    path_parchment_03: str = settings.get_resource_path("gui/art/parchment03.png")
-    path_parchment_list: tuple[str, ...] = (path_parchment_01, path_parchment_02, path_parchment_03)
-    # Background images are scaled to screen size, further images are scaled when used in functions.
-    background_image = pygame.transform.scale(pygame.image.load(path_bg_image).convert(), (screen_width, screen_height))
-    title_background_image = pygame.transform.scale(pygame.image.load(path_bg_title_image).convert(), (screen_width, screen_height))
-    wood_image = pygame.image.load(path_wood_image)
-    wood_ornate_image = pygame.image.load(path_wood_ornate_image)
-    parchment_image_00 = pygame.image.load(path_parchment_list[0])
-    parchment_image_01 = pygame.image.load(path_parchment_list[1])
-    parchment_image_02 = pygame.image.load(path_parchment_list[2])
+    # Art assets. Loaded from the pre-scaled atlas for the current screen size if available, else from image files (see
+    # 'gui/asset_atlas.py'). Background images come in screen size, further images are scaled when used in functions.
+    images: dict[str, pygame.Surface] = load_images((screen_width, screen_height),
+                                                    TITLE_SCREEN_IMAGES if preload else tuple(ATLAS_ASSETS))
 
 
     # Title screen.
@@ -372,7 +395,8 @@ def initialize_ui_registry(screen) -> dict:
     character_naming_prompt: TextField = TextField(screen, "", text_large)
     # 'pygame_textinput' and 'TextInputField' instances.
     character_input_font: pygame.font.Font = pygame.font.Font(settings.font, text_medium)
-    character_name_input: pygame_textinput.TextInputVisualizer = pygame_textinput.TextInputVisualizer(font_object=character_input_font)
+    character_name_input: pygame_textinput.TextInputVisualizer = pygame_textinput.TextInputVisualizer(font_object=character_input_font,
+                                                                                                      antialias=settings.antialias)
     character_name_field: TextInputField = TextInputField(screen, character_name_input, int(screen_width/2))
 
 
@@ -389,7 +413,8 @@ def initialize_ui_registry(screen) -> dict:
     # 'pygame_textinput' and 'TextInputField' instances.
     money_input_prompt: TextField = TextField(screen, "Enter amount of gold for your character", text_medium)
     money_input_font: pygame.font.Font = pygame.font.Font(settings.font, text_medium)
-    money_amount_input: pygame_textinput.TextInputVisualizer = pygame_textinput.TextInputVisualizer(font_object=money_input_font)
+    money_amount_input: pygame_textinput.TextInputVisualizer = pygame_textinput.TextInputVisualizer(font_object=money_input_font,
+                                                                                                    antialias=settings.antialias)
     money_amount_field: TextInputField = TextInputField(screen, money_amount_input, int(screen_width / 4))
 
 
@@ -443,11 +468,9 @@ def initialize_ui_registry(screen) -> dict:
         # Off-Screen position for special uses.
         "off_screen_pos": off_screen_position,
         # Art assets.
-        "background_image": background_image,
-        "title_background_image": title_background_image,
-        "wood_image": wood_image,
-        "wood_ornate_image": wood_ornate_image,
-        "parchment_images": (parchment_image_00, parchment_image_01, parchment_image_02),
+        **get_art_asset_entries(images),
+        # Cache for art assets scaled to element sizes (see 'get_scaled_image()' in 'gui/ui_helpers.py').
+        "scaled_images": {},
 
         # Title screen.
         "title_screen_fields": (title, subtitle, copyright_notice, title_progress_bar, continue_to_main_menu),
@@ -504,3 +527,20 @@ def initialize_ui_registry(screen) -> dict:
     }
 
     return ui_registry
+
+
+def get_art_asset_entries(images: dict[str, pygame.Surface]) -> dict:
+    """Return 'ui_registry' entries for art assets. Images missing in 'images' are set to 'None'.
+    ARGS:
+        images: dict with image names from 'ATLAS_ASSETS' in 'gui/asset_atlas.py' as keys and image surfaces as values.
+    RETURNS:
+        dict with 'ui_registry' keys and images.
+    """
+    return {
+        "background_image": images.get("background_image"),
+        "title_background_image": images.get("title_background_image"),
+        "wood_image": images.get("wood_image"),
+        "wood_ornate_image": images.get("wood_ornate_image"),
+        "parchment_images": (images.get("parchment_image_00"), images.get("parchment_image_01"),
+                             images.get("parchment_image_02")),
+    }
@@ -2,70 +2,133 @@
 Main module for the 'Basic Fantasy RPG Character Creator'. This module serves as the entry point for the application.
 It initializes the program and starts the main functionality.
 """
+from typing import Callable
+
 import pygame
 
 import core.state_manager as sm
+import core.event_handlers as eh
+from core.states import State, INITIAL_STATE
 from core.settings import settings
+from core.metrics import frame_metrics
+from core.profiling import state_profiler
 
 from gui.shared_data import ui_shared_data as uisd
-from gui.ui_registry import initialize_ui_registry
-
-
-# Program states.
-INITIAL_STATE: str = "title_screen"
-MAIN_STATES: set[str] = {INITIAL_STATE, "pre_main_menu", "main_menu", "settings_screen", "init_credits", "credits",
-                         "character_menu"}
-SAVE_LOAD_STATES: set[str] = {"init_save_load_screen", "save_load_screen", "char_not_saved", "char_delete",
-                              "char_overwrite", "loading_character"}
-CUSTOM_CHARACTER_STATES: set[str] = {"set_abilities", "show_abilities", "race_class_selection", "name_character",
-                                     "spell_selection", "language_selection", "select_starting_money",
-                                     "custom_input_money", "confirm_character", "create_character_sheet",
-                                     "creation_complete"}
-RANDOM_CHARACTER_STATES: set[str] = {"random_character", "set_random_money", "name_random_character",
-                                     "create_random_character_sheet"}
-CHARACTER_SHEET_STATES: set[str] = {"init_character_sheet", "character_sheet", "sheet_confirmation"}
+from gui.ui_registry import get_ui_registry
+from gui.preload import preload_assets
+from gui.hit_test import update_hovered_element
+from gui.debug_overlay import debug_overlay
+from gui.tween import tween_scheduler, MAX_TIME_STEP
 
 
 def initialize_character_creator() -> tuple[pygame.Surface, pygame.time.Clock]:
     """Initialize Pygame, settings, screen, and GUI elements."""
     pygame.init()
     settings.set_default()
+    # Saved window size is applied before the window is created, so the UI registry is built for it right away.
+    settings.load_settings()
     clock = pygame.time.Clock()
-    screen = pygame.display.set_mode(settings.screen_size, pygame.DOUBLEBUF | pygame.HWSURFACE)
+    if settings.screen_size:
+        screen = pygame.display.set_mode(settings.screen_size, pygame.DOUBLEBUF | pygame.HWSURFACE)
+    else:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE)
     pygame.display.set_caption("Basic Fantasy RPG Character Creator")
-    uisd.ui_registry = initialize_ui_registry(screen)
+    # Only the title screen is ready at this point. Remaining assets are loaded while the title screen is shown, with its
+    # progress bar showing the actual loading progress (see 'gui/preload.py').
+    uisd.ui_registry = get_ui_registry(screen, preload=True)
+    uisd.ui_registry["title_screen_fields"][3].set_progress_source(preload_assets(screen))
+
+    if settings.debug_overlay:
+        frame_metrics.enable()
+    state_profiler.configure()
 
     return screen, clock
 
 
+def run_frame(screen, clock: pygame.time.Clock, state: State) -> State:
+    """Run a single frame of the main loop.
+    ARGS:
+        screen: PyGame window.
+        clock: pygame clock.
+        state: program state.
+    RETURNS:
+        state
+    """
+    # Events are drained once per frame and dispatched by the state handlers (see 'core/event_handlers.py').
+    eh.drain_events()
+    mouse_pos = pygame.mouse.get_pos()
+    uisd.mouse_pressed = pygame.mouse.get_pressed()[0]
+    # Option under the mouse is resolved once per frame for all screen objects (see 'gui/hit_test.py').
+    update_hovered_element(eh.OPTION_GRIDS.get(state, ()), mouse_pos)
+    debug_overlay.handle_keys()
+    # Advance running animations by the time the last frame took (see 'gui/tween.py').
+    uisd.frame_time = min(clock.get_time() / 1000, MAX_TIME_STEP)
+    tween_scheduler.update(uisd.frame_time)
+    # In dirty-rect mode the last drawn frame stays on screen if nothing has changed. Checked every frame, so the result
+    # is up to date when the mode is switched on.
+    if not is_frame_dirty(state) and settings.dirty_rects:
+        clock.tick(settings.frame_rate)
+        return state
+
+    if frame_metrics.enabled:
+        frame_metrics.start_frame(state)
+    if state_profiler.enabled:
+        state_profiler.start_frame(state)
+
+    # Display background image based on program state.
+    bg_image = uisd.ui_registry["title_background_image"] if state == State.TITLE_SCREEN else uisd.ui_registry["background_image"]
+    screen.blit(bg_image, (0, 0))
+
+    # Handler for program state from state graph (see 'STATE_GRAPH' in 'core/state_manager.py').
+    state_handler: Callable = sm.STATE_HANDLERS[state]
+
+    if frame_metrics.enabled:
+        frame_metrics.start_state_manager(state_handler.__name__)
+        next_state = state_handler(screen, state, mouse_pos)
+        frame_metrics.end_state_manager()
+    else:
+        next_state = state_handler(screen, state, mouse_pos)
+
+    if next_state != state:
+        state = sm.change_state(screen, state, next_state)
+
+    if frame_metrics.enabled:
+        frame_metrics.end_frame()
+        debug_overlay.draw(screen, clock)
+
+    pygame.display.flip()
+    if state_profiler.enabled:
+        state_profiler.end_frame(screen)
+    clock.tick(settings.frame_rate)
+
+    return state
+
+
+def is_frame_dirty(state: State) -> bool:
+    """Check if a frame has to be drawn in dirty-rect mode (see 'settings.dirty_rects'). A frame changes if events were
+    drained, animations are running, frame metrics or profiling are active, or 'state' isn't one of 'STATIC_STATES' in
+    'core/state_manager.py'. Changed frames and the frame after them are drawn, so results of state changes and finished
+    animations are shown as well.
+    ARGS:
+        state: program state.
+    RETURNS:
+        'True' if frame has to be drawn, else 'False'.
+    """
+    changed: bool = (bool(eh.frame_events) or not tween_scheduler.is_idle() or frame_metrics.enabled
+                     or state_profiler.enabled or state not in sm.STATIC_STATES)
+    dirty: bool = changed or uisd.last_frame_changed
+    uisd.last_frame_changed = changed
+
+    return dirty
+
+
 def run_character_creator() -> None:
     """Start the character creator."""
     screen, clock = initialize_character_creator()
     state = INITIAL_STATE
 
     while True:
-        mouse_pos = pygame.mouse.get_pos()
-
-        # Display background image based on program state.
-        bg_image = uisd.ui_registry["title_background_image"] if state == "title_screen" else uisd.ui_registry["background_image"]
-        screen.blit(bg_image, (0, 0))
-
-        # Main states.
-        if state in MAIN_STATES:
-            state = sm.main_state_manager(screen, state, mouse_pos)
-        elif state in SAVE_LOAD_STATES:
-            state = sm.save_load_screen_state_manager(screen, state, mouse_pos)
-
-        # Character creation states.
-        elif state in CUSTOM_CHARACTER_STATES:
-            state = sm.custom_character_state_manager(screen, state, mouse_pos)
-        elif state in RANDOM_CHARACTER_STATES:
-            state = sm.random_character_state_manager(screen, state, mouse_pos)
-        elif state in CHARACTER_SHEET_STATES:
-            state = sm.character_sheet_state_manager(screen, state, mouse_pos)
-
-        pygame.display.flip()
-        clock.tick(settings.frame_rate)
+        state = run_frame(screen, clock, state)
 
 
 if __name__ == "__main__":